@@ -0,0 +1,249 @@
+"""Benchmarks for the RTD parser and the export pipeline.
+
+Measures, for each sport:
+
+    framing           DakSerial.read() splitting a byte stream into frames
+    update            Daktronics.update() applying one frame
+    getitem           dak[field] for one field
+    extract           Daktronics.extract() of every field
+    pipeline          apply + changed_fields + merge_fields, per frame
+    has_data_changed  comparing two snapshots of every field
+    format_json / format_xml / format_vmix_xml / format_csv
+                      rendering a snapshot of every field
+    text_files        Text Files output of a snapshot with one changed field
+
+The traffic is synthetic (daktronics.synth) with a fixed seed, so runs are
+comparable. Results are written as JSON. Pass an earlier result as
+``--baseline`` to get a comparison, and a non-zero exit status if anything
+got slower than ``--threshold``::
+
+    python benchmarks/bench_pipeline.py --output before.json
+    ... change the code ...
+    python benchmarks/bench_pipeline.py --output after.json --baseline before.json
+
+Use ``--sport`` and ``--filter`` to run a subset.
+"""
+
+import argparse
+import atexit
+import io
+import itertools
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from daktronics import DakFramer, DakSerial, Daktronics  # noqa: E402
+from daktronics.sports import SPORT_LAYOUTS  # noqa: E402
+from daktronics.synth import DakSynth  # noqa: E402
+import scoreboard_outputs as outputs  # noqa: E402
+from scoreboard_boards import merge_fields  # noqa: E402
+
+FRAMES = 2000
+
+
+class _Stream(io.BytesIO):
+    """In-memory stand-in for a serial port."""
+
+    @property
+    def in_waiting(self):
+        return len(self.getbuffer()) - self.tell()
+
+
+class _Frames(object):
+    """Transport that returns the same frames over and over."""
+
+    def __init__(self, frames):
+        self.read = itertools.cycle(frames).__next__
+
+
+def traffic(sport):
+    synth = DakSynth(sport, rate=100, churn=0.5, burst=4, refresh=5, seed=1)
+    return [frame for _, frame in synth.frames(count=FRAMES)]
+
+
+def snapshot(sport, frames):
+    dak = Daktronics(sport, None)
+    for frame in frames:
+        dak.apply(frame)
+    data = merge_fields(dak, {}, list(dak.slices)) or {}
+    return dak, data
+
+
+def sport_benchmarks(sport):
+    """Yield ``(name, function, operations per call)`` for one sport."""
+    frames = traffic(sport)
+    stream = b''.join(frames)
+
+    serial_port = DakSerial.__new__(DakSerial)
+
+    def framing():
+        serial_port.data = _Stream(stream)
+        serial_port.framer = DakFramer()
+        read = serial_port.read
+        for _ in range(len(frames)):
+            read()
+    yield 'framing', framing, len(frames)
+
+    dak = Daktronics(sport, _Frames(frames))
+    update = dak.update
+
+    def updates():
+        for _ in range(len(frames)):
+            update()
+    yield 'update', updates, len(frames)
+
+    dak, data = snapshot(sport, frames)
+    fields = list(dak.slices)
+
+    def getitem():
+        for field in fields:
+            dak[field]
+    yield 'getitem', getitem, len(fields)
+
+    yield 'extract', lambda: dak.extract(fields), 1
+
+    pipe = Daktronics(sport, None)
+    active = set(fields)
+    state = {'data': {}}
+
+    def pipeline():
+        current = state['data']
+        apply = pipe.apply
+        for frame in frames:
+            apply(frame)
+            changed = pipe.changed_fields()
+            if changed:
+                current = merge_fields(pipe, current, changed & active, fields) or current
+        state['data'] = current
+    yield 'pipeline', pipeline, len(frames)
+
+    previous = dict(data)
+    if previous:
+        # Same keys, one value different: the comparison has to look at everything
+        key = next(reversed(previous))
+        previous[key] = previous[key] + 'x'
+    yield 'has_data_changed', lambda: outputs.has_data_changed(previous, data), 1
+
+    yield 'format_json', lambda: outputs.format_as_json(data), 1
+    yield 'format_xml', lambda: outputs.format_as_xml(data), 1
+    yield 'format_vmix_xml', lambda: outputs.format_as_vmix_xml(data), 1
+    yield 'format_csv', lambda: outputs.format_as_csv(data), 1
+
+    if data:
+        text_dir = tempfile.mkdtemp(prefix='bench_text_files_')
+        atexit.register(shutil.rmtree, text_dir, True)
+        text_files = outputs.TextFilesWriter()
+        text_files.write(text_dir, data)
+        key = next(iter(data))
+        ticks = itertools.count()
+
+        def write_text_files():
+            text_files.write(text_dir, dict(data, **{key: str(next(ticks))}))
+        yield 'text_files', write_text_files, 1
+
+
+def measure(function, operations, repeat=5, min_time=0.05):
+    """Return best and median nanoseconds per operation."""
+    timer = timeit.Timer(function)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    times = sorted(timer.repeat(repeat, number))
+    scale = 1e9 / number / operations
+    return {'best_ns': times[0] * scale, 'median_ns': times[len(times) // 2] * scale,
+            'operations': operations, 'calls': number, 'repeat': repeat}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sports, name_filter=None, repeat=5):
+    results = {}
+    for sport in sports:
+        for name, function, operations in sport_benchmarks(sport):
+            key = f"{name}/{sport}"
+            if name_filter and name_filter not in key:
+                continue
+            try:
+                results[key] = measure(function, operations, repeat)
+            except Exception as e:
+                # Recorded, so a fix shows up as a new result rather than a crash
+                results[key] = {'error': f"{type(e).__name__}: {e}"}
+                print(f"{key:40} failed: {results[key]['error']}", flush=True)
+                continue
+            print(f"{key:40} {results[key]['median_ns']:12.1f} ns/op", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print the change against ``baseline`` and return the keys that regressed."""
+    regressions = []
+    print(f"\n{'benchmark':40} {'baseline':>12} {'now':>12} {'change':>8}")
+    for key, result in results.items():
+        old = baseline.get(key)
+        if old is None or 'median_ns' not in old or 'median_ns' not in result:
+            continue
+        change = result['median_ns'] / old['median_ns'] - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(key)
+            flag = '  REGRESSION'
+        print(f"{key:40} {old['median_ns']:12.1f} {result['median_ns']:12.1f} {change:+8.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    single_board = sorted(name for name, layout in SPORT_LAYOUTS.items() if not isinstance(layout, dict))
+    parser = argparse.ArgumentParser(description="Benchmark the RTD parser and export pipeline")
+    parser.add_argument('--sport', action='append', choices=single_board,
+                        help="sport to run (repeatable, default: all)")
+    parser.add_argument('--filter', help="only run benchmarks whose name contains this")
+    parser.add_argument('--repeat', type=int, default=5, help="timing rounds (default: 5)")
+    parser.add_argument('--output', help="write results to this JSON file")
+    parser.add_argument('--baseline', help="JSON results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="slowdown that counts as a regression (default: 0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    results = run(args.sport or single_board, args.filter, args.repeat)
+    report = {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'system': platform.system(),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
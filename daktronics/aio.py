@@ -0,0 +1,297 @@
+"""asyncio transports for Daktronics RTD feeds.
+
+The blocking ``DakSerial`` and ``DakUDP`` need a thread each. Here the serial
+port and the multicast socket are read by protocols on an event loop. They
+hand every frame straight to a ``Daktronics`` parser, so one loop can service
+any number of boards::
+
+    feed = await open_udp_feed('basketball')
+    async for changed in feed:
+        print(feed.dak.extract(changed))
+
+Frames are applied as they arrive. The board keeps only the latest state,
+so a slow consumer gets the merged changes on its next iteration and
+nothing queues up.
+"""
+
+import asyncio
+import sys
+import time
+
+import serial
+
+from . import DakFramer, Daktronics, multicast_socket
+from .capture import DakReplay
+
+
+class DakFeed(object):
+    """Async iterator over a ``Daktronics`` parser fed by an asyncio transport.
+
+    Each iteration waits for frames and yields the set of fields they changed.
+    Iteration ends when the transport closes, and re-raises its error if
+    there was one. Set ``capture`` to a ``capture.CaptureWriter`` to record
+    every frame as it arrives.
+    """
+
+    def __init__(self, dak):
+        self.dak = dak
+        self.capture = None
+        self.transport = None
+        self.closed = False
+        self.error = None
+        self.ready = asyncio.Event()
+
+    def feed_frame(self, frame):
+        if self.capture is not None:
+            self.capture.write(frame)
+        if self.dak.stats is None:
+            self.dak.apply(frame)
+        else:
+            self.dak.apply_all((frame,))
+        if self.dak.dirty:
+            self.ready.set()
+
+    def connection_lost(self, exc=None):
+        self.closed = True
+        self.error = exc
+        self.ready.set()
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+        self.connection_lost()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            await self.ready.wait()
+            if not self.closed:
+                self.ready.clear()
+            if self.dak.stats is None:
+                changed = self.dak.changed_fields()
+            else:
+                start = time.perf_counter_ns()
+                changed = self.dak.changed_fields()
+                self.dak.stats.record('change_detection', time.perf_counter_ns() - start)
+            if changed:
+                return changed
+            if self.closed:
+                if self.error is not None:
+                    raise self.error
+                raise StopAsyncIteration
+
+
+class DakStreamProtocol(asyncio.Protocol):
+    """Splits a byte stream (serial port, TCP) into frames for a ``DakFeed``."""
+
+    def __init__(self, feed):
+        self.feed = feed
+        self.framer = DakFramer()
+
+    def connection_made(self, transport):
+        self.feed.transport = transport
+
+    def data_received(self, data):
+        self.framer.stats = self.feed.dak.stats
+        self.framer.feed(data)
+        for frame in self.framer.frames():
+            self.feed.feed_frame(frame)
+
+    def eof_received(self):
+        return False
+
+    def connection_lost(self, exc):
+        self.feed.connection_lost(exc)
+
+
+class DakDatagramProtocol(asyncio.DatagramProtocol):
+    """Hands each RTD multicast datagram to a ``DakFeed``."""
+
+    def __init__(self, feed):
+        self.feed = feed
+
+    def connection_made(self, transport):
+        self.feed.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.feed.feed_frame(data)
+
+    def error_received(self, exc):
+        pass
+
+    def connection_lost(self, exc):
+        self.feed.connection_lost(exc)
+
+
+class _ThreadedSerialTransport(asyncio.BaseTransport):
+    """Fallback for event loops that cannot watch a serial handle (Windows).
+
+    Blocking reads run in the loop's default executor and results are passed
+    back to the protocol on the loop.
+    """
+
+    def __init__(self, loop, port, protocol):
+        super().__init__()
+        self.port = port
+        self.protocol = protocol
+        self.closing = False
+        self.task = loop.create_task(self.run(loop))
+
+    async def run(self, loop):
+        self.protocol.connection_made(self)
+        exc = None
+        try:
+            while not self.closing:
+                data = await loop.run_in_executor(None, self.read)
+                if data:
+                    self.protocol.data_received(data)
+        except Exception as e:
+            exc = e
+        self.protocol.connection_lost(None if self.closing else exc)
+
+    def read(self):
+        return self.port.read(self.port.in_waiting or 1)
+
+    def is_closing(self):
+        return self.closing
+
+    def close(self):
+        self.closing = True
+        self.port.close()
+
+
+class _ReplayTransport(asyncio.BaseTransport):
+    """Plays a ``DakReplay`` into a ``DakFeed`` on the event loop."""
+
+    def __init__(self, loop, replay, feed):
+        super().__init__()
+        self.replay = replay
+        self.feed = feed
+        self.closing = False
+        feed.transport = self
+        self.task = loop.create_task(self.run())
+
+    async def run(self):
+        replay = self.replay
+        while not self.closing:
+            record = replay.next_record()
+            if record is None:
+                break
+            delay = replay.delay(record[0])
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif not replay.frames % 64:
+                # Running behind or flat out: let consumers have the loop now and then
+                await asyncio.sleep(0)
+            self.feed.feed_frame(replay.take())
+        self.feed.connection_lost(None)
+
+    def is_closing(self):
+        return self.closing
+
+    def close(self):
+        self.closing = True
+        self.task.cancel()
+        self.replay.close()
+
+
+class DakTCPFeed(DakFeed):
+    """``DakFeed`` from a serial device server over raw TCP.
+
+    The connection is re-established with exponential backoff whenever it
+    drops; iteration only ends when the feed is closed.
+    """
+
+    def __init__(self, dak, host, port, backoff=0.5, max_backoff=30):
+        super().__init__(dak)
+        self.address = (host, port)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.lost = None
+        self.task = asyncio.get_running_loop().create_task(self.run())
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        delay = self.backoff
+        while not self.closed:
+            self.lost = loop.create_future()
+            try:
+                await loop.create_connection(lambda: DakStreamProtocol(self), *self.address)
+            except OSError:
+                self.lost.set_result(None)
+            else:
+                delay = self.backoff
+                await self.lost
+            self.transport = None
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_backoff)
+
+    def connection_lost(self, exc=None):
+        # Only this connection is gone; run() will open the next one
+        if self.lost is not None and not self.lost.done():
+            self.lost.set_result(exc)
+
+    def close(self):
+        self.task.cancel()
+        if self.transport is not None:
+            self.transport.close()
+        DakFeed.connection_lost(self)
+
+
+async def open_serial_feed(sport, port, verify_checksum=False, baudrate=19200):
+    """Open ``port`` (a device name or ``serial.Serial``) and return a ``DakFeed``.
+
+    On POSIX the tty's file descriptor is watched by the event loop
+    directly. On Windows, or for a port without a file descriptor, reads
+    run on the loop's executor instead. The choice is made up front: the
+    Windows Proactor loop accepts a serial port in connect_read_pipe() and
+    only fails once it starts reading.
+    """
+    loop = asyncio.get_running_loop()
+    if not isinstance(port, serial.Serial):
+        port = serial.Serial(port, baudrate=baudrate, timeout=1)
+    feed = DakFeed(Daktronics(sport, None, verify_checksum=verify_checksum))
+    if _has_fileno(port):
+        await loop.connect_read_pipe(lambda: DakStreamProtocol(feed), port)
+    else:
+        _ThreadedSerialTransport(loop, port, DakStreamProtocol(feed))
+    return feed
+
+
+def _has_fileno(port):
+    """True if the event loop can watch ``port`` itself."""
+    if sys.platform == 'win32':
+        return False
+    try:
+        port.fileno()
+    except (OSError, AttributeError, ValueError):
+        return False
+    return True
+
+
+async def open_udp_feed(sport, port=21000, verify_checksum=False, interface='', rcvbuf=1 << 20):
+    """Join the RTD multicast group on ``port`` and return a ``DakFeed``."""
+    loop = asyncio.get_running_loop()
+    feed = DakFeed(Daktronics(sport, None, verify_checksum=verify_checksum))
+    await loop.create_datagram_endpoint(lambda: DakDatagramProtocol(feed),
+                                        sock=multicast_socket(port, interface, rcvbuf))
+    return feed
+
+
+async def open_tcp_feed(sport, host, port, verify_checksum=False, backoff=0.5, max_backoff=30):
+    """Return a ``DakTCPFeed`` reading the console from ``host:port``."""
+    return DakTCPFeed(Daktronics(sport, None, verify_checksum=verify_checksum),
+                      host, port, backoff, max_backoff)
+
+
+async def open_replay_feed(sport, path, speed=1.0, verify_checksum=False):
+    """Return a ``DakFeed`` playing the capture at ``path``; see ``capture.DakReplay``.
+
+    Iteration ends when the capture has been played through.
+    """
+    loop = asyncio.get_running_loop()
+    feed = DakFeed(Daktronics(sport, None, verify_checksum=verify_checksum))
+    _ReplayTransport(loop, DakReplay(path, speed), feed)
+    return feed
@@ -0,0 +1,252 @@
+"""Record raw RTD frames to disk and read them back.
+
+A capture file starts with a 24 byte header, followed by one record per frame::
+
+    header:  b'DAKCAP01', uint64 wall clock at start (ns since the epoch),
+             uint64 monotonic clock at start (ns)
+    record:  uint64 monotonic timestamp (ns), uint32 length, frame bytes
+
+All integers are little endian. Timestamps come from ``time.monotonic_ns()``,
+so the gaps between frames are exact even if the system clock is adjusted.
+The header lets a reader map them back to wall clock time.
+
+Wrap any transport to record a game while it is being processed, and play
+it back later through ``DakReplay`` in place of the real transport::
+
+    dak = Daktronics('basketball', DakRecorder(DakUDP(), 'game.dakcap'))
+    dak = Daktronics('basketball', DakReplay('game.dakcap', speed=100))
+"""
+
+import os
+import struct
+import time
+
+CAPTURE_MAGIC = b'DAKCAP01'
+
+_header = struct.Struct('<8sQQ')
+_record = struct.Struct('<QI')
+
+
+class CaptureWriter(object):
+    """Buffered, append-only writer for capture files.
+
+    Records are packed into the file object's buffer, so writing one costs
+    about as much as a memcpy. The disk is only touched when ``buffering``
+    bytes have built up. Once a file passes ``max_bytes`` it is renamed to
+    ``path.1``, older files shift up to ``path.<backups>``, and a new file
+    is started. An existing capture at ``path`` is rotated away the same way
+    rather than appended to, so every file holds a single session.
+    """
+
+    def __init__(self, path, max_bytes=64 << 20, backups=5, buffering=1 << 16):
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.buffering = buffering
+        self.file = None
+        self.size = 0
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            self.shift()
+        self.open()
+
+    def open(self):
+        self.file = open(self.path, 'wb', buffering=self.buffering)
+        self.file.write(_header.pack(CAPTURE_MAGIC, time.time_ns(), time.monotonic_ns()))
+        self.size = _header.size
+
+    def shift(self):
+        if not self.backups:
+            os.remove(self.path)
+            return
+        for i in range(self.backups - 1, 0, -1):
+            older = f"{self.path}.{i}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def rotate(self):
+        self.file.close()
+        self.shift()
+        self.open()
+
+    def write(self, frame, timestamp=None):
+        if timestamp is None:
+            timestamp = time.monotonic_ns()
+        file = self.file
+        file.write(_record.pack(timestamp, len(frame)))
+        file.write(frame)
+        self.size += _record.size + len(frame)
+        if self.max_bytes and self.size >= self.max_bytes:
+            self.rotate()
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def read_capture(path):
+    """Return an iterator of ``(timestamp_ns, frame)`` for every record in a capture file.
+
+    Raises ValueError straight away if ``path`` is not a capture. A record
+    cut short at the end of the file (the recorder was killed mid-write) is
+    ignored.
+    """
+    f = open(path, 'rb')
+    header = f.read(_header.size)
+    if len(header) < _header.size or not header.startswith(CAPTURE_MAGIC):
+        f.close()
+        raise ValueError(f"{path} is not a Daktronics capture file")
+    return _records(f)
+
+
+def _records(f):
+    with f:
+        while True:
+            record = f.read(_record.size)
+            if len(record) < _record.size:
+                return
+            timestamp, size = _record.unpack(record)
+            frame = f.read(size)
+            if len(frame) < size:
+                return
+            yield timestamp, frame
+
+
+class DakRecorder(object):
+    """Transport wrapper that tees every frame it returns into a capture file.
+
+    Takes any ``DakSerial``/``DakUDP``/``DakTCP``-like transport and a path
+    (or an open ``CaptureWriter``). Frames are passed through unchanged.
+    """
+
+    def __init__(self, dakrtd, capture, **kwargs):
+        self.dakrtd = dakrtd
+        self.capture = capture if isinstance(capture, CaptureWriter) else CaptureWriter(capture, **kwargs)
+        # Daktronics.update_many() looks for read_all(), so only offer it
+        # when the wrapped transport has one
+        if hasattr(dakrtd, 'read_all'):
+            self.read_all = self._read_all
+
+    def read(self):
+        frame = self.dakrtd.read()
+        self.capture.write(frame)
+        return frame
+
+    def _read_all(self, wait=False):
+        frames = self.dakrtd.read_all(wait)
+        if frames:
+            # One clock read per batch; these all arrived together
+            timestamp = time.monotonic_ns()
+            write = self.capture.write
+            for frame in frames:
+                write(frame, timestamp)
+        return frames
+
+    def close(self):
+        close = getattr(self.dakrtd, 'close', None)
+        if close:
+            close()
+        self.capture.close()
+
+
+class DakReplay(object):
+    """Transport that plays a capture file back with its original timing.
+
+    ``speed`` scales the recorded gaps: 1 is real time, 100 plays a game a
+    hundred times faster, and 0 plays as fast as possible. Frames are
+    scheduled against the start of playback rather than the previous frame,
+    so sleep overshoot does not add up over a long capture. With ``loop``
+    the capture starts over when it ends; otherwise ``finished`` is set and
+    the transport goes quiet.
+    """
+
+    def __init__(self, path, speed=1.0, loop=False, timeout=1, batch=1024):
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+        self.timeout = timeout
+        self.batch = batch
+        self.finished = False
+        self.frames = 0
+        self.records = read_capture(path)
+        self.pending = None
+        self.start = None
+        self.origin = 0
+        self.offset = 0
+        self.last = 0
+
+    def next_record(self):
+        """Return the next ``(timestamp, frame)``, None once the capture is done."""
+        if self.pending is None:
+            for timestamp, frame in self.records:
+                self.pending = (timestamp + self.offset, frame)
+                break
+            else:
+                if not self.loop or not self.frames:
+                    self.finished = True
+                    return None
+                # Start over, keeping the schedule running forward
+                self.records = read_capture(self.path)
+                timestamp, frame = next(self.records)
+                self.offset = self.last - timestamp + 1
+                self.pending = (timestamp + self.offset, frame)
+        if self.start is None:
+            self.start = time.monotonic_ns()
+            self.origin = self.pending[0]
+        return self.pending
+
+    def delay(self, timestamp):
+        """Seconds until ``timestamp`` is due, zero or less when it already is."""
+        if not self.speed:
+            return 0
+        due = self.start + (timestamp - self.origin) / self.speed
+        return (due - time.monotonic_ns()) / 1e9
+
+    def take(self):
+        timestamp, frame = self.pending
+        self.pending = None
+        self.last = timestamp
+        self.frames += 1
+        return frame
+
+    def read(self):
+        """Return the next frame once it is due. Raises EOFError at the end."""
+        record = self.next_record()
+        if record is None:
+            raise EOFError(f"end of capture {self.path}")
+        delay = self.delay(record[0])
+        if delay > 0:
+            time.sleep(delay)
+        return self.take()
+
+    def read_all(self, wait=False):
+        """Return every frame that is due, up to ``batch`` of them.
+
+        With ``wait`` an idle replay sleeps until the next frame is due (at
+        most ``timeout`` seconds), like a quiet serial line.
+        """
+        frames = []
+        while len(frames) < self.batch:
+            record = self.next_record()
+            if record is None:
+                if wait and not frames:
+                    time.sleep(self.timeout)
+                break
+            delay = self.delay(record[0])
+            if delay > 0:
+                if frames or not wait:
+                    break
+                if delay > self.timeout:
+                    time.sleep(self.timeout)
+                    break
+                time.sleep(delay)
+            frames.append(self.take())
+        return frames
+
+    def close(self):
+        self.records.close()
+        self.finished = True
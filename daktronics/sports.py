@@ -0,0 +1,1918 @@
+# MIT License
+#
+# Copyright (c) 2016 Alex Riviere
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Field layouts for every Daktronics RTD sport, kept as plain tuples so nothing
+# but constants is created at import. Each sport is
+#     (board size, ((field name, start, length), ...))
+# with 1-based start offsets as in the Daktronics RTD documentation. Sports
+# with several console modes (event counter) map mode names to layouts.
+
+SPORT_LAYOUTS = {
+    'auto racing': (947, (
+        ('Main Clock Time (mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (mm:ss.t)', 6, 8),
+        ('Main Clock/Time Out/TOD (mm:ss/ss.t)', 14, 5),
+        ('Main Clock/Time Out/TOD (mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Period', 142, 2),
+        ('Period Text', 144, 4),
+        ('Period Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Current Driver Name', 201, 12),
+        ('Current Lap #', 213, 5),
+        ('Current Car #', 218, 3),
+        ('Current Position', 221, 2),
+        ('Current Speed', 223, 7),
+        ('Current Lap Time (hh:mm:ss.dcm)', 230, 12),
+        ('Current Lap #/Lap Time/Black Flag', 242, 12),
+        ('Lap Indicator', 254, 1),
+        ('Time Indicator', 255, 1),
+        ('Black Flag Indicator', 256, 1),
+        ('Black Flag Car #', 257, 3),
+        ('Red Status', 260, 1),
+        ('Yellow Status', 261, 1),
+        ('Green Status', 262, 1),
+        ('Current Running Time (hh:mm:ss.dcm)', 263, 12),
+        ('Best Lap Time (hh:mm:ss.dcm)', 275, 12),
+        ('Position 1 Car #', 287, 3),
+        ('Position 2 Car #', 290, 3),
+        ('Position 3 Car #', 293, 3),
+        ('Position 4 Car #', 296, 3),
+        ('Position 5 Car #', 299, 3),
+        ('Position 6 Car #', 302, 3),
+        ('Position 7 Car #', 305, 3),
+        ('Position 8 Car #', 308, 3),
+        ('Position 9 Car #', 311, 3),
+        ('Position 10 Car #', 314, 3),
+        ('Position 11 Car #', 317, 3),
+        ('Position 12 Car #', 320, 3),
+        ('Position 13 Car #', 323, 3),
+        ('Position 14 Car #', 326, 3),
+        ('Position 15 Car #', 329, 3),
+        ('Position 16 Car #', 332, 3),
+        ('Position 17 Car #', 335, 3),
+        ('Position 18 Car #', 338, 3),
+        ('Position 19 Car #', 341, 3),
+        ('Position 20 Car #', 344, 3),
+        ('Position 21 Car #', 347, 3),
+        ('Position 22 Car #', 350, 3),
+        ('Position 23 Car #', 353, 3),
+        ('Position 24 Car #', 356, 3),
+        ('Position 25 Car #', 359, 3),
+        ('Position 26 Car #', 362, 3),
+        ('Position 27 Car #', 365, 3),
+        ('Position 28 Car #', 368, 3),
+        ('Position 29 Car #', 371, 3),
+        ('Position 30 Car #', 374, 3),
+        ('Position 31 Car #', 377, 3),
+        ('Position 32 Car #', 380, 3),
+        ('Position 33 Car #', 383, 3),
+        ('Position 34 Car #', 386, 3),
+        ('Position 35 Car #', 389, 3),
+        ('Position 36 Car #', 392, 3),
+        ('Position 37 Car #', 395, 3),
+        ('Position 38 Car #', 398, 3),
+        ('Position 39 Car #', 401, 3),
+        ('Position 40 Car #', 404, 3),
+        ('Position 41 Car #', 407, 3),
+        ('Position 42 Car #', 410, 3),
+        ('Position 43 Car #', 413, 3),
+        ('Position 44 Car #', 416, 3),
+        ('Position 45 Car #', 419, 3),
+        ('Reserved for Future Positions', 422, 45),
+        ('Position 1 Pos #', 467, 2),
+        ('Position 1 Lap #', 469, 5),
+        ('Position 1 Time (hh:mm:ss.dcm)', 474, 12),
+        ('Position 1 Speed', 486, 7),
+        ('Position 1 Driver Name', 493, 12),
+        ('Position 2 Pos #', 505, 2),
+        ('Position 2 Lap #', 507, 5),
+        ('Position 2 Time (hh:mm:ss.dcm)', 512, 12),
+        ('Position 2 Speed', 524, 7),
+        ('Position 2 Driver Name', 531, 12),
+        ('Position 3 Pos #', 543, 2),
+        ('Position 3 Lap #', 545, 5),
+        ('Position 3 Time (hh:mm:ss.dcm)', 550, 12),
+        ('Position 3 Speed', 562, 7),
+        ('Position 3 Driver Name', 569, 12),
+        ('Position 4 Pos #', 581, 2),
+        ('Position 4 Lap #', 583, 5),
+        ('Position 4 Time (hh:mm:ss.dcm)', 588, 12),
+        ('Position 4 Speed', 600, 7),
+        ('Position 4 Driver Name', 607, 12),
+        ('Position 5 Pos #', 619, 2),
+        ('Position 5 Lap #', 621, 5),
+        ('Position 5 Time (hh:mm:ss.dcm)', 626, 12),
+        ('Position 5 Speed', 638, 7),
+        ('Position 5 Driver Name', 645, 12),
+        ('Position 6 Pos #', 657, 2),
+        ('Position 6 Lap #', 659, 5),
+        ('Position 6 Time (hh:mm:ss.dcm)', 664, 12),
+        ('Position 6 Speed', 676, 7),
+        ('Position 6 Driver Name', 683, 12),
+        ('Position 7 Pos #', 695, 2),
+        ('Position 7 Lap #', 697, 5),
+        ('Position 7 Time (hh:mm:ss.dcm)', 702, 12),
+        ('Position 7 Speed', 714, 7),
+        ('Position 7 Driver Name', 721, 12),
+        ('Position 8 Pos #', 733, 2),
+        ('Position 8 Lap #', 735, 5),
+        ('Position 8 Time (hh:mm:ss.dcm)', 740, 12),
+        ('Position 8 Speed', 752, 7),
+        ('Position 8 Driver Name', 759, 12),
+        ('Position 9 Pos #', 771, 2),
+        ('Position 9 Lap #', 773, 5),
+        ('Position 9 Time (hh:mm:ss.dcm)', 778, 12),
+        ('Position 9 Speed', 790, 7),
+        ('Position 9 Driver Name', 797, 12),
+        ('Position 10 Pos #', 809, 2),
+        ('Position 10 Lap #', 811, 5),
+        ('Position 10 Time (hh:mm:ss.dcm)', 816, 12),
+        ('Position 10 Speed', 828, 7),
+        ('Position 10 Driver Name', 835, 12),
+        ('Position 11 Pos #', 847, 2),
+        ('Position 11 Lap #', 849, 5),
+        ('Position 11 Time (hh:mm:ss.dcm)', 854, 12),
+        ('Position 11 Speed', 866, 7),
+        ('Position 11 Driver Name', 873, 12),
+        ('Position 12 Pos #', 885, 2),
+        ('Position 12 Lap #', 887, 5),
+        ('Position 12 Time (hh:mm:ss.dcm)', 892, 12),
+        ('Position 12 Speed', 904, 7),
+        ('Position 12 Driver Name', 911, 12),
+        ('Variable #1 Pos #', 923, 2),
+        ('Variable #1 Car #', 925, 3),
+        ('Variable #2 Pos #', 928, 2),
+        ('Variable #2 Car #', 930, 3),
+        ('Variable #3 Pos #', 933, 2),
+        ('Variable #3 Car #', 935, 3),
+        ('Variable #4 Pos #', 938, 2),
+        ('Variable #4 Car #', 940, 3),
+        ('Variable #5 Pos #', 943, 2),
+        ('Variable #5 Car #', 945, 3),
+    )),
+    'baseball': (343, (
+        ('Main Clock Time (hh:mm/mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (hh:mm:ss/mm:ss.t)', 6, 8),
+        ('Main/Time Out/TOD (hh:mm/mm:ss/ss.t)', 14, 5),
+        ('Main/Time Out/TOD (hh:mm:ss/mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time', 32, 8),
+        ('Time of Day', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Inning', 142, 2),
+        ('Inning Text', 144, 4),
+        ('Inning Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Home At Bat Indicator', 201, 1),
+        ('Guest At Bat Indicator', 202, 1),
+        ('Home Hits', 203, 2),
+        ('Home Errors', 205, 2),
+        ('Home Left on Base', 207, 2),
+        ('Guest Hits', 209, 2),
+        ('Guest Errors', 211, 2),
+        ('Guest Left on Base', 213, 2),
+        ('Batter Number', 215, 2),
+        ('Batter Average', 217, 5),
+        ('Ball', 222, 1),
+        ('Strike', 223, 1),
+        ('Out', 224, 1),
+        ('Hit Indicator', 225, 1),
+        ('Error Indicator', 226, 1),
+        ('Hit/Error Text', 227, 5),
+        ('Error Position', 232, 2),
+        ('Inning Label - #1', 234, 2),
+        ('Inning Label - #2', 236, 2),
+        ('Inning Label - #3', 238, 2),
+        ('Inning Label - #4', 240, 2),
+        ('Inning Label - #5', 242, 2),
+        ('Inning Label - #6', 244, 2),
+        ('Inning Label - #7', 246, 2),
+        ('Inning Label - #8', 248, 2),
+        ('Inning Label - #9', 250, 2),
+        ('Inning Label - #10', 252, 2),
+        ('Inning Label - #11', 254, 2),
+        ('Inning Label - #12', 256, 2),
+        ('Home Inning Score - #1', 258, 2),
+        ('Home Inning Score - #2', 260, 2),
+        ('Home Inning Score - #3', 262, 2),
+        ('Home Inning Score - #4', 264, 2),
+        ('Home Inning Score - #5', 266, 2),
+        ('Home Inning Score - #6', 268, 2),
+        ('Home Inning Score - #7', 270, 2),
+        ('Home Inning Score - #8', 272, 2),
+        ('Home Inning Score - #9', 274, 2),
+        ('Home Inning Score - #10', 276, 2),
+        ('Home Inning Score - #11', 278, 2),
+        ('Home Inning Score - #12', 280, 2),
+        ('Guest Inning Score - #1', 282, 2),
+        ('Guest Inning Score - #2', 284, 2),
+        ('Guest Inning Score - #3', 286, 2),
+        ('Guest Inning Score - #4', 288, 2),
+        ('Guest Inning Score - #5', 290, 2),
+        ('Guest Inning Score - #6', 292, 2),
+        ('Guest Inning Score - #7', 294, 2),
+        ('Guest Inning Score - #8', 296, 2),
+        ('Guest Inning Score - #9', 298, 2),
+        ('Guest Inning Score - #10', 300, 2),
+        ('Guest Inning Score - #11', 302, 2),
+        ('Guest Inning Score - #12', 304, 2),
+        ('Home Pitcher Number', 306, 2),
+        ('Home Pitches Thrown - Balls', 308, 3),
+        ('Home Pitches Thrown - Strikes', 311, 3),
+        ('Home Pitches Thrown - Foul Ball', 314, 3),
+        ('Home Pitches Thrown - In Play', 317, 3),
+        ('Home Pitches Thrown - Total', 320, 3),
+        ('Guest Pitcher Number', 323, 2),
+        ('Guest Pitches Thrown - Balls', 325, 3),
+        ('Guest Pitches Thrown - Strikes', 328, 3),
+        ('Guest Pitches Thrown - Foul Ball', 331, 3),
+        ('Guest Pitches Thrown - In Play', 334, 3),
+        ('Guest Pitches Thrown - Total', 337, 3),
+        ('Main Clock Time (hh/mm/ss)', 340, 2),
+        ('At Bat or Main Clock Time (hh/mm/ss)', 342, 2),
+    )),
+    'basketball': (645, (
+        ('Main Clock Time (mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (mm:ss.t)', 6, 8),
+        ('Main Clock/Time Out/TOD (mm:ss/ss.t)', 14, 5),
+        ('Main Clock/Time Out/TOD (mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Period', 142, 2),
+        ('Period Text', 144, 4),
+        ('Period Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Shot Clock Time (mm:ss)', 201, 8),
+        ('Shot Clock Horn', 209, 1),
+        ('Home Possession Indicator', 210, 1),
+        ('Home Possession Arrow', 211, 1),
+        ('Home Possession Text', 212, 4),
+        ('Guest Possession Indicator', 216, 1),
+        ('Guest Possession Arrow', 217, 1),
+        ('Guest Possession Text', 218, 4),
+        ('Home 1-on-1 Bonus Indicator', 222, 1),
+        ('Home 2-shot Bonus Indicator', 223, 1),
+        ('Home Bonus Text', 224, 5),
+        ('Guest 1-on-1 Bonus Indicator', 229, 1),
+        ('Guest 2-shot Bonus Indicator', 230, 1),
+        ('Guest Bonus Text', 231, 5),
+        ('Home Team Fouls', 236, 2),
+        ('Guest Team Fouls', 238, 2),
+        ('Home Player-Foul-Points', 240, 8),
+        ('Guest Player-Foul-Points', 248, 8),
+        ('Player-Foul', 256, 3),
+        ('Player-Foul-Points', 259, 5),
+        ('Home Score - Period 1', 264, 2),
+        ('Home Score - Period 2', 266, 2),
+        ('Home Score - Period 3', 268, 2),
+        ('Home Score - Period 4', 270, 2),
+        ('Home Score - Period 5', 272, 2),
+        ('Home Score - Period 6', 274, 2),
+        ('Home Score - Period 7', 276, 2),
+        ('Home Score - Period 8', 278, 2),
+        ('Home Score - Period 9', 280, 2),
+        ('Home Score - Current Period', 282, 2),
+        ('Guest Score - Period 1', 284, 2),
+        ('Guest Score - Period 2', 286, 2),
+        ('Guest Score - Period 3', 288, 2),
+        ('Guest Score - Period 4', 290, 2),
+        ('Guest Score - Period 5', 292, 2),
+        ('Guest Score - Period 6', 294, 2),
+        ('Guest Score - Period 7', 296, 2),
+        ('Guest Score - Period 8', 298, 2),
+        ('Guest Score - Period 9', 300, 2),
+        ('Guest Score - Current Period', 302, 2),
+        ('Home In-game Plyr 1-Status', 304, 1),
+        ('Home In-game Plyr 1-Number', 305, 2),
+        ('Home In-game Plyr 1-Fouls', 307, 2),
+        ('Home In-game Plyr 1-Points', 309, 2),
+        ('Home In-game Plyr 2-Status', 311, 1),
+        ('Home In-game Plyr 2-Number', 312, 2),
+        ('Home In-game Plyr 2-Fouls', 314, 2),
+        ('Home In-game Plyr 2-Points', 316, 2),
+        ('Home In-game Plyr 3-Status', 318, 1),
+        ('Home In-game Plyr 3-Number', 319, 2),
+        ('Home In-game Plyr 3-Fouls', 321, 2),
+        ('Home In-game Plyr 3-Points', 323, 2),
+        ('Home In-game Plyr 4-Status', 325, 1),
+        ('Home In-game Plyr 4-Number', 326, 2),
+        ('Home In-game Plyr 4-Fouls', 328, 2),
+        ('Home In-game Plyr 4-Points', 330, 2),
+        ('Home In-game Plyr 5-Status', 332, 1),
+        ('Home In-game Plyr 5-Number', 333, 2),
+        ('Home In-game Plyr 5-Fouls', 335, 2),
+        ('Home In-game Plyr 5-Points', 337, 2),
+        ('Reserved - Home In-game Plyr 6', 339, 7),
+        ('Home Roster Plyr 1-Status', 346, 1),
+        ('Home Roster Plyr 1-Number', 347, 2),
+        ('Home Roster Plyr 1-Fouls', 349, 2),
+        ('Home Roster Plyr 1-Points', 351, 2),
+        ('Home Roster Plyr 2-Status', 353, 1),
+        ('Home Roster Plyr 2-Number', 354, 2),
+        ('Home Roster Plyr 2-Fouls', 356, 2),
+        ('Home Roster Plyr 2-Points', 358, 2),
+        ('Home Roster Plyr 3-Status', 360, 1),
+        ('Home Roster Plyr 3-Number', 361, 2),
+        ('Home Roster Plyr 3-Fouls', 363, 2),
+        ('Home Roster Plyr 3-Points', 365, 2),
+        ('Home Roster Plyr 4-Status', 367, 1),
+        ('Home Roster Plyr 4-Number', 368, 2),
+        ('Home Roster Plyr 4-Fouls', 370, 2),
+        ('Home Roster Plyr 4-Points', 372, 2),
+        ('Home Roster Plyr 5-Status', 374, 1),
+        ('Home Roster Plyr 5-Number', 375, 2),
+        ('Home Roster Plyr 5-Fouls', 377, 2),
+        ('Home Roster Plyr 5-Points', 379, 2),
+        ('Home Roster Plyr 6-Status', 381, 1),
+        ('Home Roster Plyr 6-Number', 382, 2),
+        ('Home Roster Plyr 6-Fouls', 384, 2),
+        ('Home Roster Plyr 6-Points', 386, 2),
+        ('Home Roster Plyr 7-Status', 388, 1),
+        ('Home Roster Plyr 7-Number', 389, 2),
+        ('Home Roster Plyr 7-Fouls', 391, 2),
+        ('Home Roster Plyr 7-Points', 393, 2),
+        ('Home Roster Plyr 8-Status', 395, 1),
+        ('Home Roster Plyr 8-Number', 396, 2),
+        ('Home Roster Plyr 8-Fouls', 398, 2),
+        ('Home Roster Plyr 8-Points', 400, 2),
+        ('Home Roster Plyr 9-Status', 402, 1),
+        ('Home Roster Plyr 9-Number', 403, 2),
+        ('Home Roster Plyr 9-Fouls', 405, 2),
+        ('Home Roster Plyr 9-Points', 407, 2),
+        ('Home Roster Plyr 10-Status', 409, 1),
+        ('Home Roster Plyr 10-Number', 410, 2),
+        ('Home Roster Plyr 10-Fouls', 412, 2),
+        ('Home Roster Plyr 10-Points', 414, 2),
+        ('Home Roster Plyr 11-Status', 416, 1),
+        ('Home Roster Plyr 11-Number', 417, 2),
+        ('Home Roster Plyr 11-Fouls', 419, 2),
+        ('Home Roster Plyr 11-Points', 421, 2),
+        ('Home Roster Plyr 12-Status', 423, 1),
+        ('Home Roster Plyr 12-Number', 424, 2),
+        ('Home Roster Plyr 12-Fouls', 426, 2),
+        ('Home Roster Plyr 12-Points', 428, 2),
+        ('Home Roster Plyr 13-Status', 430, 1),
+        ('Home Roster Plyr 13-Number', 431, 2),
+        ('Home Roster Plyr 13-Fouls', 433, 2),
+        ('Home Roster Plyr 13-Points', 435, 2),
+        ('Home Roster Plyr 14-Status', 437, 1),
+        ('Home Roster Plyr 14-Number', 438, 2),
+        ('Home Roster Plyr 14-Fouls', 440, 2),
+        ('Home Roster Plyr 14-Points', 442, 2),
+        ('Home Roster Plyr 15-Status', 444, 1),
+        ('Home Roster Plyr 15-Number', 445, 2),
+        ('Home Roster Plyr 15-Fouls', 447, 2),
+        ('Home Roster Plyr 15-Points', 449, 2),
+        ('Home Assists', 451, 4),
+        ('Home Rebounds', 455, 4),
+        ('Home Blocked Shots', 459, 4),
+        ('Home Steals', 463, 4),
+        ('Home Total Hustle (A,R,B,S)', 467, 4),
+        ('Home Total Hustle (R,B,S)', 471, 4),
+        ('Guest In-game Plyr 1-Status', 475, 1),
+        ('Guest In-game Plyr 1-Number', 476, 2),
+        ('Guest In-game Plyr 1-Fouls', 478, 2),
+        ('Guest In-game Plyr 1-Points', 480, 2),
+        ('Guest In-game Plyr 2-Status', 482, 1),
+        ('Guest In-game Plyr 2-Number', 483, 2),
+        ('Guest In-game Plyr 2-Fouls', 485, 2),
+        ('Guest In-game Plyr 2-Points', 487, 2),
+        ('Guest In-game Plyr 3-Status', 489, 1),
+        ('Guest In-game Plyr 3-Number', 490, 2),
+        ('Guest In-game Plyr 3-Fouls', 492, 2),
+        ('Guest In-game Plyr 3-Points', 494, 2),
+        ('Guest In-game Plyr 4-Status', 496, 1),
+        ('Guest In-game Plyr 4-Number', 497, 2),
+        ('Guest In-game Plyr 4-Fouls', 499, 2),
+        ('Guest In-game Plyr 4-Points', 501, 2),
+        ('Guest In-game Plyr 5-Status', 503, 1),
+        ('Guest In-game Plyr 5-Number', 504, 2),
+        ('Guest In-game Plyr 5-Fouls', 506, 2),
+        ('Guest In-game Plyr 5-Points', 508, 2),
+        ('Reserved - Guest In-game Plyr 6', 510, 7),
+        ('Guest Roster Plyr 1-Status', 517, 1),
+        ('Guest Roster Plyr 1-Number', 518, 2),
+        ('Guest Roster Plyr 1-Fouls', 520, 2),
+        ('Guest Roster Plyr 1-Points', 522, 2),
+        ('Guest Roster Plyr 2-Status', 524, 1),
+        ('Guest Roster Plyr 2-Number', 525, 2),
+        ('Guest Roster Plyr 2-Fouls', 527, 2),
+        ('Guest Roster Plyr 2-Points', 529, 2),
+        ('Guest Roster Plyr 3-Status', 531, 1),
+        ('Guest Roster Plyr 3-Number', 532, 2),
+        ('Guest Roster Plyr 3-Fouls', 534, 2),
+        ('Guest Roster Plyr 3-Points', 536, 2),
+        ('Guest Roster Plyr 4-Status', 538, 1),
+        ('Guest Roster Plyr 4-Number', 539, 2),
+        ('Guest Roster Plyr 4-Fouls', 541, 2),
+        ('Guest Roster Plyr 4-Points', 543, 2),
+        ('Guest Roster Plyr 5-Status', 545, 1),
+        ('Guest Roster Plyr 5-Number', 546, 2),
+        ('Guest Roster Plyr 5-Fouls', 548, 2),
+        ('Guest Roster Plyr 5-Points', 550, 2),
+        ('Guest Roster Plyr 6-Status', 552, 1),
+        ('Guest Roster Plyr 6-Number', 553, 2),
+        ('Guest Roster Plyr 6-Fouls', 555, 2),
+        ('Guest Roster Plyr 6-Points', 557, 2),
+        ('Guest Roster Plyr 7-Status', 559, 1),
+        ('Guest Roster Plyr 7-Number', 560, 2),
+        ('Guest Roster Plyr 7-Fouls', 562, 2),
+        ('Guest Roster Plyr 7-Points', 564, 2),
+        ('Guest Roster Plyr 8-Status', 566, 1),
+        ('Guest Roster Plyr 8-Number', 567, 2),
+        ('Guest Roster Plyr 8-Fouls', 569, 2),
+        ('Guest Roster Plyr 8-Points', 571, 2),
+        ('Guest Roster Plyr 9-Status', 573, 1),
+        ('Guest Roster Plyr 9-Number', 574, 2),
+        ('Guest Roster Plyr 9-Fouls', 576, 2),
+        ('Guest Roster Plyr 9-Points', 578, 2),
+        ('Guest Roster Plyr 10-Status', 580, 1),
+        ('Guest Roster Plyr 10-Number', 581, 2),
+        ('Guest Roster Plyr 10-Fouls', 583, 2),
+        ('Guest Roster Plyr 10-Points', 585, 2),
+        ('Guest Roster Plyr 11-Status', 587, 1),
+        ('Guest Roster Plyr 11-Number', 588, 2),
+        ('Guest Roster Plyr 11-Fouls', 590, 2),
+        ('Guest Roster Plyr 11-Points', 592, 2),
+        ('Guest Roster Plyr 12-Status', 594, 1),
+        ('Guest Roster Plyr 12-Number', 595, 2),
+        ('Guest Roster Plyr 12-Fouls', 597, 2),
+        ('Guest Roster Plyr 12-Points', 599, 2),
+        ('Guest Roster Plyr 13-Status', 601, 1),
+        ('Guest Roster Plyr 13-Number', 602, 2),
+        ('Guest Roster Plyr 13-Fouls', 604, 2),
+        ('Guest Roster Plyr 13-Points', 606, 2),
+        ('Guest Roster Plyr 14-Status', 608, 1),
+        ('Guest Roster Plyr 14-Number', 609, 2),
+        ('Guest Roster Plyr 14-Fouls', 611, 2),
+        ('Guest Roster Plyr 14-Points', 613, 2),
+        ('Guest Roster Plyr 15-Status', 615, 1),
+        ('Guest Roster Plyr 15-Number', 616, 2),
+        ('Guest Roster Plyr 15-Fouls', 618, 2),
+        ('Guest Roster Plyr 15-Points', 620, 2),
+        ('Guest Assists', 622, 4),
+        ('Guest Rebounds', 626, 4),
+        ('Guest Blocked Shots', 630, 4),
+        ('Guest Steals', 634, 4),
+        ('Guest Total Hustle (A,R,B,S)', 638, 4),
+        ('Guest Total Hustle (R,B,S)', 642, 4),
+    )),
+    'cricket': (453, (
+        ('Main Clock Time (hh:mm/mm:ss)', 1, 5),
+        ('Main Clock Time (hh:mm:ss/mm:ss.th)', 6, 8),
+        ('Main/Time Out/TOD (hh:mm/mm:ss)', 14, 5),
+        ('Main/Time Out/TOD (hh:mm:ss/mm:ss.th)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Period', 142, 2),
+        ('Period Text', 144, 4),
+        ('Period Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Inning', 201, 2),
+        ('Home At Bat Indicator', 203, 1),
+        ('Guest At Bat Indicator', 204, 1),
+        ('Home Total Score', 205, 4),
+        ('Guest Total Score', 209, 4),
+        ('Current - Batter 1 Score', 213, 3),
+        ('Current - Batter 2 Score', 216, 3),
+        ('Current - Batter 3 Score', 219, 3),
+        ('Current - Batter 4 Score', 222, 3),
+        ('Current - Batter 5 Score', 225, 3),
+        ('Current - Batter 6 Score', 228, 3),
+        ('Current - Batter 7 Score', 231, 3),
+        ('Current - Batter 8 Score', 234, 3),
+        ('Current - Batter 9 Score', 237, 3),
+        ('Current - Batter 10 Score', 240, 3),
+        ('Current - Batter 11 Score', 243, 3),
+        ('Current Extras', 246, 2),
+        ('Current Inning Score', 248, 4),
+        ('Current Overs Remaining', 252, 2),
+        ('Current Wickets', 254, 2),
+        ('Current - Left Batsman Number', 256, 2),
+        ('Current - Left Batsman Score', 258, 3),
+        ('Current - Right Batsman Number', 261, 2),
+        ('Current - Right Batsman Score', 263, 3),
+        ('Home #1 - Batter 1 Score', 266, 3),
+        ('Home #1 - Batter 2 Score', 269, 3),
+        ('Home #1 - Batter 3 Score', 272, 3),
+        ('Home #1 - Batter 4 Score', 275, 3),
+        ('Home #1 - Batter 5 Score', 278, 3),
+        ('Home #1 - Batter 6 Score', 281, 3),
+        ('Home #1 - Batter 7 Score', 284, 3),
+        ('Home #1 - Batter 8 Score', 287, 3),
+        ('Home #1 - Batter 9 Score', 290, 3),
+        ('Home #1 - Batter 10 Score', 293, 3),
+        ('Home #1 - Batter 11 Score', 296, 3),
+        ('Home #1 - Extras', 299, 2),
+        ('Home #1 - Inning Score', 301, 4),
+        ('Home #1 - Overs Remaining', 305, 2),
+        ('Home #1 - Wickets', 307, 2),
+        ('Home #1 - Left Batsman Number', 309, 2),
+        ('Home #1 - Right Batsman Number', 311, 2),
+        ('Home #2 - Batter 1 Score', 313, 3),
+        ('Home #2 - Batter 2 Score', 316, 3),
+        ('Home #2 - Batter 3 Score', 319, 3),
+        ('Home #2 - Batter 4 Score', 322, 3),
+        ('Home #2 - Batter 5 Score', 325, 3),
+        ('Home #2 - Batter 6 Score', 328, 3),
+        ('Home #2 - Batter 7 Score', 331, 3),
+        ('Home #2 - Batter 8 Score', 334, 3),
+        ('Home #2 - Batter 9 Score', 337, 3),
+        ('Home #2 - Batter 10 Score', 340, 3),
+        ('Home #2 - Batter 11 Score', 343, 3),
+        ('Home #2 - Extras', 346, 2),
+        ('Home #2 - Inning Score', 348, 4),
+        ('Home #2 - Overs Remaining', 352, 2),
+        ('Home #2 - Wickets', 354, 2),
+        ('Home #2 - Left Batsman Number', 356, 2),
+        ('Home #2 - Right Batsman Number', 358, 2),
+        ('Guest #1 - Batter 1 Score', 360, 3),
+        ('Guest #1 - Batter 2 Score', 363, 3),
+        ('Guest #1 - Batter 3 Score', 366, 3),
+        ('Guest #1 - Batter 4 Score', 369, 3),
+        ('Guest #1 - Batter 5 Score', 372, 3),
+        ('Guest #1 - Batter 6 Score', 375, 3),
+        ('Guest #1 - Batter 7 Score', 378, 3),
+        ('Guest #1 - Batter 8 Score', 381, 3),
+        ('Guest #1 - Batter 9 Score', 384, 3),
+        ('Guest #1 - Batter 10 Score', 387, 3),
+        ('Guest #1 - Batter 11 Score', 390, 3),
+        ('Guest #1 - Extras', 393, 2),
+        ('Guest #1 - Inning Score', 395, 4),
+        ('Guest #1 - Overs Remaining', 399, 2),
+        ('Guest #1 - Wickets', 401, 2),
+        ('Guest #1 - Left Batsman Number', 403, 2),
+        ('Guest #1 - Right Batsman Number', 405, 2),
+        ('Guest #2 - Batter 1 Score', 407, 3),
+        ('Guest #2 - Batter 2 Score', 410, 3),
+        ('Guest #2 - Batter 3 Score', 413, 3),
+        ('Guest #2 - Batter 4 Score', 416, 3),
+        ('Guest #2 - Batter 5 Score', 419, 3),
+        ('Guest #2 - Batter 6 Score', 422, 3),
+        ('Guest #2 - Batter 7 Score', 425, 3),
+        ('Guest #2 - Batter 8 Score', 428, 3),
+        ('Guest #2 - Batter 9 Score', 431, 3),
+        ('Guest #2 - Batter 10 Score', 434, 3),
+        ('Guest #2 - Batter 11 Score', 437, 3),
+        ('Guest #2 - Extras', 440, 2),
+        ('Guest #2 - Inning Score', 442, 4),
+        ('Guest #2 - Overs Remaining', 446, 2),
+        ('Guest #2 - Wickets', 448, 2),
+        ('Guest #2 - Left Batsman Number', 450, 2),
+        ('Guest #2 - Right Batsman Number', 452, 2),
+    )),
+    'event counter': {
+        'day and time event countdown': (11, (
+            ('Days Remaining', 1, 3),
+            ('Time Remaining (hh:mm:ss)', 4, 8),
+        )),
+        'time base counter': (8, (
+            ('Value', 1, 8),
+        )),
+        'external input counter': (8, (
+            ('Value', 1, 8),
+        ))
+    },
+    'football': (295, (
+        ('Main Clock Time [mm:ss/ss.t]', 1, 5),
+        ('Main Clock Time [mm:ss.t]', 6, 8),
+        ('Main Clock/Time Out/TOD [mm:ss/ss.t]', 14, 5),
+        ('Main Clock/Time Out/TOD [mm:ss.t]', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time', 32, 8),
+        ('Time of Day', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Quarter', 142, 2),
+        ('Quarter Text', 144, 4),
+        ('Quarter Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2 ', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Play Clock Time', 201, 8),
+        ('Play Clock Horn', 209, 1),
+        ('Home Possession Indicator', 210, 1),
+        ('Home Possession Text', 211, 4),
+        ('Guest Possession Indicator', 215, 1),
+        ('Guest Possession Text', 216, 4),
+        ('Ball On', 220, 2),
+        ('Down', 222, 3),
+        ('To Go', 225, 2),
+        ('Home Score - Period 1', 227, 2),
+        ('Home Score - Period 2', 229, 2),
+        ('Home Score - Period 3', 231, 2),
+        ('Home Score - Period 4', 233, 2),
+        ('Home Score - Period 5', 235, 2),
+        ('Home Score - Period 6', 237, 2),
+        ('Home Score - Period 7', 239, 2),
+        ('Home Score - Period 8', 241, 2),
+        ('Home Score - Period 9', 243, 2),
+        ('Home Score - Current Period', 245, 2),
+        ('Guest Score - Period 1', 247, 2),
+        ('Guest Score - Period 2', 249, 2),
+        ('Guest Score - Period 3', 251, 2),
+        ('Guest Score - Period 4', 253, 2),
+        ('Guest Score - Period 5', 255, 2),
+        ('Guest Score - Period 6', 257, 2),
+        ('Guest Score - Period 7', 259, 2),
+        ('Guest Score - Period 8', 261, 2),
+        ('Guest Score - Period 9', 263, 2),
+        ('Guest Score - Current Period', 265, 2),
+        ('Home Rushing Yards', 267, 4),
+        ('Home Passing Yards', 271, 4),
+        ('Home Total Yards', 275, 4),
+        ('Guest Rushing Yards', 279, 4),
+        ('Guest Passing Yards', 283, 4),
+        ('Guest Total Yards', 287, 4),
+        ('Home First Downs', 291, 2),
+        ('Guest First Downs', 293, 2),
+    )),
+    'hockey/lacrosse': (493, (
+        ('Main Clock Time (mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (mm:ss.t)', 6, 8),
+        ('Main Clock/Time Out/TOD (mm:ss/ss.t)', 14, 5),
+        ('Main Clock/Time Out/TOD (mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Period', 142, 2),
+        ('Period Text', 144, 4),
+        ('Period Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Shot Clock Time (mm:ss)', 201, 8),
+        ('Shot Clock Horn', 209, 1),
+        ('Inverse Time Clock (mm:ss)', 210, 8),
+        ('Inverse/Main/Time Out/TOD (mm:ss)', 218, 8),
+        ('Home Player #1-Number', 226, 2),
+        ('Home Player #1-Penalty Time (mm:ss)', 228, 8),
+        ('Home Player #2-Number', 236, 2),
+        ('Home Player #2-Penalty Time (mm:ss)', 238, 8),
+        ('Home Player #3-Number', 246, 2),
+        ('Home Player #3-Penalty Time (mm:ss)', 248, 8),
+        ('Home Player #4-Number', 256, 2),
+        ('Home Player #4-Penalty Time (mm:ss)', 258, 8),
+        ('Home Player #5-Number', 266, 2),
+        ('Home Player #5-Penalty Time (mm:ss)', 268, 8),
+        ('Home Player #6-Number', 276, 2),
+        ('Home Player #6-Penalty Time (mm:ss)', 278, 8),
+        ('Guest Player #1-Number', 286, 2),
+        ('Guest Player #1-Penalty Time (mm:ss)', 288, 8),
+        ('Guest Player #2-Number', 296, 2),
+        ('Guest Player #2-Penalty Time (mm:ss)', 298, 8),
+        ('Guest Player #3-Number', 306, 2),
+        ('Guest Player #3-Penalty Time (mm:ss)', 308, 8),
+        ('Guest Player #4-Number', 316, 2),
+        ('Guest Player #4-Penalty Time (mm:ss)', 318, 8),
+        ('Guest Player #5-Number', 326, 2),
+        ('Guest Player #5-Penalty Time (mm:ss)', 328, 8),
+        ('Guest Player #6-Number', 336, 2),
+        ('Guest Player #6-Penalty Time (mm:ss)', 338, 8),
+        ('Home Penalty Indicator', 346, 1),
+        ('Home Penalty Text', 347, 7),
+        ('Guest Penalty Indicator', 354, 1),
+        ('Guest Penalty Text', 355, 7),
+        ('Home Score - Period 1', 362, 2),
+        ('Home Score - Period 2', 364, 2),
+        ('Home Score - Period 3', 366, 2),
+        ('Home Score - Period 4', 368, 2),
+        ('Home Score - Period 5', 370, 2),
+        ('Home Score - Period 6', 372, 2),
+        ('Home Score - Period 7', 374, 2),
+        ('Home Score - Period 8', 376, 2),
+        ('Home Score - Period 9', 378, 2),
+        ('Home Score - Current Period', 380, 2),
+        ('Guest Score - Period 1', 382, 2),
+        ('Guest Score - Period 2', 384, 2),
+        ('Guest Score - Period 3', 386, 2),
+        ('Guest Score - Period 4', 388, 2),
+        ('Guest Score - Period 5', 390, 2),
+        ('Guest Score - Period 6', 392, 2),
+        ('Guest Score - Period 7', 394, 2),
+        ('Guest Score - Period 8', 396, 2),
+        ('Guest Score - Period 9', 398, 2),
+        ('Guest Score - Current Period', 400, 2),
+        ('Home Shots On Goal - Period 1', 402, 2),
+        ('Home Shots On Goal - Period 2', 404, 2),
+        ('Home Shots On Goal - Period 3', 406, 2),
+        ('Home Shots On Goal - Period 4', 408, 2),
+        ('Home Shots On Goal - Period 5', 410, 2),
+        ('Home Shots On Goal - Period 6', 412, 2),
+        ('Home Shots On Goal - Period 7', 414, 2),
+        ('Home Shots On Goal - Period 8', 416, 2),
+        ('Home Shots On Goal - Period 9', 418, 2),
+        ('Home Shots On Goal - Current', 420, 2),
+        ('Home Shots On Goal - Total', 422, 3),
+        ('Home Saves - Period 1', 425, 2),
+        ('Home Saves - Period 2', 427, 2),
+        ('Home Saves - Period 3', 429, 2),
+        ('Home Saves - Period 4', 431, 2),
+        ('Home Saves - Period 5', 433, 2),
+        ('Home Saves - Period 6', 435, 2),
+        ('Home Saves - Period 7', 437, 2),
+        ('Home Saves - Period 8', 439, 2),
+        ('Home Saves - Period 9', 441, 2),
+        ('Home Saves - Current', 443, 2),
+        ('Home Saves - Total', 445, 3),
+        ('Guest Shots On Goal - Period 1', 448, 2),
+        ('Guest Shots On Goal - Period 2', 450, 2),
+        ('Guest Shots On Goal - Period 3', 452, 2),
+        ('Guest Shots On Goal - Period 4', 454, 2),
+        ('Guest Shots On Goal - Period 5', 456, 2),
+        ('Guest Shots On Goal - Period 6', 458, 2),
+        ('Guest Shots On Goal - Period 7', 460, 2),
+        ('Guest Shots On Goal - Period 8', 462, 2),
+        ('Guest Shots On Goal - Period 9', 464, 2),
+        ('Guest Shots On Goal - Current', 466, 2),
+        ('Guest Shots On Goal - Total', 468, 3),
+        ('Guest Saves - Period 1', 471, 2),
+        ('Guest Saves - Period 2', 473, 2),
+        ('Guest Saves - Period 3', 475, 2),
+        ('Guest Saves - Period 4', 477, 2),
+        ('Guest Saves - Period 5', 479, 2),
+        ('Guest Saves - Period 6', 481, 2),
+        ('Guest Saves - Period 7', 483, 2),
+        ('Guest Saves - Period 8', 485, 2),
+        ('Guest Saves - Period 9', 487, 2),
+        ('Guest Saves - Current', 489, 2),
+        ('Guest Saves - Total', 491, 3),
+    )),
+    'judo': (260, (
+        ('Main Clock Time (mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (mm:ss.t)', 6, 8),
+        ('Main/Blood/Injury/TOD (mm:ss/ss.t)', 14, 5),
+        ('Main/Blood/Injury/TOD (mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Period', 142, 2),
+        ('Period Text', 144, 4),
+        ('Period Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Osaekomi Time (mm:ss)', 201, 8),
+        ('Blue Osaekomi Ti me (mm:ss)', 209, 5),
+        ('White Osaekomi Time (mm:ss)', 214, 5),
+        ('Blue Osaekomi Indicator', 219, 1),
+        ('White Osaekomi Indicator', 220, 1),
+        ('Blue Waza Ari', 221, 1),
+        ('Blue Yuko', 222, 1),
+        ('Blue Koka', 223, 1),
+        ('White Waza Ari', 224, 1),
+        ('White Yuko', 225, 1),
+        ('White Koka', 226, 1),
+        ('Blue Ippon Indicator', 227, 1),
+        ('Blue Win Indicator', 228, 1),
+        ('Blue Win Text', 229, 3),
+        ('White Ippon Indicator', 232, 1),
+        ('White Win Indicator', 233, 1),
+        ('White Win Text', 234, 3),
+        ('Blue Medical Indicator 1', 237, 1),
+        ('Blue Medical Indicator 2', 238, 1),
+        ('White medical Indicator 1', 239, 1),
+        ('White Medical Indicator 2', 240, 1),
+        ('Blue Keikoku Indicator', 241, 1),
+        ('Blue Chui Indicator', 242, 1),
+        ('Blue Shido Indicator', 243, 1),
+        ('Blue Penalty Text', 244, 7),
+        ('White Keikoku Indicator', 251, 1),
+        ('White Chui Indicator', 252, 1),
+        ('White Shido Indicator', 253, 1),
+        ('White Penalty Text', 254, 7),
+    )),
+    'karate': (210, (
+        ('Main Clock Time (mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (mm:ss.t)', 6, 8),
+        ('Main Clock/TOD (mm:ss/ss.t)', 14, 5),
+        ('Main Clock/TOD (mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Period', 142, 2),
+        ('Period Text', 144, 4),
+        ('Period Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Red Wazari', 201, 1),
+        ('Red Hansoku', 202, 1),
+        ('Red Mubobi', 203, 1),
+        ('Red Jogai', 204, 1),
+        ('White Wazari', 205, 1),
+        ('White Hansoku', 206, 1),
+        ('White Mubobi', 207, 1),
+        ('White Jogai', 208, 1),
+        ('Red Win Indicator', 209, 1),
+        ('White Win Indicator', 210, 1),
+    )),
+    'lane timer': (453, (
+        ('Main Clock Time (mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (mm:ss.t)', 6, 8),
+        ('Main Clock/Time Out/TOD (mm:ss/ss.t)', 14, 5),
+        ('Main Clock/Time Out/TOD (mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Period', 142, 2),
+        ('Period Text', 144, 4),
+        ('Period Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Best Time (mm:ss.dcm)', 201, 9),
+        ('Lane 1 - Position #', 210, 3),
+        ('Lane 2 - Position #', 213, 3),
+        ('Lane 3 - Position #', 216, 3),
+        ('Lane 4 - Position #', 219, 3),
+        ('Position 1 - Car #', 222, 3),
+        ('Position 2 - Car #', 225, 3),
+        ('Position 3 - Car #', 228, 3),
+        ('Position 4 - Car #', 231, 3),
+        ('Lane 1 - Total Time (mm:ss.dcm)', 234, 9),
+        ('Lane 1 - Elapsed Time (mm:ss.dcm)', 243, 9),
+        ('Lane 1 - Reaction Time (mm:ss.dcm)', 252, 9),
+        ('Lane 2 - Total Time (mm:ss.dcm)', 261, 9),
+        ('Lane 2 - Elapsed Time (mm:ss.dcm)', 270, 9),
+        ('Lane 2 - Reaction Time (mm:ss.dcm)', 279, 9),
+        ('Lane 3 - Total Time (mm:ss.dcm)', 288, 9),
+        ('Lane 3 - Elapsed Time (mm:ss.dcm)', 297, 9),
+        ('Lane 3 - Reaction Time (mm:ss.dcm)', 306, 9),
+        ('Lane 4 - Total Time (mm:ss.dcm)', 315, 9),
+        ('Lane 4 - Elapsed Time (mm:ss.dcm)', 324, 9),
+        ('Lane 4 - Reaction Time (mm:ss.dcm)', 333, 9),
+        ('Position 1 - Total Time (mm:ss.dcm)', 342, 9),
+        ('Position 1 - Elapsed Time (mm:ss.dcm)', 351, 9),
+        ('Position 1 - Reaction Time (mm:ss.dcm)', 360, 9),
+        ('Position 2 - Total Time (mm:ss.dcm)', 369, 9),
+        ('Position 2 - Elapsed Time (mm:ss.dcm)', 378, 9),
+        ('Position 2 - Reaction Time (mm:ss.dcm)', 387, 9),
+        ('Position 3 - Total Time (mm:ss.dcm)', 396, 9),
+        ('Position 3 - Elapsed Time (mm:ss.dcm)', 405, 9),
+        ('Position 3 - Reaction Time (mm:ss.dcm)', 414, 9),
+        ('Position 4 - Total Time (mm:ss.dcm)', 423, 9),
+        ('Position 4 - Elapsed Time (mm:ss.dcm)', 432, 9),
+        ('Position 4 - Reaction Time (mm:ss.dcm)', 441, 9),
+        ('Lane 1 - DQ Status', 450, 1),
+        ('Lane 2 - DQ Status', 451, 1),
+        ('Lane 3 - DQ Status', 452, 1),
+        ('Lane 4 - DQ Status', 453, 1),
+    )),
+    'pitch and speed': (51, (
+        ('Miles Per Hour', 1, 3),
+        ('Pitch Type', 4, 16),
+        ('Kilometers Per Hour', 20, 3),
+        ('MPH or KPH', 23, 3),
+        ('MPH Indicator', 26, 1),
+        ('KPH Indicator', 27, 1),
+        ('Home Ball Pitch Count', 28, 3),
+        ('Home Strike Pitch Count', 31, 3),
+        ('Home Total Pitch Count', 34, 3),
+        ('Home Strike Out Count', 37, 3),
+        ('Guest Ball Pitch Count', 40, 3),
+        ('Guest Strike Pitch Count', 43, 3),
+        ('Guest Total Pitch Count', 46, 3),
+        ('Guest Strike Out Count', 49, 3),
+    )),
+    'rodeo': (65, (
+        ('Now-Up Time (mm:ss.tht)', 1, 9),
+        ('Reserved', 10, 2),
+        ('Now-Up Time/Score (ss.tht/SC)', 12, 6),
+        ('Now-Up Time/Score (mm:ss.tht/SC)', 18, 9),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Now-Up Comp #', 31, 4),
+        ('Now-Up Score', 35, 5),
+        ('Penalty Text', 40, 7),
+        ('Reride Text', 47, 6),
+        ('Leader Time/Score (mm:ss:tht/SC)', 53, 9),
+        ('Leader Comp #', 62, 4),
+    )),
+    'soccer': (402, (
+        ('Main Clock Time (mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (mm:ss.t)', 6, 8),
+        ('Main Clock/Time Out/TOD (mm:ss/ss.t)', 14, 5),
+        ('Main Clock/Time Out/TOD (mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Half', 142, 2),
+        ('Half Text', 144, 4),
+        ('Half Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Home Possession Indicator', 201, 1),
+        ('Home Possession Text', 202, 4),
+        ('Guest Possession Indicator', 206, 1),
+        ('Guest Possession Text', 207, 4),
+        ('Home Score - Period 1', 211, 2),
+        ('Home Score - Period 2', 213, 2),
+        ('Home Score - Period 3', 215, 2),
+        ('Home Score - Period 4', 217, 2),
+        ('Home Score - Period 5', 219, 2),
+        ('Home Score - Period 6', 221, 2),
+        ('Home Score - Period 7', 223, 2),
+        ('Home Score - Period 8', 225, 2),
+        ('Home Score - Period 9', 227, 2),
+        ('Home Score - Current Period', 229, 2),
+        ('Guest Score - Period 1', 231, 2),
+        ('Guest Score - Period 2', 233, 2),
+        ('Guest Score - Period 3', 235, 2),
+        ('Guest Score - Period 4', 237, 2),
+        ('Guest Score - Period 5', 239, 2),
+        ('Guest Score - Period 6', 241, 2),
+        ('Guest Score - Period 7', 243, 2),
+        ('Guest Score - Period 8', 245, 2),
+        ('Guest Score - Period 9', 247, 2),
+        ('Guest Score - Current Period', 249, 2),
+        ('Home Shots On Goal - 1st Half', 251, 2),
+        ('Home Shots On Goal - 2nd Half', 253, 2),
+        ('Home Shots On Goal - Overtime', 255, 2),
+        ('Home Shots On Goal - Current', 257, 2),
+        ('Home Shots On Goal - Total', 259, 3),
+        ('Home Saves - 1st Half', 262, 2),
+        ('Home Saves - 2nd Half', 264, 2),
+        ('Home Saves - Overtime', 266, 2),
+        ('Home Saves - Current', 268, 2),
+        ('Home Saves - Total', 270, 3),
+        ('Home Corner Kicks - 1st Half', 273, 2),
+        ('Home Corner Kicks - 2nd Half', 275, 2),
+        ('Home Corner Kicks - Overtime', 277, 2),
+        ('Home Corner Kicks - Current', 279, 2),
+        ('Home Corner Kicks - Total', 281, 3),
+        ('Home Penalty - 1st Half', 284, 2),
+        ('Home Penalty - 2nd Half', 286, 2),
+        ('Home Penalty - Overtime', 288, 2),
+        ('Home Penalty - Current', 290, 2),
+        ('Home Penalty - Total', 292, 3),
+        ('Guest Shots On Goal - 1st Half', 295, 2),
+        ('Guest Shots On Goal - 2nd Half', 297, 2),
+        ('Guest Shots On Goal - Overtime', 299, 2),
+        ('Guest Shots On Goal - Current', 301, 2),
+        ('Guest Shots On Goal - Total', 303, 3),
+        ('Guest Saves - 1st Half', 306, 2),
+        ('Guest Saves - 2nd Half', 308, 2),
+        ('Guest Saves - Overtime', 310, 2),
+        ('Guest Saves - Current', 312, 2),
+        ('Guest Saves - Total', 314, 3),
+        ('Guest Corner Kicks - 1st Half', 317, 2),
+        ('Guest Corner Kicks - 2nd Half', 319, 2),
+        ('Guest Corner Kicks - Overtime', 321, 2),
+        ('Guest Corner Kicks - Current', 323, 2),
+        ('Guest Corner Kicks - Total', 325, 3),
+        ('Guest Penalty - 1st Half', 328, 2),
+        ('Guest Penalty - 2nd Half', 330, 2),
+        ('Guest Penalty - Overtime', 332, 2),
+        ('Guest Penalty - Current', 334, 2),
+        ('Guest Penalty - Total', 336, 3),
+        ('Home Corner Kicks/Saves - 1st Half', 339, 2),
+        ('Home Corner Kicks/Saves - 2nd Half', 341, 2),
+        ('Home Corner Kicks/Saves - Overtime', 343, 2),
+        ('Home Corner Kicks/Saves - Current', 345, 2),
+        ('Home Corner Kicks/Saves - Total', 347, 3),
+        ('Guest Corner Kicks/Saves - 1st Half', 350, 2),
+        ('Guest Corner Kicks/Saves - 2nd Half', 352, 2),
+        ('Guest Corner Kicks/Saves - Overtime', 354, 2),
+        ('Guest Corner Kicks/Saves - Current', 356, 2),
+        ('Guest Corner Kicks/Saves - Total', 358, 3),
+        ('Home Fouls - 1st Half', 361, 2),
+        ('Home Fouls - 2ndHalf', 363, 2),
+        ('Home Fouls - Overtime', 365, 2),
+        ('Home Fouls - Current', 367, 2),
+        ('Home Fouls - Total', 369, 3),
+        ('Guest Fouls - 1st Half', 372, 2),
+        ('Guest Fouls - 2nd Half', 374, 2),
+        ('Guest Fouls - Overtime', 376, 2),
+        ('Guest Fouls - Current', 378, 2),
+        ('Guest Fouls - Total', 380, 3),
+        ('Home Penalty/TOL - 1st Half', 383, 2),
+        ('Home Penalty/TOL- 2ndHalf', 385, 2),
+        ('Home Penalty/TOL- Overtime', 387, 2),
+        ('Home Penalty/TOL- Current', 389, 2),
+        ('Home Penalty/TOL- Total', 391, 2),
+        ('Guest Penalty/TOL- 1st Half', 393, 2),
+        ('Guest Penalty/TOL- 2nd Half', 395, 2),
+        ('Guest Penalty/TOL- Overtime', 397, 2),
+        ('Guest Penalty/TOL- Current', 399, 2),
+        ('Guest Penalty/TOL- Total', 401, 2),
+    )),
+    'strike out count': (207, (
+        ('Reserved', 1, 200),
+        ('Game Strikeouts', 201, 3),
+        ('Season Strikeouts', 204, 4),
+    )),
+    'taekwondo': (212, (
+        ('Main Clock Time (mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (mm:ss.t)', 6, 8),
+        ('Main/Blood/Injury/TOD (mm:ss/ss.t)', 14, 5),
+        ('Main/Blood/Injury/TOD (mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Period', 142, 2),
+        ('Period Text', 144, 4),
+        ('Period Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Weight Class', 201, 2),
+        ("Red 'D'", 203, 1),
+        ("Red 'G'", 204, 1),
+        ("Red 'K'", 205, 1),
+        ("White 'D'", 206, 1),
+        ("White 'G'", 207, 1),
+        ("White 'K'", 208, 1),
+        ('Red Check Indicator', 209, 1),
+        ('Red Win Indicator', 210, 1),
+        ('White Check Indicator', 211, 1),
+        ('White Win Indicator', 212, 1),
+    )),
+    'tennis': (259, (
+        ('Main Clock Time (hh:mm/mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (hh:mm:ss/mm:ss.t)', 6, 8),
+        ('Main/Time Out/TOD (hh:mm/mm:ss/ss.t)', 14, 5),
+        ('Main/Time Out/TOD (hh:mm:ss/mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Top Team/Player #1 Name', 48, 20),
+        ('Bottom Team/Player #1 Name', 68, 20),
+        ('Top Player #2 Name', 88, 10),
+        ('Bottom Player #2 Name', 98, 10),
+        ('Top Game Score', 108, 4),
+        ('Bottom Game Score', 112, 4),
+        ('Top Time Outs Left - Full', 116, 2),
+        ('Top Time Outs Left - Partial', 118, 2),
+        ('Top Time Outs Left - Television', 120, 2),
+        ('Top Time Outs Left - Total', 122, 2),
+        ('Bottom Time Outs Left - Full', 124, 2),
+        ('Bottom Time Outs Left - Partial', 126, 2),
+        ('Bottom Time Outs Left - Television', 128, 2),
+        ('Bottom Time Outs Left - Total', 130, 2),
+        ('Top Time Out Indicator', 132, 1),
+        ('Top Time Out Text', 133, 4),
+        ('Bottom Time Out Indicator', 137, 1),
+        ('Bottom Time Out Text', 138, 4),
+        ('Set Number', 142, 2),
+        ('Set Number Text', 144, 4),
+        ('Set Number Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Top Team/Player #1 Serve', 201, 1),
+        ('Top Player #2 Serve', 202, 1),
+        ('Top Serve Text', 203, 5),
+        ('Bottom Team/Player #1 Serve', 208, 1),
+        ('Bottom Player #2 Serve', 209, 1),
+        ('Bottom Serve Text', 210, 5),
+        ('Match Number', 215, 4),
+        ('Tie Break Text', 219, 9),
+        ('Top Matches Won', 228, 2),
+        ('Bottom Matches Won', 230, 2),
+        ('Top Sets Won', 232, 2),
+        ('Top Games Won - 1st Set - Court 1', 234, 2),
+        ('Top Games Won - 2nd Set - Court 1', 236, 2),
+        ('Top Games Won - 3rd Set - Court 1', 238, 2),
+        ('Top Games Won - 4th Set - Court 1', 240, 2),
+        ('Top Games Won - 5th Set - Court 1', 242, 2),
+        ('Top Games Won - Current Set - Court 1', 244, 2),
+        ('Bottom Sets Won', 246, 2),
+        ('Bottom Games Won - 1st Set - Court 1', 248, 2),
+        ('Bottom Games Won - 2nd Set - Court 1', 250, 2),
+        ('Bottom Games Won - 3rd Set - Court 1', 252, 2),
+        ('Bottom Games Won - 4th Set - Court 1', 254, 2),
+        ('Bottom Games Won - 5th Set - Court 1', 256, 2),
+        ('Bottom Games Won - Current Set - Court 1', 258, 2),
+    )),
+    'track': (990, (
+        ('Running Time', 1, 9),
+        ('Cumulative Split', 10, 9),
+        ('Subtractive Split', 19, 9),
+        ('Reserved 1', 28, 12),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Reserved 2', 88, 30),
+        ('Event Number', 118, 3),
+        ('Event Number - Alpha', 121, 1),
+        ('Heat Number', 122, 2),
+        ('Heat Number - Alpha', 124, 20),
+        ('Round Number', 144, 1),
+        ('Open - For Future Use', 145, 2),
+        ('Splits Completed', 147, 2),
+        ('Record 1 Name', 149, 12),
+        ('Record 1 Code', 161, 2),
+        ('Record 1 Time', 163, 9),
+        ('Record 2 Name', 172, 12),
+        ('Record 2 Code', 184, 2),
+        ('Record 2 Time', 186, 9),
+        ('Record 3 Name', 195, 12),
+        ('Record 3 Code', 207, 2),
+        ('Record 3 Time', 209, 9),
+        ('Record 4 Name', 218, 12),
+        ('Record 4 Code', 230, 2),
+        ('Record 4 Time', 232, 9),
+        ('Line 1 Runner Name', 241, 15),
+        ('Line 1 Team Name', 256, 5),
+        ('Line 1 Lane Number', 261, 2),
+        ('Line 1 Place Number', 263, 3),
+        ('Line 1 Split/Finish Time', 266, 9),
+        ('Line 1 Splits Completed', 275, 2),
+        ('Line 2 Runner Name', 277, 15),
+        ('Line 2 Team Name', 292, 5),
+        ('Line 2 Lane Number', 297, 2),
+        ('Line 2 Place Number', 299, 3),
+        ('Line 2 Split/Finish Time', 302, 9),
+        ('Line 2 Splits Completed', 311, 2),
+        ('Line 3 Runner Name', 313, 15),
+        ('Line 3 Team Name', 328, 5),
+        ('Line 3 Lane Number', 333, 2),
+        ('Line 3 Place Number', 335, 3),
+        ('Line 3 Split/Finish Time', 338, 9),
+        ('Line 3 Splits Completed', 347, 2),
+        ('Line 4 Runner Name', 349, 15),
+        ('Line 4 Team Name', 364, 5),
+        ('Line 4 Lane Number', 369, 2),
+        ('Line 4 Place Number', 371, 3),
+        ('Line 4 Split/Finish Time', 374, 9),
+        ('Line 4 Splits Completed', 383, 2),
+        ('Line 5 Runner Name', 385, 15),
+        ('Line 5 Team Name', 400, 5),
+        ('Line 5 Lane Number', 405, 2),
+        ('Line 5 Place Number', 407, 3),
+        ('Line 5 Split/Finish Time', 410, 9),
+        ('Line 5 Splits Completed', 419, 2),
+        ('Line 6 Runner Name', 421, 15),
+        ('Line 6 Team Name', 436, 5),
+        ('Line 6 Lane Number', 441, 2),
+        ('Line 6 Place Number', 443, 3),
+        ('Line 6 Split/Finish Time', 446, 9),
+        ('Line 6 Splits Completed', 455, 2),
+        ('Line 7 Runner Name', 457, 15),
+        ('Line 7 Team Name', 472, 5),
+        ('Line 7 Lane Number', 477, 2),
+        ('Line 7 Place Number', 479, 3),
+        ('Line 7 Split/Finish Time', 482, 9),
+        ('Line 7 Splits Completed', 491, 2),
+        ('Line 8 Runner Name', 493, 15),
+        ('Line 8 Team Name', 508, 5),
+        ('Line 8 Lane Number', 513, 2),
+        ('Line 8 Place Number', 515, 3),
+        ('Line 8 Split/Finish Time', 518, 9),
+        ('Line 8 Splits Completed', 527, 2),
+        ('Line 9 Runner Name', 529, 15),
+        ('Line 9 Team Name', 544, 5),
+        ('Line 9 Lane Number', 549, 2),
+        ('Line 9 Place Number', 551, 3),
+        ('Line 9 Split/Finish Time', 554, 9),
+        ('Line 9 Splits Completed', 563, 2),
+        ('Line 10 Runner Name', 565, 15),
+        ('Line 10 Team Name', 580, 5),
+        ('Line 10 Lane Number', 585, 2),
+        ('Line 10 Place Number', 587, 3),
+        ('Line 10 Split/Finish Time', 590, 9),
+        ('Line 10 Splits Completed', 599, 2),
+        ('Reserved 3', 601, 364),
+        ('Home Score', 965, 3),
+        ('Guest Score', 968, 3),
+        ('Single Line Lane Number', 971, 2),
+        ('Single Line Place Number', 973, 3),
+        ('Single Line Split/Finish Time', 976, 9),
+        ('Event/Guest 2 score', 985, 3),
+        ('Heat/Guest 3 score', 988, 3),
+    )),
+    'volleyball': (595, (
+        ('Main Clock Time (mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (mm:ss.t)', 6, 8),
+        ('Main Clock/Time Out/TOD (mm:ss/ss.t)', 14, 5),
+        ('Main Clock/Time Out/TOD (mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Game', 142, 2),
+        ('Game Text', 144, 4),
+        ('Game Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Home Serve Indicator', 201, 1),
+        ('Home Serve Arrow', 202, 1),
+        ('Home Serve Text', 203, 5),
+        ('Guest Serve Indicator', 208, 1),
+        ('Guest Serve Arrow', 209, 1),
+        ('Guest Serve Text', 210, 5),
+        ('Home Games Won', 215, 2),
+        ('Guest Games Won', 217, 2),
+        ('Match Number', 219, 3),
+        ('Home Score - Game 1', 222, 2),
+        ('Home Score - Game 2', 224, 2),
+        ('Home Score - Game 3', 226, 2),
+        ('Home Score - Game 4', 228, 2),
+        ('Home Score - Game 5', 230, 2),
+        ('Home Score - Game 6', 232, 2),
+        ('Home Score - Game 7', 234, 2),
+        ('Home Score - Game 8', 236, 2),
+        ('Home Score - Game 9', 238, 2),
+        ('Home Score - Current Game', 240, 2),
+        ('Guest Score - Game 1', 242, 2),
+        ('Guest Score - Game 2', 244, 2),
+        ('Guest Score - Game 3', 246, 2),
+        ('Guest Score - Game 4', 248, 2),
+        ('Guest Score - Game 5', 250, 2),
+        ('Guest Score - Game 6', 252, 2),
+        ('Guest Score - Game 7', 254, 2),
+        ('Guest Score - Game 8', 256, 2),
+        ('Guest Score - Game 9', 258, 2),
+        ('Guest Score - Current Game', 260, 2),
+        ('Home In-game Plyr 1-Status', 262, 1),
+        ('Home In-game Plyr 1-Number', 263, 2),
+        ('Home In-game Plyr 1-User Defined 1', 265, 2),
+        ('Home In-game Plyr 1-User Defined 2', 267, 2),
+        ('Home In-game Plyr 2-Status', 269, 1),
+        ('Home In-game Plyr 2-Number', 270, 2),
+        ('Home In-game Plyr 2-User Defined 1', 272, 2),
+        ('Home In-game Plyr 2-User Defined 2', 274, 2),
+        ('Home In-game Plyr 3-Status', 276, 1),
+        ('Home In-game Plyr 3-Number', 277, 2),
+        ('Home In-game Plyr 3-User Defined 1', 279, 2),
+        ('Home In-game Plyr 3-User Defined 2', 281, 2),
+        ('Home In-game Plyr 4-Status', 283, 1),
+        ('Home In-game Plyr 4-Number', 284, 2),
+        ('Home In-game Plyr 4-User Defined 1', 286, 2),
+        ('Home In-game Plyr 4-User Defined 2', 288, 2),
+        ('Home In-game Plyr 5-Status', 290, 1),
+        ('Home In-game Plyr 5-Number', 291, 2),
+        ('Home In-game Plyr 5-User Defined 1', 293, 2),
+        ('Home In-game Plyr 5-User Defined 2', 295, 2),
+        ('Home In-game Plyr 6-Status', 297, 1),
+        ('Home In-game Plyr 6-Number', 298, 2),
+        ('Home In-game Plyr 6-User Defined 1', 300, 2),
+        ('Home In-game Plyr 6-User Defined 2', 302, 2),
+        ('Home Roster Plyr 1-Status', 304, 1),
+        ('Home Roster Plyr 1-Number', 305, 2),
+        ('Home Roster Plyr 1-User Defined 1', 307, 2),
+        ('Home Roster Plyr 1-User Defined 2', 309, 2),
+        ('Home Roster Plyr 2-Status', 311, 1),
+        ('Home Roster Plyr 2-Number', 312, 2),
+        ('Home Roster Plyr 2-User Defined 1', 314, 2),
+        ('Home Roster Plyr 2-User Defined 2', 316, 2),
+        ('Home Roster Plyr 3-Status', 318, 1),
+        ('Home Roster Plyr 3-Number', 319, 2),
+        ('Home Roster Plyr 3-User Defined 1', 321, 2),
+        ('Home Roster Plyr 3-User Defined 2', 323, 2),
+        ('Home Roster Plyr 4-Status', 325, 1),
+        ('Home Roster Plyr 4-Number', 326, 2),
+        ('Home Roster Plyr 4-User Defined 1', 328, 2),
+        ('Home Roster Plyr 4-User Defined 2', 330, 2),
+        ('Home Roster Plyr 5-Status', 332, 1),
+        ('Home Roster Plyr 5-Number', 333, 2),
+        ('Home Roster Plyr 5-User Defined 1', 335, 2),
+        ('Home Roster Plyr 5-User Defined 2', 337, 2),
+        ('Home Roster Plyr 6-Status', 339, 1),
+        ('Home Roster Plyr 6-Number', 340, 2),
+        ('Home Roster Plyr 6-User Defined 1', 342, 2),
+        ('Home Roster Plyr 6-User Defined 2', 344, 2),
+        ('Home Roster Plyr 7-Status', 346, 1),
+        ('Home Roster Plyr 7-Number', 347, 2),
+        ('Home Roster Plyr 7-User Defined 1', 349, 2),
+        ('Home Roster Plyr 7-User Defined 2', 351, 2),
+        ('Home Roster Plyr 8-Status', 353, 1),
+        ('Home Roster Plyr 8-Number', 354, 2),
+        ('Home Roster Plyr 8-User Defined 1', 356, 2),
+        ('Home Roster Plyr 8-User Defined 2', 358, 2),
+        ('Home Roster Plyr 9-Status', 360, 1),
+        ('Home Roster Plyr 9-Number', 361, 2),
+        ('Home Roster Plyr 9-User Defined 1', 363, 2),
+        ('Home Roster Plyr 9-User Defined 2', 365, 2),
+        ('Home Roster Plyr 10-Status', 367, 1),
+        ('Home Roster Plyr 10-Number', 368, 2),
+        ('Home Roster Plyr 10-User Defined 1', 370, 2),
+        ('Home Roster Plyr 10-User Defined 2', 372, 2),
+        ('Home Roster Plyr 11-Status', 374, 1),
+        ('Home Roster Plyr 11-Number', 375, 2),
+        ('Home Roster Plyr 11-User Defined 1', 377, 2),
+        ('Home Roster Plyr 11-User Defined 2', 379, 2),
+        ('Home Roster Plyr 12-Status', 381, 1),
+        ('Home Roster Plyr 12-Number', 382, 2),
+        ('Home Roster Plyr 12-User Defined 1', 384, 2),
+        ('Home Roster Plyr 12-User Defined 2', 386, 2),
+        ('Home Roster Plyr 13-Status', 388, 1),
+        ('Home Roster Plyr 13-Number', 389, 2),
+        ('Home Roster Plyr 13-User Defined 1', 391, 2),
+        ('Home Roster Plyr 13-User Defined 2', 393, 2),
+        ('Home Roster Plyr 14-Status', 395, 1),
+        ('Home Roster Plyr 14-Number', 396, 2),
+        ('Home Roster Plyr 14-User Defined 1', 398, 2),
+        ('Home Roster Plyr 14-User Defined 2', 400, 2),
+        ('Home Roster Plyr 15-Status', 402, 1),
+        ('Home Roster Plyr 15-Number', 403, 2),
+        ('Home Roster Plyr 15-User Defined 1', 405, 2),
+        ('Home Roster Plyr 15-User Defined 2', 407, 2),
+        ('Home Aces', 409, 4),
+        ('Home Kills', 413, 4),
+        ('Home Blocks', 417, 4),
+        ('Home Digs', 421, 4),
+        ('Home Total Hustle', 425, 4),
+        ('Guest In-game Plyr 1-Status', 429, 1),
+        ('Guest In-game Plyr 1-Number', 430, 2),
+        ('Guest In-game Plyr 1-User Defined 1', 432, 2),
+        ('Guest In-game Plyr 1-User Defined 2', 434, 2),
+        ('Guest In-game Plyr 2-Status', 436, 1),
+        ('Guest In-game Plyr 2-Number', 437, 2),
+        ('Guest In-game Plyr 2-User Defined 1', 439, 2),
+        ('Guest In-game Plyr 2-User Defined 2', 441, 2),
+        ('Guest In-game Plyr 3-Status', 443, 1),
+        ('Guest In-game Plyr 3-Number', 444, 2),
+        ('Guest In-game Plyr 3-User Defined 1', 446, 2),
+        ('Guest In-game Plyr 3-User Defined 2', 448, 2),
+        ('Guest In-game Plyr 4-Status', 450, 1),
+        ('Guest In-game Plyr 4-Number', 451, 2),
+        ('Guest In-game Plyr 4-User Defined 1', 453, 2),
+        ('Guest In-game Plyr 4-User Defined 2', 455, 2),
+        ('Guest In-game Plyr 5-Status', 457, 1),
+        ('Guest In-game Plyr 5-Number', 458, 2),
+        ('Guest In-game Plyr 5-User Defined 1', 460, 2),
+        ('Guest In-game Plyr 5-User Defined 2', 462, 2),
+        ('Guest In-game Plyr 6-Status', 464, 1),
+        ('Guest In-game Plyr 6-Number', 465, 2),
+        ('Guest In-game Plyr 6-User Defined 1', 467, 2),
+        ('Guest In-game Plyr 6-User Defined 2', 469, 2),
+        ('Guest Roster Plyr 1-Status', 471, 1),
+        ('Guest Roster Plyr 1-Number', 472, 2),
+        ('Guest Roster Plyr 1-User Defined 1', 474, 2),
+        ('Guest Roster Plyr 1-User Defined 2', 476, 2),
+        ('Guest Roster Plyr 2-Status', 478, 1),
+        ('Guest Roster Plyr 2-Number', 479, 2),
+        ('Guest Roster Plyr 2-User Defined 1', 481, 2),
+        ('Guest Roster Plyr 2-User Defined 2', 483, 2),
+        ('Guest Roster Plyr 3-Status', 485, 1),
+        ('Guest Roster Plyr 3-Number', 486, 2),
+        ('Guest Roster Plyr 3-User Defined 1', 488, 2),
+        ('Guest Roster Plyr 3-User Defined 2', 490, 2),
+        ('Guest Roster Plyr 4-Status', 492, 1),
+        ('Guest Roster Plyr 4-Number', 493, 2),
+        ('Guest Roster Plyr 4-User Defined 1', 495, 2),
+        ('Guest Roster Plyr 4-User Defined 2', 497, 2),
+        ('Guest Roster Plyr 5-Status', 499, 1),
+        ('Guest Roster Plyr 5-Number', 500, 2),
+        ('Guest Roster Plyr 5-User Defined 1', 502, 2),
+        ('Guest Roster Plyr 5-User Defined 2', 504, 2),
+        ('Guest Roster Plyr 6-Status', 506, 1),
+        ('Guest Roster Plyr 6-Number', 507, 2),
+        ('Guest Roster Plyr 6-User Defined 1', 509, 2),
+        ('Guest Roster Plyr 6-User Defined 2', 511, 2),
+        ('Guest Roster Plyr 7-Status', 513, 1),
+        ('Guest Roster Plyr 7-Number', 514, 2),
+        ('Guest Roster Plyr 7-User Defined 1', 516, 2),
+        ('Guest Roster Plyr 7-User Defined 2', 518, 2),
+        ('Guest Roster Plyr 8-Status', 520, 1),
+        ('Guest Roster Plyr 8-Number', 521, 2),
+        ('Guest Roster Plyr 8-User Defined 1', 523, 2),
+        ('Guest Roster Plyr 8-User Defined 2', 525, 2),
+        ('Guest Roster Plyr 9-Status', 527, 1),
+        ('Guest Roster Plyr 9-Number', 528, 2),
+        ('Guest Roster Plyr 9-User Defined 1', 530, 2),
+        ('Guest Roster Plyr 9-User Defined 2', 532, 2),
+        ('Guest Roster Plyr 10-Status', 534, 1),
+        ('Guest Roster Plyr 10-Number', 535, 2),
+        ('Guest Roster Plyr 10-User Defined 1', 537, 2),
+        ('Guest Roster Plyr 10-User Defined 2', 539, 2),
+        ('Guest Roster Plyr 11-Status', 541, 1),
+        ('Guest Roster Plyr 11-Number', 542, 2),
+        ('Guest Roster Plyr 11-User Defined 1', 544, 2),
+        ('Guest Roster Plyr 11-User Defined 2', 546, 2),
+        ('Guest Roster Plyr 12-Status', 548, 1),
+        ('Guest Roster Plyr 12-Number', 549, 2),
+        ('Guest Roster Plyr 12-User Defined 1', 551, 2),
+        ('Guest Roster Plyr 12-User Defined 2', 553, 2),
+        ('Guest Roster Plyr 13-Status', 555, 1),
+        ('Guest Roster Plyr 13-Number', 556, 2),
+        ('Guest Roster Plyr 13-User Defined 1', 558, 2),
+        ('Guest Roster Plyr 13-User Defined 2', 560, 2),
+        ('Guest Roster Plyr 14-Status', 562, 1),
+        ('Guest Roster Plyr 14-Number', 563, 2),
+        ('Guest Roster Plyr 14-User Defined 1', 565, 2),
+        ('Guest Roster Plyr 14-User Defined 2', 567, 2),
+        ('Guest Roster Plyr 15-Status', 569, 1),
+        ('Guest Roster Plyr 15-Number', 570, 2),
+        ('Guest Roster Plyr 15-User Defined 1', 572, 2),
+        ('Guest Roster Plyr 15-User Defined 2', 574, 2),
+        ('Guest Aces', 576, 4),
+        ('Guest Kills', 580, 4),
+        ('Guest Blocks', 584, 4),
+        ('Guest Digs', 588, 4),
+        ('Guest Total Hustle', 592, 4),
+    )),
+    'water polo': (297, (
+        ('Main Clock Time (mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (mm:ss.t)', 6, 8),
+        ('Main Clock/Time Out/TOD (mm:ss/ss.t)', 14, 5),
+        ('Main Clock/Time Out/TOD (mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Period', 142, 2),
+        ('Period Text', 144, 4),
+        ('Period Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Shot Clock Time (mm:ss)', 201, 8),
+        ('Shot Clock Horn', 209, 1),
+        ('Inverse Time Clock (mm:ss)', 210, 8),
+        ('Inverse/Main/Time Out/TOD (mm:ss)', 218, 8),
+        ('Home Player #1-Number', 226, 2),
+        ('Home Player #1-Penalty Time (mm:ss)', 228, 8),
+        ('Home Player #1-Penalty Number', 236, 2),
+        ('Home Player #2-Number', 238, 2),
+        ('Home Player #2-Penalty Time (mm:ss)', 240, 8),
+        ('Home Player #2-Penalty Number', 248, 2),
+        ('Home Player #3-Number', 250, 2),
+        ('Home Player #3-Penalty Time (mm:ss)', 252, 8),
+        ('Home Player #3-Penalty Number', 260, 2),
+        ('Guest Player #1-Number', 262, 2),
+        ('Guest Player #1-Penalty Time (mm:ss)', 264, 8),
+        ('Guest Player #1-Penalty Number', 272, 2),
+        ('Guest Player #2-Number', 274, 2),
+        ('Guest Player #2-Penalty Time (mm:ss)', 276, 8),
+        ('Guest Player #2-Penalty Number', 284, 2),
+        ('Guest Player #3-Number', 286, 2),
+        ('Guest Player #3-Penalty Time (mm:ss)', 288, 8),
+        ('Guest Player #3-Penalty Number', 296, 2),
+    )),
+    'wrestling': (355, (
+        ('Main Clock Time (mm:ss/ss.t)', 1, 5),
+        ('Main Clock Time (mm:ss.t)', 6, 8),
+        ('Main/Blood/Injury/TOD (mm:ss/ss.t)', 14, 5),
+        ('Main/Blood/Injury/TOD (mm:ss.t)', 19, 8),
+        ('Main Clock =0', 27, 1),
+        ('Main Clock Stopped', 28, 1),
+        ('Main Clock/Time Out Horn', 29, 1),
+        ('Main Clock Horn', 30, 1),
+        ('Time Out Horn', 31, 1),
+        ('Time Out Time (mm:ss)', 32, 8),
+        ('Time of Day (hh:mm:ss)', 40, 8),
+        ('Home Team Name', 48, 20),
+        ('Guest Team Name', 68, 20),
+        ('Home Team Abbreviation', 88, 10),
+        ('Guest Team Abbreviation', 98, 10),
+        ('Home Team Score', 108, 4),
+        ('Guest Team Score', 112, 4),
+        ('Home Time Outs Left - Full', 116, 2),
+        ('Home Time Outs Left - Partial', 118, 2),
+        ('Home Time Outs Left - Television', 120, 2),
+        ('Home Time Outs Left - Total', 122, 2),
+        ('Guest Time Outs Left - Full', 124, 2),
+        ('Guest Time Outs Left - Partial', 126, 2),
+        ('Guest Time Outs Left - Television', 128, 2),
+        ('Guest Time Outs Left - Total', 130, 2),
+        ('Home Time Out Indicator', 132, 1),
+        ('Home Time Out Text', 133, 4),
+        ('Guest Time Out Indicator', 137, 1),
+        ('Guest Time Out Text', 138, 4),
+        ('Period', 142, 2),
+        ('Period Text', 144, 4),
+        ('Period Description', 148, 12),
+        ('Internal Relay', 160, 1),
+        ('Ad Panel / Caption Power', 161, 1),
+        ('Ad Panel / Caption #1', 162, 1),
+        ('Ad Panel / Caption #2', 163, 1),
+        ('Ad Panel / Caption #3', 164, 1),
+        ('Ad Panel / Caption #4', 165, 1),
+        ('Reserved for Future Use', 166, 35),
+        ('Advantage Time (mm:ss)', 201, 8),
+        ('Home Advantage Time (mm:ss)', 209, 8),
+        ('Guest Advantage Time (mm:ss)', 217, 8),
+        ('Home Blood Time (mm:ss)', 225, 8),
+        ('Home Injury Time (mm:ss)', 233, 8),
+        ('Guest Blood Time (mm:ss)', 241, 8),
+        ('Guest Injury Time (mm:ss)', 249, 8),
+        ('Home Advantage Indicator', 257, 1),
+        ('Home Advantage Arrow', 258, 1),
+        ('Home Advantage Text', 259, 9),
+        ('Guest Advantage Indicator', 268, 1),
+        ('Guest Advantage Arrow', 269, 1),
+        ('Guest Advantage Text', 270, 9),
+        ('Home Match Score', 279, 2),
+        ('Guest Match Score', 281, 2),
+        ('Match Number', 283, 3),
+        ('Team Score/Advan Time (hh gg/mm:ss)', 286, 8),
+        ('Home Bonus Indicator', 294, 1),
+        ('Guest Bonus Indicator', 295, 1),
+        ('Class 1 - Home Points', 296, 1),
+        ('Class 1 - Guest Points', 297, 1),
+        ('Class 1 - Weight Class', 298, 3),
+        ('Class 2 - Home Points', 301, 1),
+        ('Class 2 - Guest Points', 302, 1),
+        ('Class 2 - Weight Class', 303, 3),
+        ('Class 3 - Home Points', 306, 1),
+        ('Class 3 - Guest Points', 307, 1),
+        ('Class 3 - Weight Class', 308, 3),
+        ('Class 4 - Home Points', 311, 1),
+        ('Class 4 - Guest Points', 312, 1),
+        ('Class 4 - Weight Class', 313, 3),
+        ('Class 5 - Home Points', 316, 1),
+        ('Class 5 - Guest Points', 317, 1),
+        ('Class 5 - Weight Class', 318, 3),
+        ('Class 6 - Home Points', 321, 1),
+        ('Class 6 - Guest Points', 322, 1),
+        ('Class 6 - Weight Class', 323, 3),
+        ('Class 7 - Home Points', 326, 1),
+        ('Class 7 - Guest Points', 327, 1),
+        ('Class 7 - Weight Class', 328, 3),
+        ('Class 8 - Home Points', 331, 1),
+        ('Class 8 - Guest Points', 332, 1),
+        ('Class 8 - Weight Class', 333, 3),
+        ('Class 9 - Home Points', 336, 1),
+        ('Class 9 - Guest Points', 337, 1),
+        ('Class 9 - Weight Class', 338, 3),
+        ('Class 10 - Home Points', 341, 1),
+        ('Class 10 - Guest Points', 342, 1),
+        ('Class 10 - Weight Class', 343, 3),
+        ('Class 11 - Home Points', 346, 1),
+        ('Class 11 - Guest Points', 347, 1),
+        ('Class 11 - Weight Class', 348, 3),
+        ('Class 12 - Home Points', 351, 1),
+        ('Class 12 - Guest Points', 352, 1),
+        ('Class 12 - Weight Class', 353, 3),
+    ))
+}
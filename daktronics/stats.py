@@ -0,0 +1,156 @@
+"""Counters and latency histograms for the RTD pipeline.
+
+A ``Stats`` object collects named counters (frames, bytes, rejected frames,
+export errors, ...) and named ``LatencyHistogram``s of nanosecond durations.
+Hand one to ``Daktronics.stats`` (and to whatever consumes the board) to see
+where the time goes::
+
+    stats = Stats()
+    dak.stats = stats
+    ...
+    print(stats.snapshot()['latency_us']['apply'])
+    stats.dump('scoreboard_stats.json')
+
+Nothing is recorded unless a ``Stats`` is attached, and recording costs a
+couple of clock reads and a list increment.
+"""
+
+import json
+import os
+import time
+from collections import Counter
+
+
+class LatencyHistogram(object):
+    """Log-linear histogram of durations in nanoseconds, in the style of HdrHistogram.
+
+    Values below 64 ns are counted exactly. Larger values fall into 32
+    linear buckets per power of two, so every value is kept to within
+    about 3%, from nanoseconds up to years, in a fixed table of 2048
+    counts. Percentiles report the top of their bucket, never less than
+    the true value.
+    """
+
+    SUB_BITS = 6
+    HALF = 1 << (SUB_BITS - 1)
+
+    def __init__(self):
+        self.counts = [0] * 2048
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, value):
+        if value < 0:
+            value = 0
+        shift = value.bit_length() - self.SUB_BITS
+        if shift <= 0:
+            index = value
+        else:
+            index = (shift << (self.SUB_BITS - 1)) + (value >> shift)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if self.min is None or value < self.min:
+            self.min = value
+
+    def bucket_top(self, index):
+        """Highest value that lands in bucket ``index``."""
+        if index < 2 * self.HALF:
+            return index
+        shift = (index >> (self.SUB_BITS - 1)) - 1
+        top = index - (shift << (self.SUB_BITS - 1))
+        return ((top + 1) << shift) - 1
+
+    def percentile(self, percent):
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.bucket_top(index), self.max)
+        return self.max
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+
+    def summary(self, unit=1000):
+        """Count, min, mean, percentiles and max, in ``unit`` nanoseconds (default: us)."""
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'min': self.min / unit,
+            'mean': self.total / self.count / unit,
+            'p50': self.percentile(50) / unit,
+            'p90': self.percentile(90) / unit,
+            'p99': self.percentile(99) / unit,
+            'p99.9': self.percentile(99.9) / unit,
+            'max': self.max / unit,
+        }
+
+
+class Stats(object):
+    """Named counters and latency histograms for one pipeline.
+
+    Updates are not locked. Two threads recording into the same histogram
+    at the same instant can lose a count, which does not matter for
+    monitoring and keeps recording cheap.
+    """
+
+    def __init__(self):
+        self.counters = Counter()
+        self.histograms = {}
+        self.started = time.time()
+
+    def histogram(self, name):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = LatencyHistogram()
+        return histogram
+
+    def record(self, name, nanoseconds):
+        self.histogram(name).record(nanoseconds)
+
+    def incr(self, name, value=1):
+        self.counters[name] += value
+
+    def reset(self):
+        self.counters = Counter()
+        self.histograms = {}
+        self.started = time.time()
+
+    def snapshot(self):
+        """Plain-dict view of everything recorded so far (latencies in microseconds)."""
+        return {
+            'started': self.started,
+            'uptime_s': time.time() - self.started,
+            'counters': dict(self.counters),
+            'latency_us': {name: histogram.summary()
+                           for name, histogram in sorted(self.histograms.items())},
+        }
+
+    def dump(self, path):
+        """Write ``snapshot()`` to ``path`` as JSON; see ``write_snapshot``."""
+        write_snapshot(path, self.snapshot())
+
+
+def write_snapshot(path, snapshot):
+    """Write ``snapshot`` to ``path`` as JSON.
+
+    The file is replaced atomically, so a reader never sees half of it.
+    """
+    temp = f"{path}.tmp"
+    with open(temp, 'w') as f:
+        json.dump(snapshot, f, indent=2)
+    os.replace(temp, path)
@@ -0,0 +1,256 @@
+"""Synthetic Daktronics RTD traffic.
+
+``DakSynth`` keeps a board for any sport in ``SPORT_LAYOUTS`` and produces
+valid frames that change it the way a game does: a running main clock,
+occasional score changes, churn in the other fields, repeats of unchanged
+fields and periodic full-board refreshes. The same ``seed`` always gives
+the same traffic::
+
+    synth = DakSynth('basketball', rate=50, churn=0.3, burst=4, seed=1)
+    synth.write_capture('synthetic.dakcap', duration=600)
+
+The capture can then be played with ``capture.DakReplay``. Run the module
+to feed a live pipeline instead::
+
+    python -m daktronics.synth basketball --udp 21000 --rate 50
+    python -m daktronics.synth football --pty
+    python -m daktronics.synth hockey/lacrosse --capture hockey.dakcap --duration 3600
+"""
+
+import argparse
+import os
+import random
+import socket
+import sys
+import time
+
+from . import DAK_ENCODING, DAKUDP_IP, dak_frame
+from .capture import CaptureWriter
+from .sports import SPORT_LAYOUTS
+
+# Starting values for fields most sports share; everything else starts blank
+DEFAULT_VALUES = {
+    'Home Team Name': 'HOME',
+    'Guest Team Name': 'GUEST',
+    'Home Team Abbreviation': 'HOM',
+    'Guest Team Abbreviation': 'GST',
+    'Home Team Score': '0',
+    'Guest Team Score': '0',
+}
+
+
+class DakSynth(object):
+    """Board state and a frame schedule for one sport.
+
+    ``rate`` is the average number of frames per second. ``churn`` is the
+    chance (0 to 1) that a frame carries a new value for some field instead
+    of repeating an unchanged one; team names are left alone. Scores change
+    ``scoring`` times a minute on average. Frames go out in bursts of ``burst``
+    back-to-back frames, with exponentially distributed gaps between bursts
+    that keep the average rate. Every ``refresh`` seconds (0 for never) the
+    whole board is resent in ``chunk`` byte frames, as consoles do. The main
+    clock counts down ``period`` seconds and starts over.
+    """
+
+    def __init__(self, sport, rate=20.0, churn=0.2, scoring=4.0, burst=1, refresh=0.0,
+                 period=720, chunk=64, seed=None, values=None):
+        layout = SPORT_LAYOUTS[sport]
+        if isinstance(layout, dict):
+            raise ValueError(f"{sport} has no single board layout")
+        size, fields = layout
+        self.sport = sport
+        self.rate = rate
+        self.churn = churn
+        self.scoring = scoring
+        self.burst = max(1, int(burst))
+        self.refresh = refresh
+        self.period = period
+        self.chunk = chunk
+        self.random = random.Random(seed)
+        self.board = bytearray(b' ' * size)
+        self.fields = {name: (start - 1, length) for name, start, length in fields}
+        self.names = list(self.fields)
+
+        self.clock = next((name for name in self.fields if name.startswith('Main Clock Time')),
+                          next((name for name in self.fields if 'Clock' in name
+                                and self.fields[name][1] >= 4), None))
+        self.scores = [name for name in self.fields if name.endswith('Team Score')]
+        self.others = [name for name in self.fields
+                       if name != self.clock and name not in DEFAULT_VALUES
+                       and not name.startswith('Reserved')]
+        self.clock_text = None
+
+        for name, value in dict(DEFAULT_VALUES, **(values or {})).items():
+            if name in self.fields:
+                self.set(name, value)
+
+    def set(self, name, value):
+        """Put ``value`` in field ``name`` and return the frame that carries it.
+
+        Numbers are right-justified and text left-justified, padded with
+        spaces to the field width like a console does.
+        """
+        offset, length = self.fields[name]
+        value = str(value)
+        text = (value.rjust(length) if value.isdigit() else value.ljust(length))[:length]
+        text = text.encode(DAK_ENCODING)
+        self.board[offset:offset + length] = text
+        return dak_frame(offset, text)
+
+    def get(self, name):
+        offset, length = self.fields[name]
+        return self.board[offset:offset + length].decode(DAK_ENCODING).strip()
+
+    def repeat(self, name):
+        """Frame resending the current value of ``name`` unchanged."""
+        offset, length = self.fields[name]
+        return dak_frame(offset, bytes(self.board[offset:offset + length]))
+
+    def refresh_frames(self):
+        """Frames that carry the whole board, ``chunk`` bytes at a time."""
+        board = bytes(self.board)
+        return [dak_frame(offset, board[offset:offset + self.chunk])
+                for offset in range(0, len(board), self.chunk)]
+
+    def format_clock(self, remaining):
+        length = self.fields[self.clock][1]
+        minutes, seconds = divmod(remaining, 60)
+        if length >= 7:
+            return f"{int(minutes)}:{seconds:04.1f}"
+        if remaining >= 60:
+            return f"{int(minutes)}:{int(seconds):02d}"
+        return f"{remaining:.1f}"
+
+    def random_value(self, name):
+        length = self.fields[name][1]
+        current = self.get(name)
+        if not current or current.isdigit():
+            return str(self.random.randrange(10 ** min(length, 3)))
+        letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+        return ''.join(self.random.choice(letters) for _ in range(self.random.randint(1, length)))
+
+    def next_frame(self, now):
+        """The frame a console would send at ``now`` seconds into the game."""
+        if self.clock:
+            # Tenths of a second, counting down and starting over each period
+            remaining = self.period - int(now * 10) % int(self.period * 10) / 10
+            text = self.format_clock(remaining)
+            if text != self.clock_text:
+                self.clock_text = text
+                return self.set(self.clock, text)
+
+        rng = self.random
+        if self.scores and rng.random() < self.scoring / 60 / self.rate:
+            name = rng.choice(self.scores)
+            return self.set(name, int(self.get(name) or 0) + rng.choice((1, 2, 3)))
+        if self.others and rng.random() < self.churn:
+            name = rng.choice(self.others)
+            return self.set(name, self.random_value(name))
+        return self.repeat(rng.choice(self.names))
+
+    def frames(self, duration=None, count=None):
+        """Yield ``(seconds, frame)`` pairs from the start of the game.
+
+        Stops after ``duration`` seconds or ``count`` frames, whichever comes
+        first; runs forever if neither is given.
+        """
+        gap = self.burst / self.rate
+        now = 0.0
+        sent = 0
+        # Start with the whole board so a receiver knows the starting state
+        next_refresh = 0.0
+        while duration is None or now < duration:
+            if next_refresh is not None and now >= next_refresh:
+                next_refresh = next_refresh + self.refresh if self.refresh else None
+                burst = self.refresh_frames()
+            else:
+                burst = [self.next_frame(now) for _ in range(self.burst)]
+            for frame in burst:
+                if count is not None and sent >= count:
+                    return
+                yield now, frame
+                sent += 1
+            now += self.random.expovariate(1 / gap)
+
+    def write_capture(self, path, duration=None, count=None):
+        """Write the traffic to a capture file for ``DakReplay``. Returns the frame count."""
+        capture = CaptureWriter(path, max_bytes=0)
+        start = time.monotonic_ns()
+        frames = 0
+        for now, frame in self.frames(duration, count):
+            capture.write(frame, start + int(now * 1e9))
+            frames += 1
+        capture.close()
+        return frames
+
+    def play(self, send, duration=None, count=None, speed=1.0):
+        """Call ``send(frame)`` for each frame in real time (``speed`` 0: flat out)."""
+        start = time.monotonic()
+        for now, frame in self.frames(duration, count):
+            if speed:
+                delay = start + now / speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            send(frame)
+
+
+def udp_sender(port=21000, interface=''):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 1)
+    if interface:
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface))
+    address = (DAKUDP_IP, port)
+    return lambda frame: sock.sendto(frame, address)
+
+
+def pty_sender():
+    """Open a pseudo terminal, print the device to connect to and return a sender."""
+    import tty
+    master, slave = os.openpty()
+    tty.setraw(slave)
+    print(f"Serial device: {os.ttyname(slave)}", flush=True)
+    return lambda frame: os.write(master, frame)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic Daktronics RTD traffic")
+    parser.add_argument('sport', choices=sorted(name for name, layout in SPORT_LAYOUTS.items()
+                                                if not isinstance(layout, dict)))
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument('--udp', type=int, metavar='PORT', help="send to the RTD multicast group")
+    output.add_argument('--pty', action='store_true', help="write to a new pseudo terminal (POSIX)")
+    output.add_argument('--capture', metavar='PATH', help="write a capture file as fast as possible")
+    parser.add_argument('--interface', default='', help="local address to send multicast from")
+    parser.add_argument('--rate', type=float, default=20.0, help="frames per second (default: 20)")
+    parser.add_argument('--churn', type=float, default=0.2,
+                        help="chance a frame changes a field (default: 0.2)")
+    parser.add_argument('--scoring', type=float, default=4.0,
+                        help="score changes per minute (default: 4)")
+    parser.add_argument('--burst', type=int, default=1, help="frames per burst (default: 1)")
+    parser.add_argument('--refresh', type=float, default=0.0,
+                        help="seconds between full-board refreshes (default: never)")
+    parser.add_argument('--duration', type=float, help="seconds of traffic (default: forever)")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="playback speed for --udp/--pty, 0 for flat out (default: 1)")
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+
+    synth = DakSynth(args.sport, rate=args.rate, churn=args.churn, scoring=args.scoring, burst=args.burst,
+                     refresh=args.refresh, seed=args.seed)
+    if args.capture:
+        if args.duration is None:
+            parser.error("--capture needs --duration")
+        frames = synth.write_capture(args.capture, args.duration)
+        print(f"Wrote {frames} frames to {args.capture}")
+        return 0
+
+    send = udp_sender(args.udp, args.interface) if args.udp else pty_sender()
+    try:
+        synth.play(send, args.duration, speed=args.speed)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
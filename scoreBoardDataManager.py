@@ -1,15 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext, messagebox
 import json
-import csv
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import queue
 import threading
 from concurrent.futures import ThreadPoolExecutor
 import time
 from pathlib import Path
 from datetime import datetime
 import requests
+import scoreboard_outputs as outputs
 
 # Import serial port tools
 try:
@@ -20,19 +19,21 @@ except ImportError:
     SERIAL_AVAILABLE = False
     print("Warning: pyserial not found. Install with: pip install pyserial")
 
-# Import OBS WebSocket
-try:
-    import obsws_python as obs
-    OBS_AVAILABLE = True
+# OBS WebSocket is imported (optionally) by the outputs module
+from scoreboard_outputs import OBS_AVAILABLE
+if OBS_AVAILABLE:
     print("OBS WebSocket library loaded successfully")
-except ImportError as e:
-    OBS_AVAILABLE = False
-    print(f"OBS WebSocket not available: {e}")
+else:
+    print("OBS WebSocket not available")
     print("Install with: pip install obsws-python")
 
 # Import Daktronics
 try:
-    from daktronics import DakSerial, Daktronics, dakSports
+    from daktronics import DAKUDP_IP, DakSerial, DakTCP, DakUDP, Daktronics, dakSports, sport_fields
+    from daktronics.capture import DakReplay
+    from daktronics.stats import Stats
+    from daktronics.synth import DakSynth
+    from scoreboard_boards import merge_fields
     DAK_AVAILABLE = True
 except ImportError:
     DAK_AVAILABLE = False
@@ -40,6 +41,24 @@ except ImportError:
     print("Warning: daktronics module not found.")
 
 
+# Sample game shown by Load Demo Data; fields the sport lacks are skipped
+DEMO_VALUES = {
+    'Home Team Name': 'BULLDOGS',
+    'Guest Team Name': 'WILDCATS',
+    'Home Team Abbreviation': 'BDG',
+    'Guest Team Abbreviation': 'WLD',
+    'Home Team Score': '21',
+    'Guest Team Score': '17',
+    'Quarter Text': '3RD',
+    'Quarter': '3',
+    'Down': '2',
+    'To Go': '7',
+    'Ball On': '35',
+    'Home Time Outs Left - Total': '2',
+    'Guest Time Outs Left - Total': '3',
+}
+
+
 class ScoreboardDataManager:
     def __init__(self, root):
         self.root = root
@@ -51,6 +70,16 @@ class ScoreboardDataManager:
         
         # Threading for non-blocking API sends
         self.executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Per-stage latencies and counters, written to stats_file (if set) while listening
+        self.stats = Stats() if DAK_AVAILABLE else None
+        self.stats_file = ""
+        
+        # File outputs are rendered and written on their own thread, so a slow
+        # disk never holds up the listener; only the newest snapshot is kept
+        self.file_writer = outputs.FileWriter(done=self.file_written, stats=self.stats)
+        # API uploads reuse keep-alive connections instead of reconnecting each time
+        self.api_session = outputs.make_session()
         self.data_lock = threading.Lock()
         
         # Data variables
@@ -62,18 +91,39 @@ class ScoreboardDataManager:
         self.selected_format = tk.StringVar(value="JSON")
         self.selected_sport = tk.StringVar(value="football")
         self.selected_port = tk.StringVar(value="")
+        self.connection_type = tk.StringVar(value="Serial")
+        self.udp_port = tk.StringVar(value="21000")
+        self.udp_interface = tk.StringVar(value="")
+        self.tcp_host = tk.StringVar(value="")
+        self.tcp_port = tk.StringVar(value="4001")
+        self.replay_path = tk.StringVar(value="")
+        self.replay_speed = tk.StringVar(value="1")
+        self.verify_checksum = tk.BooleanVar(value=False)
         self.available_ports = []
         self.save_path = tk.StringVar(value="")
         self.api_url = tk.StringVar(value="")
+        self.api_gzip = tk.BooleanVar(value=False)
         self.obs_host = tk.StringVar(value="localhost")
         self.obs_port = tk.StringVar(value="4455")
         self.obs_password = tk.StringVar(value="")
         self.is_running = False
         self.dak = None
         self.dak_thread = None
+        self.stop_listening = threading.Event()  # Set to stop the current session's listener
         self.obs_client = None
         self.selected_fields_by_sport = {}  # Per-sport field selections
         self.all_available_fields = []  # All fields for current sport
+        self.active_order = []  # Fields the listener is currently extracting, in export order
+        self.active_fields = set()  # The same fields, for intersecting with changes
+        self.selection_changed = True  # Listener must re-extract every field
+        
+        # Plain copies of the options read on every packet, kept in sync by
+        # variable traces so the listener thread never calls into Tk
+        self.live_settings = {}
+        for name in ('update_on_change', 'auto_save_enabled', 'auto_save_interval',
+                     'selected_format', 'save_path', 'api_url', 'api_gzip',
+                     'obs_host', 'obs_port', 'obs_password'):
+            self.mirror_var(name)
         
         # Configure root grid
         self.root.rowconfigure(0, weight=1)
@@ -125,9 +175,28 @@ class ScoreboardDataManager:
         # Populate fields based on selected sport
         self.update_available_fields()
         
+        # Status messages from worker threads, shown by the main thread
+        self.status_queue = queue.Queue()
+        self.display_pending = False  # Set by the listener when current_data changes
+        self.poll_status()
+        
         # Save settings on close
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
+    def mirror_var(self, name):
+        """Copy the Tk variable ``self.<name>`` into ``self.live_settings`` on every write"""
+        var = getattr(self, name)
+        
+        def sync(*args):
+            try:
+                self.live_settings[name] = var.get()
+            except tk.TclError:
+                # Half-typed number in an entry; keep the last good value
+                pass
+        
+        var.trace_add('write', sync)
+        sync()
+    
     def setup_connection_controls(self, parent):
         connection_frame = ttk.LabelFrame(parent, text="Scoreboard Connection", padding="10")
         connection_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=5)
@@ -151,38 +220,92 @@ class ScoreboardDataManager:
         self.sport_combo.grid(row=0, column=1, sticky=tk.W, pady=2)
         self.sport_combo.bind('<<ComboboxSelected>>', self.on_sport_changed)
         
+        # Connection type (serial cable or All Sport CG multicast)
+        ttk.Label(connection_frame, text="Source:").grid(row=1, column=0, sticky=tk.W, pady=2)
+        self.connection_combo = ttk.Combobox(connection_frame, textvariable=self.connection_type,
+                                             values=["Serial", "UDP Multicast", "TCP (Device Server)",
+                                                     "Replay (Capture File)"],
+                                             state="readonly", width=23)
+        self.connection_combo.grid(row=1, column=1, sticky=tk.W, pady=2)
+        self.connection_combo.bind('<<ComboboxSelected>>', self.on_connection_type_changed)
+        
         # Serial port selection
-        ttk.Label(connection_frame, text="Serial Port:").grid(row=1, column=0, sticky=tk.W, pady=2)
+        self.port_label = ttk.Label(connection_frame, text="Serial Port:")
+        self.port_label.grid(row=2, column=0, sticky=tk.W, pady=2)
         
-        port_frame = ttk.Frame(connection_frame)
-        port_frame.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=2)
+        self.port_frame = ttk.Frame(connection_frame)
+        self.port_frame.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=2)
         
-        self.port_combo = ttk.Combobox(port_frame, textvariable=self.selected_port, 
+        self.port_combo = ttk.Combobox(self.port_frame, textvariable=self.selected_port, 
                                        width=25, state="readonly")
         self.port_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
         self.port_combo.bind('<<ComboboxSelected>>', self.on_port_selected)
         
-        self.refresh_btn = ttk.Button(port_frame, text="↻", command=self.scan_ports, width=3)
+        self.refresh_btn = ttk.Button(self.port_frame, text="↻", command=self.scan_ports, width=3)
         self.refresh_btn.pack(side=tk.LEFT, padx=2)
         
+        # UDP multicast settings (shown when UDP Multicast is selected)
+        self.udp_frame = ttk.Frame(connection_frame)
+        self.udp_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=2)
+        self.udp_frame.grid_remove()
+        
+        ttk.Label(self.udp_frame, text="UDP Port:").pack(side=tk.LEFT)
+        self.udp_port_entry = ttk.Entry(self.udp_frame, textvariable=self.udp_port, width=7)
+        self.udp_port_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.udp_frame, text="Interface:").pack(side=tk.LEFT)
+        self.udp_interface_entry = ttk.Entry(self.udp_frame, textvariable=self.udp_interface, width=15)
+        self.udp_interface_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Serial device server settings (shown when TCP is selected)
+        self.tcp_frame = ttk.Frame(connection_frame)
+        self.tcp_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=2)
+        self.tcp_frame.grid_remove()
+        
+        ttk.Label(self.tcp_frame, text="Host:").pack(side=tk.LEFT)
+        self.tcp_host_entry = ttk.Entry(self.tcp_frame, textvariable=self.tcp_host, width=15)
+        self.tcp_host_entry.pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.tcp_frame, text="Port:").pack(side=tk.LEFT)
+        self.tcp_port_entry = ttk.Entry(self.tcp_frame, textvariable=self.tcp_port, width=7)
+        self.tcp_port_entry.pack(side=tk.LEFT, padx=5)
+        
+        # Recorded capture playback (shown when Replay is selected)
+        self.replay_frame = ttk.Frame(connection_frame)
+        self.replay_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=2)
+        self.replay_frame.grid_remove()
+        
+        ttk.Label(self.replay_frame, text="File:").pack(side=tk.LEFT)
+        self.replay_path_entry = ttk.Entry(self.replay_frame, textvariable=self.replay_path, width=12)
+        self.replay_path_entry.pack(side=tk.LEFT, padx=2)
+        self.replay_browse_btn = ttk.Button(self.replay_frame, text="...", width=3,
+                                            command=self.browse_replay_file)
+        self.replay_browse_btn.pack(side=tk.LEFT)
+        ttk.Label(self.replay_frame, text="Speed:").pack(side=tk.LEFT, padx=(5, 0))
+        self.replay_speed_entry = ttk.Entry(self.replay_frame, textvariable=self.replay_speed, width=5)
+        self.replay_speed_entry.pack(side=tk.LEFT, padx=2)
+        
+        # Checksum verification (drops corrupt frames from noisy lines)
+        self.checksum_check = ttk.Checkbutton(connection_frame, text="Verify checksums",
+                                              variable=self.verify_checksum)
+        self.checksum_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=2)
+        
         # Connection status
-        ttk.Label(connection_frame, text="Status:").grid(row=2, column=0, sticky=tk.W, pady=2)
+        ttk.Label(connection_frame, text="Status:").grid(row=4, column=0, sticky=tk.W, pady=2)
         self.connection_status = ttk.Label(connection_frame, text="Disconnected", foreground="red")
-        self.connection_status.grid(row=2, column=1, sticky=tk.W, pady=2)
+        self.connection_status.grid(row=4, column=1, sticky=tk.W, pady=2)
         
         # Connect button
         self.connect_btn = ttk.Button(connection_frame, text="Connect", command=self.toggle_connection)
-        self.connect_btn.grid(row=3, column=0, columnspan=2, pady=5)
+        self.connect_btn.grid(row=5, column=0, columnspan=2, pady=5)
         self.connect_btn.config(state='disabled')
         
         # Status messages
         if not SERIAL_AVAILABLE:
             ttk.Label(connection_frame, text="PySerial not installed", 
-                     foreground="orange", wraplength=250).grid(row=4, column=0, columnspan=2)
+                     foreground="orange", wraplength=250).grid(row=6, column=0, columnspan=2)
             self.connect_btn.config(state='disabled')
         elif not DAK_AVAILABLE:
             ttk.Label(connection_frame, text="Daktronics module not available", 
-                     foreground="orange", wraplength=250).grid(row=4, column=0, columnspan=2)
+                     foreground="orange", wraplength=250).grid(row=6, column=0, columnspan=2)
         
     def setup_save_controls(self, parent):
         save_frame = ttk.LabelFrame(parent, text="Save Settings", padding="10")
@@ -215,6 +338,7 @@ class ScoreboardDataManager:
         ttk.Label(self.api_frame, text="API URL:").pack(side=tk.LEFT, padx=(0, 5))
         api_entry = ttk.Entry(self.api_frame, textvariable=self.api_url)
         api_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Checkbutton(self.api_frame, text="Gzip", variable=self.api_gzip).pack(side=tk.LEFT, padx=(5, 0))
         
         # OBS WebSocket settings (shown when OBS WebSocket is selected)
         self.obs_frame = ttk.LabelFrame(save_frame, text="OBS WebSocket Settings", padding="5")
@@ -360,9 +484,11 @@ class ScoreboardDataManager:
         sport = self.selected_sport.get()
 
         if DAK_AVAILABLE and sport in dakSports:
-            self.all_available_fields = [key for key in dakSports[sport].keys() if key != 'dakSize']
+            self.all_available_fields = sport_fields(sport)
         else:
             self.all_available_fields = []
+        # Output names for the sport, shared by every format and the previews
+        outputs.FIELD_NAMES.precompute(self.all_available_fields)
 
         # Initialize sport in dictionary if not present, select all fields by default
         if sport not in self.selected_fields_by_sport:
@@ -407,6 +533,7 @@ class ScoreboardDataManager:
         else:
             if field in self.selected_fields_by_sport[sport]:
                 self.selected_fields_by_sport[sport].remove(field)
+        self.selection_changed = True
 
         # Save settings
         self.save_settings()
@@ -444,6 +571,34 @@ class ScoreboardDataManager:
         
         self.update_preview()
     
+    def on_connection_type_changed(self, event=None):
+        """Called when the connection type changes"""
+        connection_type = self.connection_type.get()
+        
+        # Hide all source-specific frames first
+        self.port_label.grid_remove()
+        self.port_frame.grid_remove()
+        self.udp_frame.grid_remove()
+        self.tcp_frame.grid_remove()
+        self.replay_frame.grid_remove()
+        
+        if connection_type == "UDP Multicast":
+            self.udp_frame.grid()
+            if DAK_AVAILABLE:
+                self.connect_btn.config(state='normal')
+        elif connection_type == "TCP (Device Server)":
+            self.tcp_frame.grid()
+            if DAK_AVAILABLE:
+                self.connect_btn.config(state='normal')
+        elif connection_type == "Replay (Capture File)":
+            self.replay_frame.grid()
+            if DAK_AVAILABLE:
+                self.connect_btn.config(state='normal')
+        else:
+            self.port_label.grid()
+            self.port_frame.grid()
+            self.on_port_selected()
+    
     def scan_ports(self):
         """Scan for available serial ports"""
         if not SERIAL_AVAILABLE:
@@ -468,12 +623,11 @@ class ScoreboardDataManager:
             # Don't auto-select, user must choose
             self.port_combo.set("-- Select a serial port --")
             self.update_status(f"Found {len(self.available_ports)} serial port(s). Please select one.")
-            self.connect_btn.config(state='disabled')
         else:
             self.port_combo['values'] = ["No ports found"]
             self.port_combo.set("No ports found")
             self.update_status("No serial ports detected. Click refresh after connecting device.")
-            self.connect_btn.config(state='disabled')
+        self.on_connection_type_changed()
     
     def on_port_selected(self, event=None):
         """Called when user selects a port from dropdown"""
@@ -500,9 +654,11 @@ class ScoreboardDataManager:
             
     def start_connection(self):
         try:
+            connection_type = self.connection_type.get()
+            
             # Get the selected port device
             port_device = self.get_selected_port_device()
-            if not port_device:
+            if connection_type == "Serial" and not port_device:
                 messagebox.showerror("Connection Error", "Please select a valid serial port")
                 return
             
@@ -515,11 +671,39 @@ class ScoreboardDataManager:
             
             # Initialize Daktronics exactly like your example
             try:
-                from daktronics import DakSerial, Daktronics
-                # Pass port string directly to DakSerial
-                dak_serial = DakSerial(port_device)
+                if connection_type == "UDP Multicast":
+                    udp_port = int(self.udp_port.get())
+                    interface = self.udp_interface.get().strip()
+                    dak_source = DakUDP(udp_port, interface=interface)
+                    port_device = f"UDP {DAKUDP_IP}:{udp_port}"
+                    if interface:
+                        port_device += f" via {interface}"
+                elif connection_type == "TCP (Device Server)":
+                    tcp_host = self.tcp_host.get().strip()
+                    if not tcp_host:
+                        messagebox.showerror("Connection Error", "Please enter the device server host")
+                        return
+                    tcp_port = int(self.tcp_port.get())
+                    # Connects (and reconnects) in the background
+                    dak_source = DakTCP(tcp_host, tcp_port)
+                    port_device = f"TCP {tcp_host}:{tcp_port}"
+                elif connection_type == "Replay (Capture File)":
+                    replay_path = self.replay_path.get().strip()
+                    if not replay_path:
+                        messagebox.showerror("Connection Error", "Please select a capture file to replay")
+                        return
+                    # 1 = real time, 10 = ten times faster, 0 = as fast as possible
+                    replay_speed = float(self.replay_speed.get())
+                    dak_source = DakReplay(replay_path, replay_speed)
+                    port_device = f"{Path(replay_path).name} at {replay_speed:g}x"
+                else:
+                    # Pass port string directly to DakSerial
+                    dak_source = DakSerial(port_device)
                 # Create Daktronics object with sport string
-                self.dak = Daktronics(sport, dak_serial)
+                self.dak = Daktronics(sport, dak_source,
+                                      verify_checksum=self.verify_checksum.get())
+                self.stats.reset()
+                self.dak.stats = self.stats
                 
             except Exception as e:
                 messagebox.showerror("Connection Error", f"Could not initialize Daktronics: {str(e)}")
@@ -528,13 +712,30 @@ class ScoreboardDataManager:
             # Start listening thread
             self.is_running = True
             self.previous_data = {}
-            self.dak_thread = threading.Thread(target=self.listen_for_data, daemon=True)
+            self.current_data = {}
+            self.selection_changed = True
+            # Write every text file once per session, then only changed fields
+            self.file_writer.text_files.reset()
+            # Each session gets its own stop event and transport, so a listener
+            # still finishing a read after Stop can't pick up the next session
+            self.stop_listening = threading.Event()
+            self.dak_thread = threading.Thread(target=self.listen_for_data,
+                                               args=(self.dak, self.stop_listening), daemon=True)
             self.dak_thread.start()
             
             self.connection_status.config(text="Listening", foreground="green")
             self.connect_btn.config(text="Stop Listening")
             self.sport_combo.config(state='disabled')
+            self.connection_combo.config(state='disabled')
             self.port_combo.config(state='disabled')
+            self.udp_port_entry.config(state='disabled')
+            self.udp_interface_entry.config(state='disabled')
+            self.tcp_host_entry.config(state='disabled')
+            self.tcp_port_entry.config(state='disabled')
+            self.replay_path_entry.config(state='disabled')
+            self.replay_browse_btn.config(state='disabled')
+            self.replay_speed_entry.config(state='disabled')
+            self.checksum_check.config(state='disabled')
             self.refresh_btn.config(state='disabled')
             self.save_now_btn.config(state='normal')
             
@@ -546,6 +747,7 @@ class ScoreboardDataManager:
     
     def stop_connection(self):
         self.is_running = False
+        self.stop_listening.set()
         
         # Disconnect OBS if connected
         if self.obs_client:
@@ -558,92 +760,129 @@ class ScoreboardDataManager:
         self.connection_status.config(text="Disconnected", foreground="red")
         self.connect_btn.config(text="Connect")
         self.sport_combo.config(state='readonly')
+        self.connection_combo.config(state='readonly')
         self.port_combo.config(state='readonly')
+        self.udp_port_entry.config(state='normal')
+        self.udp_interface_entry.config(state='normal')
+        self.tcp_host_entry.config(state='normal')
+        self.tcp_port_entry.config(state='normal')
+        self.replay_path_entry.config(state='normal')
+        self.replay_browse_btn.config(state='normal')
+        self.replay_speed_entry.config(state='normal')
+        self.checksum_check.config(state='normal')
         self.refresh_btn.config(state='normal')
-        self.update_status("Stopped listening")
+        
+        rejected = sum(self.dak.rejected.values()) if self.dak else 0
+        if rejected:
+            self.update_status(f"Stopped listening ({rejected} corrupt frame(s) rejected)")
+        else:
+            self.update_status("Stopped listening")
             
-    def listen_for_data(self):
-        """Continuously call dak.update() and extract data"""
+    def listen_for_data(self, dak, stopping):
+        """Apply frames from ``dak`` as they arrive and extract data until ``stopping`` is set"""
         last_save_time = time.time()
+        live = self.live_settings
+        replay_finished = False
+        stats = self.stats
+        last_stats_time = time.time()
         
-        while self.is_running:
+        while not stopping.is_set():
             try:
-                # Call dak.update() to read from serial port
-                self.dak.update()
+                # Block until frames arrive (or the transport times out), then
+                # apply everything already buffered. No fixed polling delay.
+                changed = dak.update_many()
+                if not changed and not replay_finished and getattr(dak.dakrtd, 'finished', False):
+                    replay_finished = True
+                    self.update_status(f"Replay finished ({dak.dakrtd.frames} frames)")
                 
-                # Extract data from dak object using dictionary-style access
                 # Use lock for thread-safe access
+                started = time.perf_counter_ns()
                 with self.data_lock:
-                    self.current_data = {}
-
+                    if stopping.is_set():
+                        # Stopped during the read; the data may belong to a newer session now
+                        break
                     # Only include selected fields for current sport
-                    sport = self.selected_sport.get()
-                    fields_to_use = self.selected_fields_by_sport.get(sport, list(self.dak.sport.keys()))
+                    if self.selection_changed:
+                        # Field selection changed, rebuild everything once
+                        self.selection_changed = False
+                        sport = dak.sportName
+                        self.active_order = list(
+                            self.selected_fields_by_sport.get(sport, list(dak.slices)))
+                        self.active_fields = set(self.active_order)
+                        data = merge_fields(dak, {}, self.active_order, self.active_order) or {}
+                    else:
+                        # Re-extract only the selected fields this packet touched
+                        data = merge_fields(dak, self.current_data, changed & self.active_fields,
+                                            self.active_order)
 
-                    for key in fields_to_use:
-                        if key != 'dakSize' and key in self.dak.sport:
-                            # Access data using dak['fieldname']
-                            value = self.dak[key]
-                            if value and value.strip():
-                                self.current_data[key] = value.strip()
+                    data_changed = data is not None
+                    if data_changed:
+                        self.current_data = data
+                        # Redrawn by poll_status on the main thread
+                        self.display_pending = True
+                if changed:
+                    stats.record('extract', time.perf_counter_ns() - started)
                 
-                # Update display if we have data
+                # Export if we have data
                 if self.current_data:
-                    self.update_data_display()
-                    self.update_preview()
-                    
                     # Handle auto-update or update-on-change
-                    if self.update_on_change.get():
-                        if self.has_data_changed():
+                    if live['update_on_change']:
+                        if data_changed or not self.previous_data:
                             self.save_data()
-                            self.previous_data = dict(self.current_data)
-                    elif self.auto_save_enabled.get():
+                            self.previous_data = self.current_data
+                    elif live['auto_save_enabled']:
                         current_time = time.time()
-                        if current_time - last_save_time >= self.auto_save_interval.get():
+                        if current_time - last_save_time >= live['auto_save_interval']:
                             self.save_data()
                             last_save_time = current_time
-                
-                # Small delay to prevent overwhelming the CPU
-                time.sleep(0.05)
+
+                if self.stats_file and time.time() - last_stats_time >= 10:
+                    self.dump_stats()
+                    last_stats_time = time.time()
             except Exception as e:
+                if stopping.is_set():
+                    break
                 self.update_status(f"Read error: {str(e)}")
                 print(f"Error details: {e}")
-                time.sleep(1)
+                stopping.wait(1)
+        
+        # Release the serial port / socket so it can be reopened
+        close = getattr(dak.dakrtd, 'close', None)
+        if close:
+            close()
+        if self.stats_file:
+            self.dump_stats()
     
-    def has_data_changed(self):
-        """Check if any field value has changed from previous data"""
-        # If no previous data, consider it changed
-        if not self.previous_data:
-            return True
-        
-        # Check if any field is different
-        for key, value in self.current_data.items():
-            if key not in self.previous_data or self.previous_data[key] != value:
-                return True
-        
-        # Check if any field was removed
-        for key in self.previous_data:
-            if key not in self.current_data:
-                return True
-        
-        return False
+    def dump_stats(self):
+        """Write the latency and counter stats to the stats_file setting"""
+        try:
+            self.stats.dump(self.stats_file)
+        except OSError as e:
+            print(f"Could not write stats: {str(e)}")
     
     def load_demo_data(self):
         """Load demo data for testing without hardware"""
-        self.current_data = {
-            'Home Team Name': 'BULLDOGS',
-            'Guest Team Name': 'WILDCATS',
-            'Home Team Score': '21',
-            'Guest Team Score': '17',
-            'Main Clock Time [mm:ss.t]': '8:45.2',
-            'Quarter Text': '3RD',
-            'Quarter': '3',
-            'Down': '2',
-            'To Go': '7',
-            'Ball On': '35',
-            'Home Time Outs Left - Total': '2',
-            'Guest Time Outs Left - Total': '3',
-        }
+        if not DAK_AVAILABLE:
+            self.update_status("Daktronics module not available")
+            return
+        
+        # Run the demo values through real frames and the parser, so the keys
+        # always match the selected sport's layout and field selection
+        sport = self.selected_sport.get()
+        try:
+            synth = DakSynth(sport, values=DEMO_VALUES)
+        except ValueError as e:
+            self.update_status(f"No demo data: {str(e)}")
+            return
+        if synth.clock:
+            synth.set(synth.clock, synth.format_clock(8 * 60 + 45.2))
+        dak = Daktronics(sport, None)
+        for frame in synth.refresh_frames():
+            dak.apply(frame)
+        fields = self.selected_fields_by_sport.get(sport, list(dak.slices))
+        data = merge_fields(dak, {}, fields, fields) or {}
+        with self.data_lock:
+            self.current_data = data
         self.update_data_display()
         self.update_preview()
         self.save_now_btn.config(state='normal')
@@ -662,7 +901,7 @@ class ScoreboardDataManager:
         if not self.current_data:
             return
             
-        format_type = self.selected_format.get()
+        format_type = self.live_settings['selected_format']
         preview_content = ""
         
         try:
@@ -680,8 +919,7 @@ class ScoreboardDataManager:
                 preview_content = "OBS WebSocket Mode\n\n"
                 preview_content += "Data will be sent to OBS text sources:\n\n"
                 for key in list(self.current_data.keys())[:10]:
-                    safe_name = key.replace(' ', '_').replace('[', '').replace(']', '').replace('/', '_')
-                    preview_content += f"{safe_name}\n"
+                    preview_content += f"{outputs.FIELD_NAMES[key].obs}\n"
                 if len(self.current_data) > 10:
                     preview_content += f"... and {len(self.current_data) - 10} more fields"
                 
@@ -694,31 +932,11 @@ class ScoreboardDataManager:
             self.update_status(f"Preview error: {str(e)}")
             
     def format_as_xml(self, data):
-        root = ET.Element("ScoreboardData")
-        root.set("timestamp", datetime.now().isoformat())
-        
-        for key, value in data.items():
-            field = ET.SubElement(root, "Field")
-            field.set("name", key)
-            field.text = str(value)
-            
-        xml_str = ET.tostring(root, encoding='unicode')
-        dom = minidom.parseString(xml_str)
-        return dom.toprettyxml(indent="  ")
+        return outputs.format_as_xml(data)
         
     def format_as_vmix_xml(self, data):
         """Format for vMix DataSource"""
-        root = ET.Element("vmix")
-        
-        for key, value in data.items():
-            # Create vMix-friendly field names
-            safe_key = key.replace(' ', '_').replace('[', '').replace(']', '').replace('/', '_')
-            field = ET.SubElement(root, safe_key)
-            field.text = str(value)
-            
-        xml_str = ET.tostring(root, encoding='unicode')
-        dom = minidom.parseString(xml_str)
-        return dom.toprettyxml(indent="  ")
+        return outputs.format_as_vmix_xml(data)
         
     def format_as_csv_preview(self, data):
         preview = "Field,Value\n"
@@ -729,12 +947,19 @@ class ScoreboardDataManager:
     def format_as_text_preview(self, data):
         preview = "Each field will be saved as a separate .txt file:\n\n"
         for key in list(data.keys())[:5]:
-            safe_name = key.replace(' ', '_').replace('[', '').replace(']', '')
-            preview += f"{safe_name}.txt\n"
+            preview += f"{outputs.FIELD_NAMES[key].filename}\n"
         if len(data) > 5:
             preview += f"... and {len(data) - 5} more files"
         return preview
         
+    def browse_replay_file(self):
+        filename = filedialog.askopenfilename(
+            title="Select capture file to replay",
+            filetypes=[("Scoreboard captures", "*.dakcap"), ("All files", "*.*")]
+        )
+        if filename:
+            self.replay_path.set(filename)
+        
     def browse_save_location(self):
         format_type = self.selected_format.get()
         
@@ -766,11 +991,12 @@ class ScoreboardDataManager:
             self.update_status("No data to save")
             return
         
-        format_type = self.selected_format.get()
+        live = self.live_settings
+        format_type = live['selected_format']
         
         # Handle API upload for JSON (API) - SUBMIT TO THREAD (non-blocking)
         if format_type == "JSON (API)":
-            if not self.api_url.get():
+            if not live['api_url']:
                 self.update_status("Please enter an API URL")
                 return
             # Submit to thread pool instead of blocking
@@ -782,45 +1008,22 @@ class ScoreboardDataManager:
             return self.send_to_obs()
         
         # For file-based formats, check save path
-        if not self.save_path.get():
+        if not live['save_path']:
             self.update_status("Please select a save location")
             return
             
-        try:
-            if format_type == "JSON":
-                with open(self.save_path.get(), 'w') as f:
-                    json.dump(self.current_data, f, indent=2)
-                    
-            elif format_type == "XML":
-                xml_content = self.format_as_xml(self.current_data)
-                with open(self.save_path.get(), 'w') as f:
-                    f.write(xml_content)
-                    
-            elif format_type == "vMix XML":
-                xml_content = self.format_as_vmix_xml(self.current_data)
-                with open(self.save_path.get(), 'w') as f:
-                    f.write(xml_content)
-                    
-            elif format_type == "CSV":
-                with open(self.save_path.get(), 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(['Field', 'Value'])
-                    for key, value in self.current_data.items():
-                        writer.writerow([key, value])
-                        
-            elif format_type == "Text Files":
-                save_dir = Path(self.save_path.get())
-                save_dir.mkdir(exist_ok=True)
-                for key, value in self.current_data.items():
-                    safe_name = key.replace(' ', '_').replace('[', '').replace(']', '').replace('/', '_')
-                    file_path = save_dir / f"{safe_name}.txt"
-                    with open(file_path, 'w') as f:
-                        f.write(str(value))
-                        
-            self.update_status(f"Data saved successfully at {datetime.now().strftime('%H:%M:%S')}")
-            
-        except Exception as e:
-            self.update_status(f"Save error: {str(e)}")
+        # current_data is replaced, never modified, so it can be handed over as is
+        self.file_writer.submit(format_type, live['save_path'], self.current_data)
+    
+    def file_written(self, format_type, error, elapsed):
+        """Called on the file writer thread after each write"""
+        if error is not None:
+            self.stats.incr('export_errors')
+            self.update_status(f"Save error: {str(error)}")
+            return
+        self.stats.record(f"sink.{format_type}", elapsed)
+        self.stats.incr('exports')
+        self.update_status(f"Data saved successfully at {datetime.now().strftime('%H:%M:%S')}")
     
     def upload_to_api_async(self):
         """
@@ -839,23 +1042,27 @@ class ScoreboardDataManager:
                 data_to_send = dict(self.current_data)
             
             # Network operation happens WITHOUT lock (fast)
-            response = requests.put(
-                self.api_url.get(),
-                json=data_to_send,
-                timeout=5
-            )
+            started = time.perf_counter_ns()
+            response = outputs.upload_json(self.live_settings['api_url'], data_to_send,
+                                           session=self.api_session,
+                                           compress=self.live_settings['api_gzip'])
+            self.stats.record('sink.JSON (API)', time.perf_counter_ns() - started)
             
             if response.status_code in [200, 201, 204]:
+                self.stats.incr('exports')
                 self.update_status(f"API upload successful at {datetime.now().strftime('%H:%M:%S')}")
                 return True
             else:
+                self.stats.incr('export_errors')
                 self.update_status(f"API error: {response.status_code} - {response.text[:50]}")
                 return False
                 
         except requests.exceptions.Timeout:
+            self.stats.incr('export_errors')
             self.update_status("API upload timeout")
             return False
         except requests.exceptions.RequestException as e:
+            self.stats.incr('export_errors')
             self.update_status(f"API upload error: {str(e)}")
             return False
     
@@ -867,45 +1074,35 @@ class ScoreboardDataManager:
         return self.upload_to_api_async()
     
     def send_to_obs(self):
-        """Send data to OBS via WebSocket"""
+        """Send data to OBS via WebSocket (called from the listener thread, so no Tk calls)"""
         if not OBS_AVAILABLE:
-            self.update_status("OBS WebSocket library not installed")
-            messagebox.showerror("OBS Error", "Please install obsws-python: pip install obsws-python")
+            self.update_status("OBS WebSocket library not installed (pip install obsws-python)")
             return False
         
+        live = self.live_settings
         try:
             # Connect to OBS if not already connected
             if not self.obs_client:
                 try:
-                    port = int(self.obs_port.get())
-                    password = self.obs_password.get() if self.obs_password.get() else None
-                    self.obs_client = obs.ReqClient(host=self.obs_host.get(), port=port, password=password)
+                    self.obs_client = outputs.connect_obs(
+                        live['obs_host'], live['obs_port'], live['obs_password'])
                     self.update_status("Connected to OBS WebSocket")
                 except Exception as e:
+                    self.stats.incr('export_errors')
                     self.update_status(f"OBS connection error: {str(e)}")
-                    messagebox.showerror("OBS Connection Error", f"Could not connect to OBS:\n{str(e)}")
                     return False
             
             # Send each field as a text source update
-            for field_name, field_value in self.current_data.items():
-                try:
-                    # Create a safe source name from field name
-                    source_name = field_name.replace(' ', '_').replace('[', '').replace(']', '').replace('/', '_')
-                    
-                    # Try to update the text source
-                    self.obs_client.set_input_settings(
-                        source_name,
-                        {"text": str(field_value)},
-                        overlay=True
-                    )
-                except Exception as e:
-                    # Source might not exist, continue with others
-                    pass
+            started = time.perf_counter_ns()
+            outputs.send_to_obs(self.obs_client, self.current_data)
+            self.stats.record('sink.OBS WebSocket', time.perf_counter_ns() - started)
+            self.stats.incr('exports')
             
             self.update_status(f"Data sent to OBS at {datetime.now().strftime('%H:%M:%S')}")
             return True
             
         except Exception as e:
+            self.stats.incr('export_errors')
             self.update_status(f"OBS send error: {str(e)}")
             return False
             
@@ -968,9 +1165,31 @@ class ScoreboardDataManager:
         self.preview_text.config(state='disabled')
         
     def update_status(self, message):
+        if threading.current_thread() is not threading.main_thread():
+            # A Tk call from another thread waits for the main loop, which
+            # may itself be waiting for that thread; let the main loop show it
+            self.status_queue.put(message)
+            return
         self.status_bar.config(text=message)
         self.root.update_idletasks()
     
+    def poll_status(self):
+        """Show the newest status message posted by a worker thread and
+        redraw the data views if the listener has new data (at most 10 times a second)"""
+        message = None
+        try:
+            while True:
+                message = self.status_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if message is not None:
+            self.status_bar.config(text=message)
+        if self.display_pending:
+            self.display_pending = False
+            self.update_data_display()
+            self.update_preview()
+        self.root.after(100, self.poll_status)
+    
     def load_settings(self):
         """Load saved settings from file"""
         if self.settings_file.exists():
@@ -983,9 +1202,19 @@ class ScoreboardDataManager:
                 self.selected_sport.set(settings.get('sport', 'football'))
                 self.save_path.set(settings.get('save_path', ''))
                 self.api_url.set(settings.get('api_url', ''))
+                self.api_gzip.set(settings.get('api_gzip', False))
                 self.obs_host.set(settings.get('obs_host', 'localhost'))
                 self.obs_port.set(settings.get('obs_port', '4455'))
                 self.auto_save_interval.set(settings.get('auto_save_interval', 1.0))
+                self.verify_checksum.set(settings.get('verify_checksum', False))
+                self.connection_type.set(settings.get('connection_type', 'Serial'))
+                self.udp_port.set(settings.get('udp_port', '21000'))
+                self.udp_interface.set(settings.get('udp_interface', ''))
+                self.tcp_host.set(settings.get('tcp_host', ''))
+                self.tcp_port.set(settings.get('tcp_port', '4001'))
+                self.replay_path.set(settings.get('replay_path', ''))
+                self.replay_speed.set(settings.get('replay_speed', '1'))
+                self.stats_file = settings.get('stats_file', '')
 
                 # Load per-sport field selections (backward compatible)
                 if 'selected_fields_by_sport' in settings:
@@ -1009,9 +1238,19 @@ class ScoreboardDataManager:
                 'sport': self.selected_sport.get(),
                 'save_path': self.save_path.get(),
                 'api_url': self.api_url.get(),
+                'api_gzip': self.api_gzip.get(),
                 'obs_host': self.obs_host.get(),
                 'obs_port': self.obs_port.get(),
                 'auto_save_interval': self.auto_save_interval.get(),
+                'verify_checksum': self.verify_checksum.get(),
+                'connection_type': self.connection_type.get(),
+                'udp_port': self.udp_port.get(),
+                'udp_interface': self.udp_interface.get(),
+                'tcp_host': self.tcp_host.get(),
+                'tcp_port': self.tcp_port.get(),
+                'replay_path': self.replay_path.get(),
+                'replay_speed': self.replay_speed.get(),
+                'stats_file': self.stats_file,
                 'selected_fields_by_sport': self.selected_fields_by_sport
             }
             
@@ -1027,6 +1266,10 @@ class ScoreboardDataManager:
         if self.is_running:
             self.stop_connection()
         
+        # The last file write finishes on the writer thread after the window closes
+        self.file_writer.close(wait=False)
+        self.api_session.close()
+        
         # Save settings
         self.save_settings()
         
@@ -0,0 +1,312 @@
+"""Run several scoreboards in one process.
+
+Each ``Board`` has its own sport, transport, field selection and output
+sinks. A ``BoardManager`` reads every board on one asyncio event loop
+(see ``daktronics.aio``) and runs all exports on one shared thread pool::
+
+    manager = BoardManager([
+        Board("Court 1", "basketball", connection_type="UDP Multicast",
+              outputs=[{"output_format": "JSON", "save_path": "court1.json"}]),
+        Board("Court 2", "volleyball", connection_type="Serial", serial_port="/dev/ttyUSB0",
+              outputs=[{"output_format": "vMix XML", "save_path": "court2.xml"}]),
+    ])
+    manager.start()
+    ...
+    manager.stop()
+
+Board options use the same names as scoreboard_settings.json.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from daktronics import sport_fields
+from daktronics.capture import CaptureWriter
+from daktronics.stats import Stats, write_snapshot
+from daktronics.aio import open_replay_feed, open_serial_feed, open_tcp_feed, open_udp_feed
+from scoreboard_outputs import FIELD_NAMES, OutputSink
+
+
+def merge_fields(dak, current_data, fields, order=None):
+    """Return ``current_data`` with the stripped values of ``fields`` re-read from ``dak``.
+
+    Returns None when none of them changed. ``current_data`` itself is never
+    modified, so other threads can keep reading it while a new dict is built.
+    With ``order`` (the selected fields, in the order they are exported) the
+    keys of the result follow it, however the changes arrived.
+    """
+    data = None
+    added = False
+    for key, value in dak.extract(fields).items():
+        value = value.strip()
+        if value == current_data.get(key, ''):
+            continue
+        if data is None:
+            data = dict(current_data)
+        if value:
+            added = added or key not in data
+            data[key] = value
+        else:
+            data.pop(key, None)
+    if added and order is not None:
+        # Updates and removals keep their place; only a new key needs sorting in
+        data = {key: data[key] for key in order if key in data}
+    return data
+
+
+class Board(object):
+    """One scoreboard: a sport, a transport, the selected fields and its sinks."""
+
+    def __init__(self, name, sport, connection_type="Serial", serial_port="",
+                 udp_port=21000, udp_interface="", tcp_host="", tcp_port=4001,
+                 verify_checksum=False, fields=None, update_on_change=True,
+                 auto_save_interval=1.0, outputs=(), capture_path="",
+                 replay_path="", replay_speed=1.0):
+        self.name = name
+        self.sport = sport
+        self.connection_type = connection_type
+        self.serial_port = serial_port
+        self.udp_port = int(udp_port)
+        self.udp_interface = udp_interface
+        self.tcp_host = tcp_host
+        self.tcp_port = int(tcp_port)
+        self.replay_path = replay_path
+        self.replay_speed = float(replay_speed)
+        self.verify_checksum = verify_checksum
+        self.fields = list(fields) if fields else list(sport_fields(sport))
+        self.active_fields = set(self.fields)
+        FIELD_NAMES.precompute(sport_fields(sport))
+        self.update_on_change = update_on_change
+        self.auto_save_interval = float(auto_save_interval)
+        self.sinks = [sink if isinstance(sink, OutputSink) else OutputSink.from_settings(sink)
+                      for sink in outputs]
+        # Raw frames are recorded here across reconnects when capture_path is set
+        self.capture_path = capture_path
+        self.capture = None
+
+        self.feed = None
+        self.current_data = {}
+        self.exporting = False
+        self.export_pending = False
+        # When the oldest change not yet exported arrived (perf_counter_ns)
+        self.changed_at = None
+        self.stats = Stats()
+
+    @classmethod
+    def from_settings(cls, settings):
+        settings = dict(settings)
+        return cls(settings.pop('name'), settings.pop('sport'), **settings)
+
+    def describe_source(self):
+        if self.connection_type == "UDP Multicast":
+            return f"UDP :{self.udp_port}"
+        if self.connection_type == "TCP (Device Server)":
+            return f"TCP {self.tcp_host}:{self.tcp_port}"
+        if self.connection_type == "Replay (Capture File)":
+            return f"{self.replay_path} at {self.replay_speed:g}x"
+        return self.serial_port
+
+    async def open_feed(self):
+        if self.connection_type == "UDP Multicast":
+            feed = await open_udp_feed(self.sport, self.udp_port, self.verify_checksum,
+                                       interface=self.udp_interface)
+        elif self.connection_type == "TCP (Device Server)":
+            feed = await open_tcp_feed(self.sport, self.tcp_host, self.tcp_port,
+                                       self.verify_checksum)
+        elif self.connection_type == "Replay (Capture File)":
+            # Replays end; the manager's reconnect starts them over
+            feed = await open_replay_feed(self.sport, self.replay_path, self.replay_speed,
+                                          self.verify_checksum)
+        else:
+            feed = await open_serial_feed(self.sport, self.serial_port, self.verify_checksum)
+        feed.dak.stats = self.stats
+        if self.capture_path:
+            if self.capture is None:
+                self.capture = CaptureWriter(self.capture_path)
+            feed.capture = self.capture
+        return feed
+
+    def ingest(self, changed):
+        """Merge the selected fields out of ``changed``; True if the board's data changed."""
+        start = time.perf_counter_ns()
+        data = merge_fields(self.feed.dak, self.current_data, changed & self.active_fields, self.fields)
+        self.stats.record('extract', time.perf_counter_ns() - start)
+        if data is None:
+            return False
+        self.current_data = data
+        if self.changed_at is None:
+            self.changed_at = start
+        return True
+
+    def select_fields(self, fields):
+        """Change the exported fields; the board's data is rebuilt from the current frame."""
+        self.fields = list(fields)
+        self.active_fields = set(self.fields)
+        if self.feed is not None:
+            self.current_data = merge_fields(self.feed.dak, {}, self.fields, self.fields) or {}
+
+    def send(self, data, status):
+        stats = self.stats
+        for sink in self.sinks:
+            start = time.perf_counter_ns()
+            try:
+                sink.send(data)
+            except Exception as e:
+                stats.incr('export_errors')
+                status(f"[{self.name}] {e}")
+            stats.record('sink.' + sink.output_format, time.perf_counter_ns() - start)
+        stats.incr('exports')
+
+    def close(self):
+        if self.feed is not None:
+            self.feed.close()
+            self.feed = None
+        for sink in self.sinks:
+            sink.close()
+        if self.capture is not None:
+            self.capture.close()
+            self.capture = None
+
+
+class BoardManager(object):
+    """Reads many boards on one event loop thread and exports on one thread pool.
+
+    Exports are coalesced per board. While a board's sinks are busy, newer
+    changes only mark it pending, and the next export sends the latest data.
+    A slow sink therefore never queues up stale snapshots or holds up
+    another board.
+    """
+
+    def __init__(self, boards=(), max_workers=4, status=print, reconnect_delay=2.0,
+                 stats_path=None, stats_interval=10.0):
+        self.boards = list(boards)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="scoreboard-export")
+        self.status = status
+        self.reconnect_delay = reconnect_delay
+        self.stats_path = stats_path
+        self.stats_interval = stats_interval
+        self.loop = None
+        self.thread = None
+        self.stopping = None
+        self.started = threading.Event()
+        self.tasks = {}
+
+    def add_board(self, board):
+        self.boards.append(board)
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.start_board, board)
+
+    def start_board(self, board):
+        self.tasks[board.name] = self.loop.create_task(self.run_board(board))
+
+    async def run(self):
+        """Read every board until ``stop()`` is called."""
+        self.loop = asyncio.get_running_loop()
+        self.stopping = asyncio.Event()
+        for board in self.boards:
+            self.start_board(board)
+        if self.stats_path:
+            self.tasks['stats'] = self.loop.create_task(self.dump_stats_periodically())
+        self.started.set()
+        try:
+            await self.stopping.wait()
+        finally:
+            for task in self.tasks.values():
+                task.cancel()
+            await asyncio.gather(*self.tasks.values(), return_exceptions=True)
+            self.tasks = {}
+            self.loop = None
+            self.executor.shutdown(wait=True)
+            for board in self.boards:
+                board.close()
+            if self.stats_path:
+                self.dump_stats()
+
+    def start(self):
+        """Run the manager on a background thread."""
+        self.thread = threading.Thread(target=asyncio.run, args=(self.run(),), daemon=True)
+        self.thread.start()
+        self.started.wait()
+
+    def snapshot(self):
+        """Stats of every board, keyed by board name."""
+        return {board.name: board.stats.snapshot() for board in self.boards}
+
+    def dump_stats(self):
+        try:
+            write_snapshot(self.stats_path, self.snapshot())
+        except OSError as e:
+            self.status(f"Could not write stats: {e}")
+
+    async def dump_stats_periodically(self):
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            self.dump_stats()
+
+    def stop(self):
+        loop = self.loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self.stopping.set)
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    async def run_board(self, board):
+        interval = None
+        try:
+            while True:
+                try:
+                    board.feed = await board.open_feed()
+                except Exception as e:
+                    self.status(f"[{board.name}] Connection error: {e}")
+                    await asyncio.sleep(self.reconnect_delay)
+                    continue
+
+                self.status(f"[{board.name}] Listening for {board.sport} data on {board.describe_source()}")
+                if not board.update_on_change and interval is None:
+                    interval = self.loop.create_task(self.export_periodically(board))
+                try:
+                    async for changed in board.feed:
+                        if board.ingest(changed) and board.update_on_change:
+                            self.export(board)
+                except Exception as e:
+                    self.status(f"[{board.name}] Read error: {e}")
+                board.feed.close()
+                board.feed = None
+                await asyncio.sleep(self.reconnect_delay)
+        finally:
+            if interval is not None:
+                interval.cancel()
+
+    async def export_periodically(self, board):
+        while True:
+            await asyncio.sleep(board.auto_save_interval)
+            if board.current_data:
+                self.export(board)
+
+    def export(self, board):
+        """Send ``board.current_data`` to its sinks on the export pool."""
+        if board.exporting:
+            if board.export_pending:
+                # This snapshot is replaced before it was ever sent
+                board.stats.incr('exports_coalesced')
+            board.export_pending = True
+            return
+        board.exporting = True
+        changed_at, board.changed_at = board.changed_at, None
+        loop = self.loop
+        future = self.executor.submit(board.send, board.current_data, self.status)
+        future.add_done_callback(
+            lambda future: loop.call_soon_threadsafe(self.export_done, board, changed_at))
+
+    def export_done(self, board, changed_at):
+        if changed_at is not None:
+            # From the frame that changed the data to every sink having it
+            board.stats.record('change_to_export', time.perf_counter_ns() - changed_at)
+        board.exporting = False
+        if board.export_pending and self.loop is not None:
+            board.export_pending = False
+            self.export(board)
@@ -0,0 +1,165 @@
+"""Run Scoreboard Data Manager without a GUI.
+
+Reads the same scoreboard_settings.json as the desktop app. Command line
+flags override individual settings, so a press box machine needs no display
+and no Tk::
+
+    python scoreboard_headless.py --sport basketball --serial-port /dev/ttyUSB0 \\
+        --format "vMix XML" --save-path /srv/scoreboard/board.xml
+
+    python scoreboard_headless.py --connection-type "UDP Multicast" --format JSON \\
+        --save-path board.json --interval 0.5
+
+Several boards can run from one process by adding a "boards" list to the
+settings file. Each entry is a set of settings for one board, and the
+top-level settings are the defaults for every board::
+
+    {
+      "connection_type": "UDP Multicast",
+      "boards": [
+        {"name": "Court 1", "sport": "basketball", "udp_port": "21000",
+         "output_format": "JSON", "save_path": "court1.json"},
+        {"name": "Court 2", "sport": "volleyball", "udp_port": "21001",
+         "outputs": [{"output_format": "vMix XML", "save_path": "court2.xml"},
+                     {"output_format": "JSON (API)", "api_url": "http://graphics/court2"}]}
+      ]
+    }
+"""
+
+import argparse
+import json
+import signal
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from daktronics import dakSports, sport_fields
+from scoreboard_boards import Board, BoardManager
+
+SETTINGS_FILE = "scoreboard_settings.json"
+
+CONNECTION_TYPES = ["Serial", "UDP Multicast", "TCP (Device Server)", "Replay (Capture File)"]
+
+OUTPUT_FORMATS = ["JSON", "JSON (API)", "XML", "CSV", "Text Files", "vMix XML", "OBS WebSocket"]
+
+SINK_KEYS = ('output_format', 'save_path', 'api_url', 'obs_host', 'obs_port', 'obs_password', 'api_gzip')
+
+BOARD_KEYS = ('connection_type', 'serial_port', 'udp_port', 'udp_interface', 'tcp_host',
+              'tcp_port', 'verify_checksum', 'update_on_change', 'auto_save_interval',
+              'capture_path', 'replay_path', 'replay_speed')
+
+
+def board_from_settings(settings, name=None):
+    """Build a ``Board`` from a flat settings dict in the scoreboard_settings.json layout."""
+    sport = settings.get('sport', 'football')
+    fields = settings.get('fields') or settings.get('selected_fields_by_sport', {}).get(sport)
+    outputs = settings.get('outputs') or [{key: settings[key] for key in SINK_KEYS if key in settings}]
+    return Board(settings.get('name', name or sport), sport, fields=fields, outputs=outputs,
+                 **{key: settings[key] for key in BOARD_KEYS if key in settings})
+
+
+def boards_from_settings(settings):
+    defaults = {key: value for key, value in settings.items() if key != 'boards'}
+    entries = settings.get('boards') or [{}]
+    return [board_from_settings(dict(defaults, **entry), name=f"Board {i + 1}")
+            for i, entry in enumerate(entries)]
+
+
+def load_settings(path):
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def status(message):
+    print(f"{datetime.now().strftime('%H:%M:%S')} {message}", flush=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scoreboard Data Manager without the GUI")
+    parser.add_argument('--settings', default=SETTINGS_FILE,
+                        help=f"settings file to read (default: {SETTINGS_FILE})")
+    parser.add_argument('--sport', choices=sorted(dakSports))
+    parser.add_argument('--connection-type', choices=CONNECTION_TYPES)
+    parser.add_argument('--serial-port', help="serial device, e.g. COM3 or /dev/ttyUSB0")
+    parser.add_argument('--udp-port', help="All Sport CG multicast port (default: 21000)")
+    parser.add_argument('--udp-interface', help="local address to join the multicast group on")
+    parser.add_argument('--tcp-host', help="serial device server host")
+    parser.add_argument('--tcp-port', help="serial device server port (default: 4001)")
+    parser.add_argument('--replay', dest='replay_path',
+                        help="play a capture file instead of reading a scoreboard")
+    parser.add_argument('--speed', type=float, dest='replay_speed',
+                        help="replay speed: 1 is real time, 0 as fast as possible (default: 1)")
+    parser.add_argument('--verify-checksum', action='store_true', default=None,
+                        help="drop frames whose checksum does not match")
+    parser.add_argument('--format', dest='output_format', choices=OUTPUT_FORMATS)
+    parser.add_argument('--save-path', help="output file, or folder for Text Files")
+    parser.add_argument('--api-url', help="endpoint for JSON (API)")
+    parser.add_argument('--api-gzip', action='store_true', default=None,
+                        help="gzip JSON (API) request bodies (the server must accept Content-Encoding: gzip)")
+    parser.add_argument('--obs-host')
+    parser.add_argument('--obs-port')
+    parser.add_argument('--obs-password')
+    parser.add_argument('--interval', type=float, dest='auto_save_interval',
+                        help="export every N seconds instead of on every change")
+    parser.add_argument('--capture', dest='capture_path',
+                        help="record raw frames to this file (set capture_path per board when running several)")
+    parser.add_argument('--stats', dest='stats_path',
+                        help="write per-stage latency and counter stats to this JSON file")
+    parser.add_argument('--stats-interval', type=float, default=10.0,
+                        help="seconds between stats file updates (default: 10)")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="export threads shared by all boards (default: 4)")
+    parser.add_argument('--list-fields', action='store_true',
+                        help="print the field names for the sport and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        settings = load_settings(args.settings)
+    except (OSError, ValueError) as e:
+        print(f"Could not load settings: {str(e)}", file=sys.stderr)
+        return 1
+
+    overrides = {key: value for key, value in vars(args).items()
+                 if value is not None and key not in ('settings', 'workers', 'list_fields',
+                                                      'stats_path', 'stats_interval')}
+    if 'replay_path' in overrides:
+        overrides.setdefault('connection_type', "Replay (Capture File)")
+    if 'auto_save_interval' in overrides:
+        overrides['update_on_change'] = False
+    settings.update(overrides)
+
+    if args.list_fields:
+        print("\n".join(sport_fields(settings.get('sport', 'football'))))
+        return 0
+
+    try:
+        boards = boards_from_settings(settings)
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Invalid board settings: {str(e)}", file=sys.stderr)
+        return 1
+
+    manager = BoardManager(boards, max_workers=args.workers, status=status,
+                           stats_path=args.stats_path, stats_interval=args.stats_interval)
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *args: stop.set())
+    manager.start()
+    try:
+        # Wake up periodically so Ctrl-C is noticed on Windows too
+        while not stop.wait(1):
+            pass
+    except KeyboardInterrupt:
+        pass
+    status("Stopping")
+    manager.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,446 @@
+"""Output formats and sinks shared by the GUI and the multi-board manager.
+
+Nothing in here imports tkinter, so the same export code runs in the
+desktop app and in headless processes.
+"""
+
+import gzip
+import io
+import os
+import json
+import csv
+import re
+import threading
+import time
+from collections import namedtuple
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from datetime import datetime
+import requests
+from requests.adapters import HTTPAdapter
+
+# Import OBS WebSocket
+try:
+    import obsws_python as obs
+    OBS_AVAILABLE = True
+except ImportError:
+    OBS_AVAILABLE = False
+
+
+FILE_FORMATS = ["JSON", "XML", "CSV", "Text Files", "vMix XML"]
+
+
+class OutputError(Exception):
+    """An export could not be made (missing setting, connection failure, ...)."""
+
+
+def safe_field_name(key):
+    """Name used for a field as an OBS source or text file; see FIELD_NAMES."""
+    return key.replace(' ', '_').replace('[', '').replace(']', '').replace('/', '_')
+
+
+# Characters XML 1.0 does not allow at all, and characters not allowed in element names
+_XML_INVALID = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+_XML_NAME_INVALID = re.compile(r'[^\w.-]')
+
+
+def vmix_field_name(key):
+    """Element name used for a field in vMix XML.
+
+    ``safe_field_name`` with anything an XML element name cannot contain
+    ('#', '(', ':', ...) also replaced by '_', and a leading '_' if the name
+    would start with a digit, '-' or '.'.
+    """
+    name = _XML_NAME_INVALID.sub('_', safe_field_name(key))
+    if not name or not (name[0].isalpha() or name[0] == '_'):
+        name = '_' + name
+    return name
+
+
+def xml_escape(text):
+    """Escape ``text`` for element content or a double-quoted attribute."""
+    if not text.isprintable():
+        # Line ends as an XML parser reads them; control characters dropped
+        text = _XML_INVALID.sub('', text.replace('\r\n', '\n').replace('\r', '\n'))
+    if '&' in text or '<' in text or '>' in text or '"' in text:
+        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;').replace('>', '&gt;')
+    return text
+
+
+# What a field is called in each output. The tags are (opening, closing, empty).
+FieldNames = namedtuple('FieldNames', 'obs vmix filename xml_tags vmix_tags')
+
+
+def field_names(key):
+    """Work out the FieldNames of ``key``."""
+    safe = safe_field_name(key)
+    vmix = vmix_field_name(key)
+    start = f'  <Field name="{xml_escape(key)}"'
+    return FieldNames(
+        obs=safe,
+        vmix=vmix,
+        filename=f"{safe}.txt",
+        xml_tags=(f'{start}>', '</Field>\n', f'{start}/>\n'),
+        vmix_tags=(f'  <{vmix}>', f'</{vmix}>\n', f'  <{vmix}/>\n'),
+    )
+
+
+class OutputNames(dict):
+    """FieldNames of every field, keyed by field name.
+
+    One table is shared by every sink and the previews, so a field has the
+    same name everywhere and the names are worked out once rather than on
+    every update. Boards call ``precompute()`` with their sport's fields;
+    any other key is added the first time it is looked up.
+    """
+
+    def __missing__(self, key):
+        names = self[key] = field_names(key)
+        return names
+
+    def precompute(self, fields):
+        for key in fields:
+            if key not in self:
+                self[key] = field_names(key)
+
+
+FIELD_NAMES = OutputNames()
+
+
+def _format_xml(head, empty, tail, field_tags, data):
+    """Lay out XML the way minidom's toprettyxml(indent="  ") does."""
+    if not data:
+        return empty
+    parts = [head]
+    append = parts.append
+    names = FIELD_NAMES
+    for key, value in data.items():
+        start, end, empty_tag = field_tags(names[key])
+        text = xml_escape(str(value))
+        append(f'{start}{text}{end}' if text else empty_tag)
+    append(tail)
+    return ''.join(parts)
+
+
+def format_as_json(data):
+    return json.dumps(data, indent=2)
+
+
+def format_as_xml(data):
+    timestamp = xml_escape(datetime.now().isoformat())
+    return _format_xml(f'<?xml version="1.0" ?>\n<ScoreboardData timestamp="{timestamp}">\n',
+                       f'<?xml version="1.0" ?>\n<ScoreboardData timestamp="{timestamp}"/>\n',
+                       '</ScoreboardData>\n', attrgetter('xml_tags'), data)
+
+
+def format_as_vmix_xml(data):
+    """Format for vMix DataSource"""
+    return _format_xml('<?xml version="1.0" ?>\n<vmix>\n', '<?xml version="1.0" ?>\n<vmix/>\n',
+                       '</vmix>\n', attrgetter('vmix_tags'), data)
+
+
+def format_as_csv(data):
+    output = io.StringIO(newline='')
+    writer = csv.writer(output)
+    writer.writerow(['Field', 'Value'])
+    for key, value in data.items():
+        writer.writerow([key, value])
+    return output.getvalue()
+
+
+def has_data_changed(previous_data, current_data):
+    """Check if any field value has changed from previous data"""
+    # If no previous data, consider it changed
+    if not previous_data:
+        return True
+    return previous_data != current_data
+
+
+def atomic_write(path, content, newline=None, retries=5):
+    """Replace the file at ``path`` with ``content`` in one step.
+
+    The content goes to a temporary file next to ``path``, which is then
+    renamed over it, so vMix, OBS and other readers see either the old file
+    or the new one and never a half-written one. Windows refuses the rename
+    while a reader has the file open, so it is retried briefly.
+    """
+    temp = f"{path}.tmp"
+    with open(temp, 'w', newline=newline) as f:
+        f.write(content)
+    for attempt in range(retries):
+        try:
+            os.replace(temp, path)
+            return
+        except PermissionError:
+            if attempt == retries - 1:
+                os.remove(temp)
+                raise
+            time.sleep(0.01)
+
+
+class TextFilesWriter(object):
+    """The Text Files output, rewriting only the fields that changed.
+
+    Remembers the text last written to each file and skips fields whose
+    value is the same, so a board of 200 fields where only the clock runs
+    costs one file write per update instead of 200. Everything is written
+    again when the folder changes or a write fails.
+    """
+
+    def __init__(self):
+        self.save_dir = None
+        self.paths = {}
+        self.written = {}
+
+    def reset(self):
+        self.save_dir = None
+        self.paths = {}
+        self.written = {}
+
+    def write(self, save_path, data):
+        """Write each changed field of ``data`` to ``<save_path>/<field>.txt``."""
+        save_dir = os.fspath(save_path)
+        if save_dir != self.save_dir:
+            self.reset()
+            Path(save_dir).mkdir(exist_ok=True)
+            self.save_dir = save_dir
+        paths = self.paths
+        written = self.written
+        try:
+            for key, value in data.items():
+                text = str(value)
+                if written.get(key) == text:
+                    continue
+                path = paths.get(key)
+                if path is None:
+                    path = paths[key] = os.path.join(save_dir, FIELD_NAMES[key].filename)
+                atomic_write(path, text)
+                written[key] = text
+        except OSError:
+            # The folder may be gone or the files edited; start over next time
+            self.reset()
+            raise
+
+
+def write_output(format_type, save_path, data, text_files=None):
+    """Write ``data`` to ``save_path`` in one of the FILE_FORMATS.
+
+    Pass the same ``text_files`` writer on every call to only rewrite the
+    Text Files that changed; without one every field is written.
+    """
+    if format_type == "JSON":
+        atomic_write(save_path, format_as_json(data))
+
+    elif format_type == "XML":
+        atomic_write(save_path, format_as_xml(data))
+
+    elif format_type == "vMix XML":
+        atomic_write(save_path, format_as_vmix_xml(data))
+
+    elif format_type == "CSV":
+        atomic_write(save_path, format_as_csv(data), newline='')
+
+    elif format_type == "Text Files":
+        (text_files or TextFilesWriter()).write(save_path, data)
+
+    else:
+        raise OutputError(f"Unknown output format: {format_type}")
+
+
+class FileWriter(object):
+    """Writes file outputs off the caller's thread, newest snapshot first.
+
+    ``submit()`` returns at once. Formatting and writing happen on
+    ``executor`` (a private one-thread pool if none is given), one write at
+    a time. A snapshot submitted while a write is in progress waits; if an
+    even newer one arrives before it is written, the older one is dropped
+    and counted in ``dropped``, so a slow disk delays the file instead of
+    the ingest loop and never builds a backlog. After each write
+    ``done(format_type, error, elapsed_ns)`` is called on the writer thread,
+    with ``error`` None on success. Dropped snapshots are also counted as
+    'exports_coalesced' in ``stats`` (a daktronics.stats.Stats) if given.
+    """
+
+    def __init__(self, executor=None, done=None, stats=None):
+        self.own_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="file-writer")
+        self.done = done
+        self.stats = stats
+        self.lock = threading.Lock()
+        self.busy = False
+        self.pending = None
+        self.dropped = 0
+        self.closed = False
+        self.text_files = TextFilesWriter()
+
+    def submit(self, format_type, save_path, data):
+        """Queue ``data`` for writing. It must not be modified afterwards."""
+        job = (format_type, save_path, data)
+        with self.lock:
+            if self.closed:
+                return
+            if self.busy:
+                if self.pending is not None:
+                    self.dropped += 1
+                    if self.stats is not None:
+                        self.stats.incr('exports_coalesced')
+                self.pending = job
+                return
+            self.busy = True
+        self.executor.submit(self.run, job)
+
+    def run(self, job):
+        while job is not None:
+            started = time.perf_counter_ns()
+            try:
+                write_output(*job, text_files=self.text_files)
+                error = None
+            except Exception as e:
+                error = e
+            if self.done:
+                self.done(job[0], error, time.perf_counter_ns() - started)
+            with self.lock:
+                job, self.pending = self.pending, None
+                if job is None:
+                    self.busy = False
+
+    def close(self, wait=True):
+        """Stop taking snapshots; the write in progress and the one waiting still finish.
+
+        With ``wait`` False this returns at once and the writes finish on
+        the writer thread, which the interpreter joins before it exits.
+        """
+        with self.lock:
+            self.closed = True
+        if self.own_executor:
+            self.executor.shutdown(wait=wait)
+
+
+def make_session(pool_size=4):
+    """Return a requests Session that keeps connections open between uploads.
+
+    Each upload reuses an idle keep-alive connection from the pool instead
+    of setting up a new TCP (and TLS) connection, which at several updates
+    a second is most of the request time and ties up the server's ports.
+    A connection the server has closed in the meantime is retried once on a
+    new one.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def upload_json(api_url, data, timeout=5, session=None, compress=False):
+    """PUT ``data`` as JSON to ``api_url`` and return the response.
+
+    Pass a ``make_session()`` session to reuse connections. With
+    ``compress`` the body is gzipped and sent with ``Content-Encoding: gzip``,
+    which the server has to accept.
+    """
+    body = json.dumps(data).encode('utf-8')
+    headers = {'Content-Type': 'application/json'}
+    if compress:
+        body = gzip.compress(body, compresslevel=6)
+        headers['Content-Encoding'] = 'gzip'
+    return (session or requests).put(api_url, data=body, headers=headers, timeout=timeout)
+
+
+def connect_obs(host, port, password=None):
+    """Return a connected OBS WebSocket request client."""
+    if not OBS_AVAILABLE:
+        raise OutputError("OBS WebSocket library not installed")
+    return obs.ReqClient(host=host, port=int(port), password=password or None)
+
+
+def send_to_obs(client, data):
+    """Set the text of the OBS source named after each field."""
+    names = FIELD_NAMES
+    for field_name, field_value in data.items():
+        try:
+            client.set_input_settings(
+                names[field_name].obs,
+                {"text": str(field_value)},
+                overlay=True
+            )
+        except Exception:
+            # Source might not exist, continue with others
+            pass
+
+
+class OutputSink(object):
+    """One export target: a file format, the JSON API or OBS.
+
+    Configured with the same keys the GUI stores in scoreboard_settings.json.
+    ``send()`` blocks, so callers run it off their ingest thread.
+    """
+
+    def __init__(self, output_format="JSON", save_path="", api_url="",
+                 obs_host="localhost", obs_port="4455", obs_password="", api_gzip=False):
+        self.output_format = output_format
+        self.save_path = save_path
+        self.api_url = api_url
+        self.api_gzip = api_gzip
+        self.session = None
+        self.obs_host = obs_host
+        self.obs_port = obs_port
+        self.obs_password = obs_password
+        self.obs_client = None
+        self.text_files = TextFilesWriter()
+
+    @classmethod
+    def from_settings(cls, settings):
+        keys = ('output_format', 'save_path', 'api_url', 'obs_host', 'obs_port', 'obs_password',
+                'api_gzip')
+        return cls(**{key: settings[key] for key in keys if key in settings})
+
+    def send(self, data):
+        """Export ``data`` and return a status message, raising OutputError on failure."""
+        if self.output_format == "JSON (API)":
+            if not self.api_url:
+                raise OutputError("Please enter an API URL")
+            if self.session is None:
+                self.session = make_session()
+            try:
+                response = upload_json(self.api_url, data, session=self.session, compress=self.api_gzip)
+            except requests.exceptions.Timeout:
+                raise OutputError("API upload timeout")
+            except requests.exceptions.RequestException as e:
+                raise OutputError(f"API upload error: {str(e)}")
+            if response.status_code not in [200, 201, 204]:
+                raise OutputError(f"API error: {response.status_code} - {response.text[:50]}")
+            return f"API upload successful at {datetime.now().strftime('%H:%M:%S')}"
+
+        if self.output_format == "OBS WebSocket":
+            if not self.obs_client:
+                try:
+                    self.obs_client = connect_obs(self.obs_host, self.obs_port, self.obs_password)
+                except OutputError:
+                    raise
+                except Exception as e:
+                    raise OutputError(f"OBS connection error: {str(e)}")
+            send_to_obs(self.obs_client, data)
+            return f"Data sent to OBS at {datetime.now().strftime('%H:%M:%S')}"
+
+        if not self.save_path:
+            raise OutputError("Please select a save location")
+        try:
+            write_output(self.output_format, self.save_path, data, self.text_files)
+        except OutputError:
+            raise
+        except Exception as e:
+            raise OutputError(f"Save error: {str(e)}")
+        return f"Data saved successfully at {datetime.now().strftime('%H:%M:%S')}"
+
+    def close(self):
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+        if self.obs_client:
+            try:
+                self.obs_client.disconnect()
+            except Exception:
+                pass
+            self.obs_client = None
@@ -0,0 +1,148 @@
+"""Tests for applying RTD frames to the board and rejecting bad ones."""
+
+import unittest
+
+from daktronics import (DAK_ENCODING, EOT, ETB, SOH, SPORT_LAYOUTS, STX, SYN, Daktronics, dak_checksum,
+                        dak_frame, sport_fields)
+from daktronics.stats import Stats
+from daktronics.synth import DakSynth
+
+
+def header_only_frame(item=b'004210'):
+    body = SOH + item + EOT
+    return SYN + body + dak_checksum(body) + ETB
+
+
+def with_checksum(frame, checksum):
+    return frame[:-3] + checksum + ETB
+
+
+class SpliceBoard(object):
+    """The board as it was kept before: a str, spliced on every frame."""
+
+    def __init__(self, size):
+        self.dakString = " " * size
+
+    def update(self, rtd):
+        code = rtd.partition(b'\x01')[2].partition(b'\x02')[0].partition(b'\x04')[0]
+        text = rtd.partition(b'\x02')[2].partition(b'\x04')[0]
+        code = code.decode()[-4:]
+        text = text.decode(DAK_ENCODING)
+        self.dakString = self.dakString[:int(code)] + text + self.dakString[int(code) + len(text):]
+
+
+class DakChecksumTest(unittest.TestCase):
+
+    def test_sum_of_soh_through_eot_as_upper_case_hex(self):
+        body = SOH + b'0042100000' + STX + b'AB' + EOT
+        self.assertEqual(dak_checksum(body), b'%02X' % (sum(body) % 256))
+        self.assertEqual(dak_checksum(b'\xff\x01'), b'00')
+        self.assertEqual(dak_checksum(b'\x0b'), b'0B')
+
+    def test_dak_frame_round_trips(self):
+        dak = Daktronics('basketball', None, verify_checksum=True)
+        self.assertTrue(dak.apply(dak_frame(5, b'HOME')))
+        self.assertEqual(dak.board[5:9], b'HOME')
+        self.assertEqual(dak.code, b'0042100005')
+        self.assertEqual(dak.text, b'HOME')
+
+
+class ApplyRejectTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dak = Daktronics('basketball', None, verify_checksum=True)
+        self.dak.stats = Stats()
+        self.blank = bytes(self.dak.board)
+
+    def assertRejected(self, frame, reason):
+        self.assertFalse(self.dak.apply(frame))
+        self.assertEqual(self.dak.rejected, {reason: 1})
+        self.assertEqual(self.dak.stats.counters['rejected.' + reason], 1)
+        self.assertEqual(bytes(self.dak.board), self.blank)
+        self.assertEqual(self.dak.changed_fields(), set())
+
+    def test_missing_soh(self):
+        self.assertRejected(dak_frame(0, b'12').replace(SOH, b''), 'framing')
+
+    def test_missing_eot(self):
+        self.assertRejected(dak_frame(0, b'12').replace(EOT, b''), 'framing')
+
+    def test_missing_etb(self):
+        self.assertRejected(dak_frame(0, b'12')[:-1], 'framing')
+
+    def test_code_too_short(self):
+        body = SOH + b'12' + STX + b'AB' + EOT
+        self.assertRejected(SYN + body + dak_checksum(body) + ETB, 'framing')
+
+    def test_code_not_numeric(self):
+        body = SOH + b'00421000x0' + STX + b'AB' + EOT
+        self.assertRejected(SYN + body + dak_checksum(body) + ETB, 'framing')
+
+    def test_past_the_end_of_the_board(self):
+        size = len(self.dak.board)
+        self.assertRejected(dak_frame(size - 1, b'12'), 'bounds')
+        self.assertTrue(self.dak.apply(dak_frame(size - 2, b'12')))
+
+    def test_bad_checksum(self):
+        self.assertRejected(with_checksum(dak_frame(0, b'12'), b'00'), 'checksum')
+
+    def test_bad_checksum_on_header_only_frame(self):
+        self.assertRejected(with_checksum(header_only_frame(), b'00'), 'checksum')
+
+    def test_checksum_not_checked_unless_asked(self):
+        dak = Daktronics('basketball', None)
+        self.assertTrue(dak.apply(with_checksum(dak_frame(0, b'12'), b'00')))
+        self.assertEqual(dak.rejected, {})
+
+    def test_upper_and_lower_case_checksums(self):
+        frame = dak_frame(0, b'\xfa\xfb')
+        checksum = frame[-3:-1]
+        self.assertTrue(checksum.isupper())
+        self.assertTrue(self.dak.apply(frame))
+        self.assertTrue(self.dak.apply(with_checksum(frame, checksum.lower())))
+        self.assertEqual(self.dak.rejected, {})
+
+    def test_header_only_frame_changes_nothing(self):
+        self.assertFalse(self.dak.apply(header_only_frame()))
+        self.assertEqual(self.dak.rejected, {})
+        self.assertEqual(bytes(self.dak.board), self.blank)
+        self.assertEqual(self.dak.text, b'')
+        self.assertEqual(self.dak.code, b'004210')
+
+    def test_frames_without_syn(self):
+        # Framers hand over frames with the leading SYN already stripped
+        self.assertTrue(self.dak.apply(dak_frame(0, b'12')[1:]))
+        self.assertEqual(self.dak.board[:2], b'12')
+
+    def test_rejections_add_up(self):
+        frames = [dak_frame(0, b'12'), dak_frame(0, b'12')[:-1], with_checksum(dak_frame(0, b'34'), b'00'),
+                  dak_frame(len(self.dak.board), b'5'), dak_frame(2, b'67')]
+        self.dak.apply_all(frames)
+        self.assertEqual(self.dak.rejected, {'framing': 1, 'checksum': 1, 'bounds': 1})
+        counters = self.dak.stats.counters
+        self.assertEqual(counters['frames'], len(frames))
+        self.assertEqual(counters['bytes'], sum(len(frame) for frame in frames))
+        self.assertEqual(sum(counters[key] for key in counters if key.startswith('rejected.')), 3)
+        self.assertEqual(self.dak.board[:4], b'1267')
+
+
+class SpliceEquivalenceTest(unittest.TestCase):
+
+    def test_board_matches_the_string_splice_for_every_sport(self):
+        for sport in SPORT_LAYOUTS:
+            if not sport_fields(sport):
+                continue
+            with self.subTest(sport=sport):
+                synth = DakSynth(sport, seed=3, churn=0.8, refresh=5.0)
+                dak = Daktronics(sport, None, verify_checksum=True)
+                old = SpliceBoard(len(dak.board))
+                for _, frame in synth.frames(count=2000):
+                    self.assertTrue(dak.apply(frame))
+                    old.update(frame)
+                self.assertEqual(dak.dakString, old.dakString)
+                for name in dak.slices:
+                    self.assertEqual(dak[name], old.dakString[dak.slices[name]])
+
+
+if __name__ == "__main__":
+    unittest.main()
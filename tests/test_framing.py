@@ -0,0 +1,101 @@
+"""Regression tests for RTD framing under bulk reads.
+
+Run from the repository root with ``python -m unittest discover tests``.
+"""
+
+import socket
+import threading
+import time
+import unittest
+
+from daktronics import DakFramer, DakTCP, Daktronics, dak_frame
+from daktronics.aio import DakStreamProtocol
+from daktronics.stats import Stats
+
+
+def numbered_frames(count):
+    return [dak_frame(i % 100, f"{i:08d}".encode()) for i in range(count)]
+
+
+class _Collector(object):
+    """Stands in for a DakFeed and keeps every frame it is given."""
+
+    def __init__(self):
+        self.dak = Daktronics('basketball', None)
+        self.frames = []
+
+    def feed_frame(self, frame):
+        self.frames.append(frame)
+
+
+class DakFramerTest(unittest.TestCase):
+
+    def test_keeps_every_frame_fed_at_once(self):
+        frames = numbered_frames(5000)
+        framer = DakFramer(max_size=4096)
+        framer.feed(b''.join(frames))
+        self.assertEqual([b'\x16' + frame for frame in framer.frames()], frames)
+
+    def test_drops_only_an_overlong_partial_frame(self):
+        framer = DakFramer(max_size=64)
+        framer.stats = Stats()
+        framer.feed(b'\x16' + b'x' * 100)
+        self.assertIsNone(framer.next_frame())
+        self.assertEqual(framer.buffer, b'')
+        self.assertEqual(framer.stats.counters['framer_overflow'], 1)
+        frame = dak_frame(0, b'12')
+        framer.feed(frame)
+        self.assertEqual(b'\x16' + framer.next_frame(), frame)
+
+
+class DakStreamProtocolTest(unittest.TestCase):
+
+    def test_large_chunk_delivers_every_frame(self):
+        frames = numbered_frames(5000)
+        collector = _Collector()
+        protocol = DakStreamProtocol(collector)
+        data = b''.join(frames)
+        self.assertGreater(len(data), protocol.framer.max_size)
+        protocol.data_received(data)
+        self.assertEqual(len(collector.frames), len(frames))
+        self.assertEqual(b'\x16' + collector.frames[-1], frames[-1])
+
+    def test_overflow_is_counted_in_the_feed_stats(self):
+        collector = _Collector()
+        collector.dak.stats = Stats()
+        protocol = DakStreamProtocol(collector)
+        protocol.data_received(b'\x16' + b'x' * (protocol.framer.max_size + 1))
+        self.assertEqual(collector.dak.stats.counters['framer_overflow'], 1)
+
+
+class DakTCPTest(unittest.TestCase):
+
+    def test_stalled_consumer_loses_no_frames(self):
+        frames = numbered_frames(20000)
+        server = socket.create_server(('127.0.0.1', 0))
+        self.addCleanup(server.close)
+
+        def send():
+            conn, _ = server.accept()
+            with conn:
+                conn.sendall(b''.join(frames))
+
+        sender = threading.Thread(target=send, daemon=True)
+        sender.start()
+        dak = DakTCP('127.0.0.1', server.getsockname()[1], max_buffer=4096)
+        self.addCleanup(dak.close)
+        stats = Daktronics('basketball', dak).stats = Stats()
+        received = dak.read_all(wait=True)
+        # Let the kernel buffers fill up behind a consumer that is not reading
+        time.sleep(0.3)
+        deadline = time.monotonic() + 10
+        while len(received) < len(frames) and time.monotonic() < deadline:
+            received += dak.read_all(wait=True)
+        self.assertEqual(len(received), len(frames))
+        self.assertEqual(b'\x16' + received[-1], frames[-1])
+        self.assertIs(dak.framer.stats, stats)
+        self.assertEqual(stats.counters['framer_overflow'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
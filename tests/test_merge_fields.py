@@ -0,0 +1,39 @@
+"""Tests for merging changed fields into a board's data."""
+
+import unittest
+
+from daktronics import Daktronics, sport_fields
+from daktronics.synth import DakSynth
+from scoreboard_boards import merge_fields
+
+
+class MergeFieldsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.synth = DakSynth('basketball', seed=1)
+        self.dak = Daktronics('basketball', None)
+        self.order = list(sport_fields('basketball'))
+
+    def apply(self, name, value):
+        self.dak.apply(self.synth.set(name, value))
+        return self.dak.changed_fields()
+
+    def test_new_keys_follow_the_selection_order(self):
+        for frame in self.synth.refresh_frames():
+            self.dak.apply(frame)
+        self.dak.changed_fields()
+        data = merge_fields(self.dak, {}, self.order, self.order)
+        # Fill in fields from the back of the layout forwards
+        for name in reversed(self.order[:40]):
+            if name not in data:
+                changed = self.apply(name, '7')
+                data = merge_fields(self.dak, data, changed & set(self.order), self.order) or data
+        self.assertEqual(list(data), [name for name in self.order if name in data])
+
+    def test_unchanged_returns_none(self):
+        data = merge_fields(self.dak, {}, self.order, self.order) or {}
+        self.assertIsNone(merge_fields(self.dak, data, set(self.order), self.order))
+
+
+if __name__ == "__main__":
+    unittest.main()
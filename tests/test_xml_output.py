@@ -0,0 +1,97 @@
+"""Check the XML exports against the ElementTree + minidom output they replaced."""
+
+import re
+import unittest
+import xml.etree.ElementTree as ET
+from xml.dom import minidom
+
+from daktronics import SPORT_LAYOUTS, sport_fields
+from scoreboard_outputs import format_as_vmix_xml, format_as_xml, vmix_field_name
+
+_TIMESTAMP = re.compile(r'timestamp="[^"]*"')
+_CONTROL = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def reference_xml(data):
+    """format_as_xml as it was built before: ElementTree, then minidom."""
+    root = ET.Element("ScoreboardData")
+    root.set("timestamp", "")
+    for key, value in data.items():
+        field = ET.SubElement(root, "Field")
+        field.set("name", key)
+        field.text = str(value)
+    return minidom.parseString(ET.tostring(root, encoding='unicode')).toprettyxml(indent="  ")
+
+
+def reference_vmix_xml(data):
+    """format_as_vmix_xml as it was built before: ElementTree, then minidom.
+
+    The tags come from vmix_field_name; the old safe_field_name tags were
+    not valid XML for names such as 'Main Clock Time [mm:ss/ss.t ]'.
+    """
+    root = ET.Element("vmix")
+    for key, value in data.items():
+        field = ET.SubElement(root, vmix_field_name(key))
+        field.text = str(value)
+    return minidom.parseString(ET.tostring(root, encoding='unicode')).toprettyxml(indent="  ")
+
+
+def without_timestamp(xml):
+    return _TIMESTAMP.sub('timestamp=""', xml)
+
+
+class XmlOutputTest(unittest.TestCase):
+
+    def assertMatchesReference(self, data, expected=None):
+        expected = data if expected is None else expected
+        self.assertEqual(without_timestamp(format_as_xml(data)), reference_xml(expected))
+        self.assertEqual(format_as_vmix_xml(data), reference_vmix_xml(expected))
+
+    def test_ordinary_values(self):
+        self.assertMatchesReference({'Home Team Score': '42', 'Guest Team Score': 7,
+                                     'Main Clock Time [mm:ss/ss.t ]': '12:00', 'Period Text': 'OT'})
+
+    def test_empty_values_and_board(self):
+        self.assertMatchesReference({'Home Team Name': '', 'Guest Team Name': 'Visitors'})
+        self.assertMatchesReference({})
+
+    def test_markup_characters(self):
+        self.assertMatchesReference({'Home Team Name': 'A&M <"Aggies"> \'92'})
+
+    def test_markup_characters_in_field_names(self):
+        data = {'Home & "Guest" <Score>': '1'}
+        self.assertEqual(without_timestamp(format_as_xml(data)), reference_xml(data))
+
+    def test_whitespace(self):
+        self.assertMatchesReference({'Home Team Name': 'Tab\there', 'Guest Team Name': 'CR\rLF\nCRLF\r\nend'})
+
+    def test_control_characters_are_dropped(self):
+        # The old code raised on these (minidom cannot parse them); they are now left out
+        data = {'Home Team Name': 'Lions\x00\x07\x1b', 'Guest Team Name': '\x0bTigers\x0c'}
+        self.assertMatchesReference(data, {key: _CONTROL.sub('', value) for key, value in data.items()})
+
+    def test_output_parses(self):
+        data = {'Home Team Name': 'A&M\x01 <"Aggies">\r\n', 'Guest Team Score': '3'}
+        root = ET.fromstring(format_as_xml(data))
+        self.assertEqual([field.get('name') for field in root], list(data))
+        self.assertEqual(root[0].text, 'A&M <"Aggies">\n')
+
+
+class VmixFieldNameTest(unittest.TestCase):
+
+    def test_names_are_valid_and_unique_for_every_sport(self):
+        for sport in SPORT_LAYOUTS:
+            fields = sport_fields(sport)
+            names = [vmix_field_name(key) for key in fields]
+            with self.subTest(sport=sport):
+                self.assertEqual(len(set(names)), len(names))
+                for name in names:
+                    # Raises if the name is not a valid element name
+                    self.assertEqual(ET.fromstring(f'<{name}/>').tag, name)
+                if fields:
+                    data = dict.fromkeys(fields, '1')
+                    self.assertEqual(format_as_vmix_xml(data), reference_vmix_xml(data))
+
+
+if __name__ == "__main__":
+    unittest.main()